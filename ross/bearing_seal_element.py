@@ -645,6 +645,82 @@ class BearingElement(Element):
 
         return G
 
+    def _coefficients_layout(self, coefficient):
+        """Names of the coefficients in each position of the element matrices.
+
+        Parameters
+        ----------
+        coefficient : str
+            First letter of the coefficients: "k", "c" or "m".
+
+        Returns
+        -------
+        layout : list
+            Nested list with the name of the coefficient in each matrix
+            position, or None where the matrix entry is zero.
+        """
+        c = coefficient
+        return [[f"{c}xx", f"{c}xy"], [f"{c}yx", f"{c}yy"]]
+
+    @check_units
+    def coefficients_at(self, frequency):
+        """Stiffness, damping and mass matrices for an array of frequencies.
+
+        Each coefficient is interpolated only once for the whole array of
+        frequencies, which is much faster than calling K(), C() and M() for
+        each value in a frequency sweep.
+
+        Parameters
+        ----------
+        frequency : array, pint.Quantity
+            Array with the excitation frequencies (rad/s).
+
+        Returns
+        -------
+        K : np.ndarray
+            Stiffness matrices with shape (len(frequency), n, n), where n is the
+            size of the matrix returned by K() (N/m).
+        C : np.ndarray
+            Damping matrices with shape (len(frequency), n, n) (N*s/m).
+        M : np.ndarray
+            Mass matrices with shape (len(frequency), n, n) (kg).
+
+        Examples
+        --------
+        >>> bearing = bearing_example()
+        >>> K, C, M = bearing.coefficients_at([0, 100, 200])
+        >>> K.shape
+        (3, 2, 2)
+        >>> K[1]
+        array([[1000000.,       0.],
+               [      0.,  800000.]])
+        """
+        frequency = np.atleast_1d(np.asarray(frequency, dtype=np.float64))
+
+        matrices = []
+        for coefficient in ["k", "c", "m"]:
+            layout = self._coefficients_layout(coefficient)
+            size = len(layout)
+            matrix = np.zeros((len(frequency), size, size))
+            for i, row in enumerate(layout):
+                for j, name in enumerate(row):
+                    if name is not None:
+                        matrix[:, i, j] = getattr(self, f"{name}_interpolated")(
+                            frequency
+                        )
+
+            if self.n_link is not None:
+                # fmt: off
+                matrix = np.concatenate(
+                    [np.concatenate([matrix, -matrix], axis=2),
+                     np.concatenate([-matrix, matrix], axis=2)], axis=1
+                )
+                # fmt: on
+
+            matrices.append(matrix)
+
+        return tuple(matrices)
+
     def _patch(self, position, fig):
         """Bearing element patch.
 
@@ -2120,6 +2196,27 @@ class BearingElement6DoF(BearingElement):
 
         return C
 
+    def _coefficients_layout(self, coefficient):
+        """Names of the coefficients in each position of the element matrices.
+
+        Parameters
+        ----------
+        coefficient : str
+            First letter of the coefficients: "k", "c" or "m".
+
+        Returns
+        -------
+        layout : list
+            Nested list with the name of the coefficient in each matrix
+            position, or None where the matrix entry is zero.
+        """
+        c = coefficient
+        # fmt: off
+        return [[f"{c}xx", f"{c}xy", None],
+                [f"{c}yx", f"{c}yy", None],
+                [None, None, f"{c}zz"]]
+        # fmt: on
+
 
 def bearing_example():
     """Create an example of bearing element.
@@ -1,4 +1,5 @@
 from .crack import *
+from .harmonic_balance import *
 from .integrate_solver import *
 from .misalignment import *
 from .rubbing import *
@@ -6,7 +6,10 @@ import scipy as sp
 from warnings import warn
 
 from ross.results import TimeResponseResults
-from ross.units import Q_
+from ross.units import Q_, check_units
+
+from .harmonic_balance import HarmonicBalance, HarmonicBalanceResults
+from .integrate_solver import Integrator
 
 __all__ = ["Fault"]
 
@@ -28,6 +31,152 @@ class Fault(ABC):
         )
         return results
 
+    @abstractmethod
+    def _initialize(self, rotor):
+        """Set the rotor dependent parameters of the fault."""
+
+    def _integrate(self, method):
+        """Integrate the modal equation of movement in time.
+
+        Parameters
+        ----------
+        method : str
+            Fixed step method of the Integrator, used when the fault is not set
+            as adaptive.
+
+        Returns
+        -------
+        x : np.ndarray
+            Modal displacements and velocities, with shape
+            (2 * num_modes, len(time_vector)).
+        """
+        integrator = Integrator(
+            self.tI,
+            np.zeros(2 * self.num_modes),
+            self.tF,
+            self.dt,
+            self._equation_of_movement,
+            self.print_progress,
+        )
+
+        if self.adaptive:
+            options = self.adaptive if isinstance(self.adaptive, dict) else {}
+            # the faults forces are tabulated on the time grid
+            return integrator.rkck(**{"interpolate": True, **options})
+
+        return getattr(integrator, method)()
+
+    @abstractmethod
+    def _fault_force(self, angle, disp, velc, speed):
+        """Fault force for a given state of the rotor.
+
+        Parameters
+        ----------
+        angle : float
+            Angular position of the shaft (rad).
+        disp : np.ndarray
+            Displacement for each degree of freedom of the rotor.
+        velc : np.ndarray
+            Velocity for each degree of freedom of the rotor.
+        speed : float
+            Rotor speed (rad/s).
+
+        Returns
+        -------
+        force : np.ndarray
+            Force for each degree of freedom of the rotor.
+        """
+
+    def _unbalance_force(self, angle, speed):
+        """Unbalance forces at constant speed.
+
+        Parameters
+        ----------
+        angle : np.ndarray
+            Angular positions of the shaft (rad).
+        speed : float
+            Rotor speed (rad/s).
+
+        Returns
+        -------
+        force : np.ndarray
+            Forces with shape (ndof, len(angle)).
+        """
+        force = np.zeros((self.ndof, len(angle)))
+
+        for ii in range(self.n_disk):
+            teta = angle + self.unbalance_phase[ii] + np.pi / 2
+            force[int(self.ndofd[ii])] -= (
+                self.unbalance_magnitude[ii] * speed**2 * np.sin(teta)
+            )
+            force[int(self.ndofd[ii] + 1)] -= (
+                self.unbalance_magnitude[ii] * speed**2 * np.cos(teta)
+            )
+
+        return force
+
+    @check_units
+    def run_harmonic_balance(
+        self,
+        rotor,
+        speed_range=None,
+        harmonics=5,
+        num_modes=12,
+        num_samples=64,
+        subharmonic=1,
+        num_points=20,
+        tol=1e-6,
+    ):
+        """Periodic steady state response with the harmonic balance method.
+
+        The response is expanded in harmonics of speed / subharmonic and the fault
+        forces are evaluated with the alternating frequency-time scheme, so that
+        the steady state is found without integrating the transient. When a speed
+        range is given, the solution is followed along the range with a pseudo
+        arc-length continuation (see ross.faults.HarmonicBalance).
+
+        Parameters
+        ----------
+        rotor : ross.Rotor Object
+             6 DoF rotor model.
+        speed_range : array, pint.Quantity, optional
+            Initial and final speeds (rad/s). Default is the speed of the fault.
+        harmonics : int, optional
+            Number of harmonics retained in the response. Default is 5.
+        num_modes : int, optional
+            Number of elastic modes used in the modal basis. Default is 12.
+        num_samples : int, optional
+            Number of time samples per period used to evaluate the forces.
+            Default is 64.
+        subharmonic : int, optional
+            Ratio between the period of the response and the period of rotation.
+            Default is 1.
+        num_points : int, optional
+            Number of points expected along the speed range if the response has
+            no strong variations. Default is 20.
+        tol : float, optional
+            Relative tolerance of the Newton iterations. Default is 1e-6.
+
+        Returns
+        -------
+        results : ross.faults.HarmonicBalanceResults
+            Harmonic coefficients of the response along the speed range.
+        """
+        self._initialize(rotor)
+        hb = HarmonicBalance(self, harmonics, num_modes, num_samples, subharmonic)
+
+        if speed_range is None:
+            speeds = np.array([self.speed])
+            coefficients = hb.solve(self.speed, tol=tol)[np.newaxis]
+        else:
+            speeds, coefficients = hb.continuation(
+                speed_range, num_points=num_points, tol=tol
+            )
+
+        return HarmonicBalanceResults(
+            rotor, speeds, coefficients @ hb.basis.T, subharmonic
+        )
+
     def plot_dfft(self, probe, probe_units="rad", range_freq=None, fig=None, **kwargs):
         """Plot response in frequency domain (dFFT - discrete Fourier Transform) using Plotly.
 
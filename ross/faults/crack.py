@@ -9,7 +9,6 @@ import ross
 from ross.units import Q_, check_units
 
 from .abs_fault import Fault
-from .integrate_solver import Integrator
 
 __all__ = [
     "Crack",
@@ -44,6 +43,11 @@ class Crack(Fault):
         Array with the unbalance phase. The unit is rad.
     crack_type : string
         String containing type of crack model chosed. The avaible types are: Mayes and Gasch.
+    num_modes : int, optional
+        Number of modes kept in the modal reduction, by default 12.
+    adaptive : bool, dict, optional
+        Set it True to integrate with adaptive time step (see Integrator.rkck()),
+        or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
     print_progress : bool
         Set it True, to print the time iterations and the total time spent, by default False.
 
@@ -80,6 +84,8 @@ class Crack(Fault):
         unbalance_magnitude,
         unbalance_phase,
         crack_type="Mayes",
+        num_modes=12,
+        adaptive=False,
         print_progress=False,
     ):
         self.dt = dt
@@ -91,6 +97,8 @@ class Crack(Fault):
         self.speedF = speed
         self.unbalance_magnitude = unbalance_magnitude
         self.unbalance_phase = unbalance_phase
+        self.num_modes = num_modes
+        self.adaptive = adaptive
         self.print_progress = print_progress
 
         if depth_ratio <= 0.5:
@@ -119,16 +127,14 @@ class Crack(Fault):
         dir_path = Path(__file__).parents[2] / "tools/data/PAPADOPOULOS.csv"
         self.data_coefs = pd.read_csv(dir_path)
 
-    def run(self, rotor):
-        """Calculates the shaft angular position and the unbalance forces at X / Y directions.
+    def _initialize(self, rotor):
+        """Set the rotor dependent parameters of the fault.
 
         Parameters
         ----------
         rotor : ross.Rotor Object
              6 DoF rotor model.
-
         """
-
         self.rotor = rotor
         self.n_disk = len(self.rotor.disk_elements)
         if self.n_disk != len(self.unbalance_magnitude):
@@ -223,6 +229,17 @@ class Crack(Fault):
 
         self.iteration = 0
 
+    def run(self, rotor):
+        """Calculates the shaft angular position and the unbalance forces at X / Y directions.
+
+        Parameters
+        ----------
+        rotor : ross.Rotor Object
+             6 DoF rotor model.
+
+        """
+        self._initialize(rotor)
+
         # parameters for the time integration
         self.lambdat = 0.00001
         Faxial = 0
@@ -257,8 +274,9 @@ class Crack(Fault):
         self.Ksdt = self.rotor.Ksdt()
 
         _, ModMat = la.eigh(self.K, self.M)
-        ModMat = ModMat[:, :12]
+        ModMat = ModMat[:, : self.num_modes]
         self.ModMat = ModMat
+        self.ModMat_crack = ModMat[self.dof_crack]
 
         # Modal transformations
         self.Mmodal = ((ModMat.T).dot(self.M)).dot(ModMat)
@@ -267,7 +285,6 @@ class Crack(Fault):
         self.Kmodal = ((ModMat.T).dot(self.K)).dot(ModMat)
         self.Ksdtmodal = ((ModMat.T).dot(self.Ksdt)).dot(ModMat)
 
-        y0 = np.zeros(24)
         t_eval = np.arange(self.tI, self.tF + self.dt, self.dt)
         # t_eval = np.arange(self.dt, self.tF, self.dt)
         T = t_eval
@@ -313,21 +330,13 @@ class Crack(Fault):
         self.inv_Mmodal = np.linalg.pinv(self.Mmodal)
         t1 = time.time()
 
-        x = Integrator(
-            self.tI,
-            y0,
-            self.tF,
-            self.dt,
-            self._equation_of_movement,
-            self.print_progress,
-        )
-        x = x.rk45()
+        x = self._integrate("rk45")
         t2 = time.time()
         if self.print_progress:
             print(f"Time spent: {t2-t1} s")
 
-        self.displacement = x[:12, :]
-        self.velocity = x[12:, :]
+        self.displacement = x[: self.num_modes, :]
+        self.velocity = x[self.num_modes :, :]
         self.time_vector = t_eval
         self.response = self.ModMat.dot(self.displacement)
 
@@ -349,11 +358,11 @@ class Crack(Fault):
             Array of the new displacement and velocity, in the modal domain.
         """
 
-        positions = Y[:12]
-        velocity = Y[12:]  # velocity in space state
+        positions = Y[: self.num_modes]
+        velocity = Y[self.num_modes :]  # velocity in space state
 
-        self.positionsFis = self.ModMat.dot(positions)
-        self.velocityFis = self.ModMat.dot(velocity)
+        # the crack force only depends on the cracked element
+        self.positions_crack = self.ModMat_crack.dot(positions)
         self.T_matrix = np.array(
             [
                 [np.cos(self.angular_position[i]), np.sin(self.angular_position[i])],
@@ -362,9 +371,9 @@ class Crack(Fault):
         )
         self.tp = self.crack_model(self.angular_position[i])
 
-        FF_CRACK, ft = self._crack(self.tp, self.angular_position[i])
-        self.forces_crack[:, i] = ft
-        ftmodal = (self.ModMat.T).dot(ft)
+        ft = self._crack(self.tp, self.angular_position[i])
+        self.forces_crack[self.dof_crack, i] = ft
+        ftmodal = (self.ModMat_crack.T).dot(ft)
 
         # equation of movement to be integrated in time
         new_V_dot = (
@@ -376,21 +385,28 @@ class Crack(Fault):
 
         new_X_dot = velocity
 
-        new_Y = np.zeros(24)
-        new_Y[:12] = new_X_dot
-        new_Y[12:] = new_V_dot
+        new_Y = np.concatenate((new_X_dot, new_V_dot))
 
         return new_Y
 
+    def _fault_force(self, angle, disp, velc, speed):
+        """Crack force for a given state of the rotor (see Fault._fault_force())."""
+        self.positions_crack = disp[self.dof_crack]
+        self.T_matrix = np.array(
+            [[np.cos(angle), np.sin(angle)], [-np.sin(angle), np.cos(angle)]]
+        )
+        force = np.zeros(self.ndof)
+        force[self.dof_crack] = self._crack(self.crack_model(angle), angle)
+        return force
+
     def _crack(self, func, ap):
         """Reaction forces of cracked element
 
         Returns
         -------
-        F_CRACK : array
-            Excitation force caused by the parallel misalignment on the node of application.
         FF_CRACK : array
-            Excitation force caused by the parallel misalignment on the entire system.
+            Excitation force caused by the crack on the degrees of freedom of the
+            cracked element.
         """
 
         K = func
@@ -432,14 +448,11 @@ class Crack(Fault):
                              [Koxy[3,0]	,0           ,0         , 0	        ,Koxy[3,1]  ,0          ,Koxy[3,2]          ,0                  ,0      ,0                  ,Koxy[3,3]  ,0],
                              [0	        ,0           ,0         , 0	        ,0	        ,0          ,0                  ,0                  ,0      ,0                  ,0	        ,0]])
         # fmt: on
-        F_CRACK = np.zeros(self.ndof)
-
         KK_CRACK = self.KK - KK_crack
-        FF_CRACK = (KK_CRACK).dot(self.positionsFis[self.dof_crack])
-        F_CRACK[self.dof_crack] = FF_CRACK
+        FF_CRACK = (KK_CRACK).dot(self.positions_crack)
         self.KK_CRACK = KK_CRACK
 
-        return FF_CRACK, F_CRACK
+        return FF_CRACK
 
     def _gasch(self, ap):
         """Stiffness matrix of the cracked element according to the Gasch model.
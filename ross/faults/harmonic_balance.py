@@ -0,0 +1,608 @@
+"""Harmonic balance module.
+
+This module defines a multi-harmonic balance solver for the periodic steady state
+of rotors with faults. The fault forces are evaluated with the alternating
+frequency-time (AFT) scheme and the solution branch is followed in speed with a
+pseudo arc-length continuation.
+"""
+
+from warnings import warn
+
+import numpy as np
+import plotly.graph_objects as go
+from scipy import linalg as la
+
+from ross.units import Q_
+
+__all__ = ["HarmonicBalance", "HarmonicBalanceResults"]
+
+
+class HarmonicBalance:
+    """Multi-harmonic balance solver for rotors with faults.
+
+    The modal response is written as a truncated Fourier series with fundamental
+    frequency speed / subharmonic:
+
+        q(t) = a_0 + sum_k (a_k cos(k w t) + b_k sin(k w t)),
+
+    and the harmonic coefficients are found balancing the linear terms with the
+    Fourier coefficients of the unbalance and fault forces. The forces are
+    evaluated at num_samples points along one period of the response and
+    transformed back to the frequency domain (AFT scheme).
+
+    Parameters
+    ----------
+    fault : ross.faults.Fault
+        Fault object already initialized with a rotor.
+    harmonics : int, optional
+        Number of harmonics retained in the response. Default is 5.
+    num_modes : int, optional
+        Number of elastic modes used in the modal basis. Rigid body modes are
+        left out, since they have no periodic steady state. Default is 12.
+    num_samples : int, optional
+        Number of time samples per period used by the AFT scheme. Must be higher
+        than 2 * harmonics. Default is 64.
+    subharmonic : int, optional
+        Ratio between the period of the response and the period of rotation.
+        Use values higher than 1 to capture subharmonic responses. Default is 1.
+
+    Attributes
+    ----------
+    basis : np.ndarray
+        Mass normalized modes used to reduce the model (ndof x num_modes).
+    """
+
+    def __init__(self, fault, harmonics=5, num_modes=12, num_samples=64, subharmonic=1):
+        if num_samples <= 2 * harmonics:
+            raise ValueError("num_samples must be higher than 2 * harmonics.")
+
+        self.fault = fault
+        self.rotor = fault.rotor
+        self.harmonics = harmonics
+        self.num_samples = num_samples
+        self.subharmonic = subharmonic
+
+        evalues, evectors = la.eigh(
+            self.rotor.K(fault.speed), self.rotor.M(fault.speed)
+        )
+        elastic = np.abs(evalues) > 1e-10 * np.abs(evalues).max()
+        self.basis = evectors[:, elastic][:, :num_modes]
+
+        # real Fourier synthesis (samples x coefficients) and analysis matrices
+        phi = 2 * np.pi * np.arange(num_samples) / num_samples
+        k = np.arange(1, harmonics + 1)
+        self._synthesis = np.ones((num_samples, 2 * harmonics + 1))
+        self._synthesis[:, 1::2] = np.cos(np.outer(phi, k))
+        self._synthesis[:, 2::2] = np.sin(np.outer(phi, k))
+        self._analysis = 2 * self._synthesis.T / num_samples
+        self._analysis[0] /= 2
+        self._angles = subharmonic * phi
+
+        # time derivative of the coefficients, for unitary fundamental frequency
+        self._derivative = np.zeros((2 * harmonics + 1, 2 * harmonics + 1))
+        for i in k:
+            self._derivative[2 * i - 1, 2 * i] = i
+            self._derivative[2 * i, 2 * i - 1] = -i
+
+        self._modal_cache = {}
+
+    @property
+    def shape(self):
+        """Shape of the array of harmonic coefficients (2 * harmonics + 1, modes)."""
+        return 2 * self.harmonics + 1, self.basis.shape[1]
+
+    def _modal_matrices(self, speed):
+        """Modal mass, damping (gyroscopic included) and stiffness at a speed."""
+        try:
+            return self._modal_cache[speed]
+        except KeyError:
+            pass
+
+        rotor, basis = self.rotor, self.basis
+        matrices = tuple(
+            basis.T @ matrix @ basis
+            for matrix in (
+                rotor.M(speed),
+                rotor.C(speed) + speed * rotor.G(),
+                rotor.K(speed),
+            )
+        )
+
+        if len(self._modal_cache) > 8:
+            self._modal_cache.pop(next(iter(self._modal_cache)))
+        self._modal_cache[speed] = matrices
+
+        return matrices
+
+    def forces(self, Q, speed):
+        """Fourier coefficients of the external forces in the modal basis.
+
+        Parameters
+        ----------
+        Q : np.ndarray
+            Harmonic coefficients of the modal response, with shape self.shape.
+        speed : float
+            Rotor speed (rad/s).
+
+        Returns
+        -------
+        F : np.ndarray
+            Harmonic coefficients of the modal forces, with shape self.shape.
+        """
+        w = speed / self.subharmonic
+        disp = self._synthesis @ Q @ self.basis.T
+        velc = w * self._synthesis @ (self._derivative @ Q) @ self.basis.T
+
+        fault = self.fault
+        forces = fault._unbalance_force(self._angles, speed).T
+        for i, angle in enumerate(self._angles):
+            forces[i] += fault._fault_force(angle, disp[i], velc[i], speed)
+
+        return self._analysis @ forces @ self.basis
+
+    def residual(self, Q, speed):
+        """Residual of the harmonic balance equations.
+
+        Parameters
+        ----------
+        Q : np.ndarray
+            Harmonic coefficients of the modal response, with shape self.shape.
+        speed : float
+            Rotor speed (rad/s).
+
+        Returns
+        -------
+        R : np.ndarray
+            Residual, with shape self.shape.
+        """
+        M, D, K = self._modal_matrices(speed)
+        w = speed / self.subharmonic
+        DQ = self._derivative @ Q
+
+        return (
+            Q @ K.T
+            + w * DQ @ D.T
+            + w**2 * (self._derivative @ DQ) @ M.T
+            - self.forces(Q, speed)
+        )
+
+    def jacobian(self, Q, speed, R=None):
+        """Jacobian of the residual with respect to the coefficients and speed.
+
+        The fault forces at each time sample depend only on the state at that
+        sample, so their derivatives are computed with forward differences along
+        the modes at each sample and transformed to the frequency domain. The cost
+        does not depend on the number of harmonics.
+
+        Parameters
+        ----------
+        Q : np.ndarray
+            Harmonic coefficients of the modal response, with shape self.shape.
+        speed : float
+            Rotor speed (rad/s).
+        R : np.ndarray, optional
+            Residual at (Q, speed), if already available.
+
+        Returns
+        -------
+        J : np.ndarray
+            Jacobian matrix with shape (Q.size, Q.size + 1), the last column
+            holding the derivative with respect to the speed.
+        """
+        if R is None:
+            R = self.residual(Q, speed)
+
+        M, D, K = self._modal_matrices(speed)
+        w = speed / self.subharmonic
+        basis, derivative, synthesis = self.basis, self._derivative, self._synthesis
+        size = Q.size
+        eye = np.eye(len(Q))
+
+        J = np.empty((size, size + 1))
+        J[:, :size] = (
+            np.kron(eye, K)
+            + w * np.kron(derivative, D)
+            + w**2 * np.kron(derivative @ derivative, M)
+        )
+
+        fault = self.fault
+        disp = synthesis @ Q @ basis.T
+        velc = w * synthesis @ (derivative @ Q) @ basis.T
+        h = np.sqrt(np.finfo(float).eps) * max(np.abs(Q).max(), 1e-12)
+        Kx = np.empty((self.num_samples, *M.shape))
+        Kv = np.empty((self.num_samples, *M.shape))
+        for n, angle in enumerate(self._angles):
+            f0 = fault._fault_force(angle, disp[n], velc[n], speed)
+            for j, mode in enumerate(basis.T):
+                df = fault._fault_force(angle, disp[n] + h * mode, velc[n], speed)
+                Kx[n, :, j] = basis.T @ (df - f0) / h
+                df = fault._fault_force(angle, disp[n], velc[n] + w * h * mode, speed)
+                Kv[n, :, j] = basis.T @ (df - f0) / (w * h)
+
+        dF = np.einsum("hn,njk,ng->hjgk", self._analysis, Kx, synthesis)
+        dF += w * np.einsum(
+            "hn,njk,ng->hjgk", self._analysis, Kv, synthesis @ derivative
+        )
+        J[:, :size] -= dF.reshape(size, size)
+
+        h = np.sqrt(np.finfo(float).eps) * max(abs(speed), 1.0)
+        J[:, size] = (self.residual(Q, speed + h) - R).ravel() / h
+
+        return J
+
+    def solve(self, speed, Q0=None, tol=1e-6, max_iter=20):
+        """Solve the harmonic balance equations at a fixed speed.
+
+        Damped Newton iterations are used, with the Jacobian updated with
+        Broyden's method.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed (rad/s).
+        Q0 : np.ndarray, optional
+            Initial guess for the harmonic coefficients. Default is the response
+            of the linear system to the forces at zero displacement.
+        tol : float, optional
+            Relative tolerance on the Newton step. Default is 1e-6.
+        max_iter : int, optional
+            Maximum number of Newton iterations. Default is 20.
+
+        Returns
+        -------
+        Q : np.ndarray
+            Harmonic coefficients of the modal response.
+        """
+        if Q0 is None:
+            Q0 = np.zeros(self.shape)
+            J = self.jacobian(Q0, speed)[:, :-1]
+            Q0 = -np.linalg.solve(J, self.residual(Q0, speed).ravel())
+            Q0 = Q0.reshape(self.shape)
+
+        def residual(q):
+            return self.residual(q.reshape(self.shape), speed).ravel()
+
+        def jacobian(q, R):
+            J = self.jacobian(q.reshape(self.shape), speed, R.reshape(self.shape))
+            return J[:, :-1]
+
+        q = Q0.ravel()
+        q, _, iterations = _newton(
+            residual, jacobian, q, jacobian(q, residual(q)), tol, max_iter
+        )
+        if iterations:
+            return q.reshape(self.shape)
+
+        warn(f"Harmonic balance did not converge at speed {speed} rad/s.")
+
+        return q.reshape(self.shape)
+
+    def continuation(
+        self, speed_range, num_points=20, max_points=500, tol=1e-6, max_iter=10
+    ):
+        """Follow the periodic solution along a speed range.
+
+        A pseudo arc-length continuation is used, so that turning points of the
+        solution branch (e.g. the jump phenomena of rubbing) are followed. The
+        arc-length step is adapted to the number of corrector iterations.
+
+        Parameters
+        ----------
+        speed_range : array_like
+            Initial and final speeds (rad/s).
+        num_points : int, optional
+            Number of points expected along the speed range if the solution has
+            no strong variations. Default is 20.
+        max_points : int, optional
+            Maximum number of points computed along the branch. Default is 500.
+        tol : float, optional
+            Relative tolerance on the Newton step. Default is 1e-6.
+        max_iter : int, optional
+            Maximum number of corrector iterations. Default is 10.
+
+        Returns
+        -------
+        speeds : np.ndarray
+            Speeds of the solutions along the branch.
+        coefficients : np.ndarray
+            Harmonic coefficients of the modal response at each point, with
+            shape (len(speeds), *self.shape).
+        """
+        speed_start, speed_end = speed_range[0], speed_range[-1]
+        direction = np.sign(speed_end - speed_start)
+        Q = self.solve(speed_start, tol=tol)
+
+        y = np.append(Q.ravel(), speed_start)
+        last = np.eye(len(y))[-1]
+        J = self.jacobian(Q, speed_start)
+        tangent = np.linalg.solve(np.vstack([J, last]), direction * last)
+
+        ds = ds_max = 1 / num_points
+        ds_min = ds_max / 2**10
+        points = [y]
+        amplitude = max(np.abs(Q).max(), 1e-12)
+
+        # corrector equations in scaled variables z = y / scale, with the
+        # arc-length condition orthogonal to the tangent t at the predictor z_pred
+        def corrector(z):
+            y = z * scale
+            R = self.residual(y[:-1].reshape(self.shape), y[-1])
+            return np.append(R.ravel(), t @ (z - z_pred))
+
+        def jacobian(z, F):
+            y = z * scale
+            J = self.jacobian(
+                y[:-1].reshape(self.shape), y[-1], F[:-1].reshape(self.shape)
+            )
+            return np.vstack([J * scale, t])
+
+        while len(points) < max_points:
+            # coefficients scaled by the highest amplitude along the branch and
+            # speed by the range, so that ds is a relative change of the solution
+            y = points[-1]
+            amplitude = max(amplitude, np.abs(y[:-1]).max())
+            scale = np.append(np.full(Q.size, amplitude), abs(speed_end - speed_start))
+            t = tangent / scale
+            t /= np.linalg.norm(t)
+
+            z_pred = y / scale + ds * t
+            z, J, iteration = _newton(
+                corrector,
+                jacobian,
+                z_pred,
+                jacobian(z_pred, corrector(z_pred)),
+                tol,
+                max_iter,
+            )
+            if not iteration:
+                ds /= 2
+                if ds < ds_min:
+                    warn(
+                        "Continuation stopped at speed "
+                        f"{y[-1]} rad/s, step size too small."
+                    )
+                    break
+                continue
+
+            y_new = z * scale
+            speed = y_new[-1]
+            if direction * (speed - speed_end) >= 0:
+                # last point exactly at the end of the speed range
+                s = (speed_end - y[-1]) / (speed - y[-1])
+                Q_end = self.solve(
+                    speed_end, (y + s * (y_new - y))[:-1].reshape(self.shape), tol=tol
+                )
+                points.append(np.append(Q_end.ravel(), speed_end))
+                break
+
+            # tangent from the Jacobian updated by the corrector
+            points.append(y_new)
+            tangent = scale * np.linalg.solve(J, last)
+            ds = min(ds * np.clip(3 / iteration, 0.5, 2), ds_max)
+        else:
+            warn(f"Continuation stopped after {max_points} points.")
+
+        points = np.array(points)
+
+        return points[:, -1], points[:, :-1].reshape(-1, *self.shape)
+
+
+def _newton(func, jac, x, J, tol, max_iter, min_step=2**-10):
+    """Damped Newton iterations with Broyden updates of the Jacobian.
+
+    Steps that do not reduce the residual are halved and the Jacobian is
+    recomputed, since contact forces make the residual nonsmooth. The iterations
+    stop without convergence if no step down to min_step reduces the residual.
+
+    Parameters
+    ----------
+    func : callable
+        Residual function, func(x).
+    jac : callable
+        Jacobian function, jac(x, func(x)).
+    x : np.ndarray
+        Initial guess.
+    J : np.ndarray
+        Jacobian at the initial guess.
+    tol : float
+        Relative tolerance on the Newton step.
+    max_iter : int
+        Maximum number of iterations.
+    min_step : float, optional
+        Smallest fraction of the Newton step tried. Default is 2**-10.
+
+    Returns
+    -------
+    x : np.ndarray
+        Solution, or last iterate if not converged.
+    J : np.ndarray
+        Jacobian approximation at x.
+    iterations : int
+        Number of iterations, or 0 if not converged.
+    """
+    F = func(x)
+    for iteration in range(1, max_iter + 1):
+        dx = -np.linalg.solve(J, F)
+        step = 1.0
+        while True:
+            x_new = x + step * dx
+            F_new = func(x_new)
+            if np.linalg.norm(F_new) < np.linalg.norm(F):
+                break
+            step /= 2
+            if step < min_step:
+                # no descent along the Newton direction
+                return x, J, 0
+
+        if step < 1:
+            J = jac(x_new, F_new)
+        else:
+            J = J + np.outer(F_new - F - J @ dx, dx) / (dx @ dx)
+        x, F = x_new, F_new
+
+        if step * np.linalg.norm(dx) <= tol * max(np.linalg.norm(x), 1e-30):
+            return x, J, iteration
+
+    return x, J, 0
+
+
+class HarmonicBalanceResults:
+    """Periodic steady state response of a rotor with faults.
+
+    Parameters
+    ----------
+    rotor : ross.Rotor
+        The rotor object.
+    speed_range : array
+        Speeds of the solutions (rad/s).
+    coefficients : array
+        Harmonic coefficients of the response with shape
+        (len(speed_range), 2 * harmonics + 1, ndof), ordered as the constant term
+        followed by the cosine and sine terms of each harmonic.
+    subharmonic : int
+        Ratio between the period of the response and the period of rotation.
+
+    Returns
+    -------
+    results : ross.faults.HarmonicBalanceResults
+    """
+
+    def __init__(self, rotor, speed_range, coefficients, subharmonic=1):
+        self.rotor = rotor
+        self.speed_range = speed_range
+        self.coefficients = coefficients
+        self.subharmonic = subharmonic
+        self.harmonics = (coefficients.shape[1] - 1) // 2
+
+    def amplitude(self, dof, harmonic=1):
+        """Amplitude of a harmonic of the response along the speed range.
+
+        Parameters
+        ----------
+        dof : int
+            Degree of freedom.
+        harmonic : int, optional
+            Harmonic number. The frequency of the harmonic is
+            harmonic * speed / subharmonic. Default is 1.
+
+        Returns
+        -------
+        amplitude : np.ndarray
+            Amplitude for each speed.
+        """
+        if harmonic == 0:
+            return np.abs(self.coefficients[:, 0, dof])
+
+        return np.hypot(
+            self.coefficients[:, 2 * harmonic - 1, dof],
+            self.coefficients[:, 2 * harmonic, dof],
+        )
+
+    def time_response(self, index=-1, num_points=100):
+        """Reconstruct one period of the response at a point of the branch.
+
+        Parameters
+        ----------
+        index : int, optional
+            Index of the speed in speed_range. Default is the last one.
+        num_points : int, optional
+            Number of time points in the period. Default is 100.
+
+        Returns
+        -------
+        t : np.ndarray
+            Time array.
+        yout : np.ndarray
+            Response for each degree of freedom, with shape (num_points, ndof).
+        """
+        w = self.speed_range[index] / self.subharmonic
+        t = np.linspace(0, 2 * np.pi / w, num_points, endpoint=False)
+        k = np.arange(1, self.harmonics + 1)
+
+        coefficients = self.coefficients[index]
+        yout = (
+            coefficients[0]
+            + np.cos(w * np.outer(t, k)) @ coefficients[1::2]
+            + np.sin(w * np.outer(t, k)) @ coefficients[2::2]
+        )
+
+        return t, yout
+
+    def plot(
+        self,
+        probe,
+        harmonic=1,
+        frequency_units="rad/s",
+        amplitude_units="m",
+        fig=None,
+        **kwargs,
+    ):
+        """Plot the amplitude of a harmonic of the response along the speed range.
+
+        Parameters
+        ----------
+        probe : list
+            List with rs.Probe objects.
+        harmonic : int, optional
+            Harmonic number. Default is 1.
+        frequency_units : str, optional
+            Units for the x axis.
+            Default is "rad/s"
+        amplitude_units : str, optional
+            Units for the response magnitude.
+            Default is "m"
+        fig : Plotly graph_objects.Figure()
+            The figure object with the plot.
+        kwargs : optional
+            Additional key word arguments can be passed to change the plot layout only
+            (e.g. width=1000, height=800, ...).
+            *See Plotly Python Figure Reference for more information.
+
+        Returns
+        -------
+        fig : Plotly graph_objects.Figure()
+            The figure object with the plot.
+        """
+        if fig is None:
+            fig = go.Figure()
+
+        num_dof = self.rotor.number_dof
+        speed = Q_(self.speed_range, "rad/s").to(frequency_units).m
+
+        for i, p in enumerate(probe):
+            probe_tag = p.tag or p.get_label(i + 1)
+            if p.direction == "axial":
+                coefficients = self.coefficients[:, :, num_dof * p.node + 2]
+            else:
+                coefficients = (
+                    np.cos(p.angle) * self.coefficients[:, :, num_dof * p.node]
+                    + np.sin(p.angle) * self.coefficients[:, :, num_dof * p.node + 1]
+                )
+
+            if harmonic == 0:
+                amplitude = np.abs(coefficients[:, 0])
+            else:
+                amplitude = np.hypot(
+                    coefficients[:, 2 * harmonic - 1], coefficients[:, 2 * harmonic]
+                )
+
+            fig.add_trace(
+                go.Scatter(
+                    x=speed,
+                    y=Q_(amplitude, "m").to(amplitude_units).m,
+                    mode="lines",
+                    name=probe_tag,
+                    legendgroup=probe_tag,
+                    showlegend=True,
+                    hovertemplate=(
+                        f"Speed ({frequency_units}): %{{x:.2f}}<br>"
+                        f"Amplitude ({amplitude_units}): %{{y:.2e}}"
+                    ),
+                )
+            )
+
+        fig.update_xaxes(title_text=f"Speed ({frequency_units})")
+        fig.update_yaxes(title_text=f"Amplitude ({amplitude_units})")
+        fig.update_layout(**kwargs)
+
+        return fig
@@ -7,25 +7,77 @@ rotors defined by the user, and return the time signals for rotor displacement.
 """
 
 import numpy as np
+from scipy.interpolate import CubicHermiteSpline
+
+__all__ = ["Integrator"]
+
+# Butcher tableaus (a, b, c) of the explicit Runge-Kutta methods
+RK4 = (
+    np.array(
+        [
+            [0, 0, 0, 0],
+            [1 / 2, 0, 0, 0],
+            [0, 1 / 2, 0, 0],
+            [0, 0, 1, 0],
+        ]
+    ),
+    np.array([1 / 6, 1 / 3, 1 / 3, 1 / 6]),
+    np.array([0, 1 / 2, 1 / 2, 1]),
+)
+
+CASH_KARP = (
+    np.array(
+        [
+            [0, 0, 0, 0, 0],
+            [1 / 5, 0, 0, 0, 0],
+            [3 / 40, 9 / 40, 0, 0, 0],
+            [3 / 10, -9 / 10, 6 / 5, 0, 0],
+            [-11 / 54, 5 / 2, -70 / 27, 35 / 27, 0],
+            [1631 / 55296, 175 / 512, 575 / 13824, 44275 / 110592, 253 / 4096],
+        ]
+    ),
+    np.array([37 / 378, 0, 250 / 621, 125 / 594, 0, 512 / 1771]),
+    np.array([0, 1 / 5, 3 / 10, 3 / 5, 1, 7 / 8]),
+)
+
+# 4th order solution of the Cash-Karp pair, used for the error estimate
+CASH_KARP_4 = np.array(
+    [2825 / 27648, 0, 18575 / 48384, 13525 / 55296, 277 / 14336, 1 / 4]
+)
 
 
 class Integrator:
     """A series of Runge-Kutta time integration algorithms.
 
-    Calculates the time response for the rotors input to the routine.
+    Calculates the time response for the rotors input to the routine. The size of
+    the system is given by the initial condition, so any number of modes can be
+    integrated. The function is called as func(x, y, i), where i is the index of
+    the time step in the grid x0, x0 + h, ..., x.
 
     Parameters
     ----------
     x0 : float
         Initial time
-    y0 : float
+    y0 : array
         Initial condition for the integration
     x : float
-        Iteration time
+        Final time
     h : float
-        Step height
+        Time step. For the adaptive method, the step of the output grid and the
+        initial step size.
     func : object
         Function to be integrated in time
+    print_progress : bool, optional
+        Set it True, to print the time iterations. False by default.
+
+    Attributes
+    ----------
+    dense : scipy.interpolate.CubicHermiteSpline
+        Continuous solution of the adaptive method, available when it is called
+        with dense_output=True.
+    nfev, accepted, rejected : int
+        Number of function evaluations and of accepted and rejected steps of the
+        adaptive method.
 
     Returns
     -------
@@ -37,6 +89,14 @@ class Integrator:
     .. [2] CASH, Jeff R.; KARP, Alan H. A variable order Runge-Kutta method for initial value problems with rapidly varying right-hand sides.
            ACM Transactions on Mathematical Software (TOMS), v. 16, n. 3, p. 201-222, 1990. ..
 
+    Examples
+    --------
+    >>> integrator = Integrator(0, np.array([1.0, 0.0]), 1, 0.01, lambda x, y, i: np.array([y[1], -y[0]]))
+    >>> result = integrator.rkck(rtol=1e-8, decimation=10)
+    >>> result.shape
+    (2, 11)
+    >>> np.allclose(result[0], np.cos(np.linspace(0, 1, 11)), atol=1e-7)
+    True
     """
 
     def __init__(self, x0, y0, x, h, func, print_progress=False):
@@ -46,94 +106,216 @@ class Integrator:
         self.h = h
         self.func = func
         self.print_progress = print_progress
+        self.dense = None
+        self.nfev = 0
+        self.accepted = 0
+        self.rejected = 0
+
+    def rk4(self, decimation=1):
+        """Runge-Kutta 4th order (RK4) with fixed time step.
+
+        Parameters
+        ----------
+        decimation : int, optional
+            Record the solution only every decimation steps. Default is 1.
 
-    def rk4(self):
-        # Runge-Kutta 4th order (RK4)
+        Returns
+        -------
+        result : array
+            Solution at the recorded time steps, with shape (len(y0), n_steps).
+        """
+        return self._fixed_step(*RK4, decimation)
 
+    def rk45(self, decimation=1):
+        """Runge-Kutta Cash-Karp (CK45) with fixed time step.
+
+        The 5th order solution of the Cash-Karp pair is used, without error
+        control (see Integrator.rkck() for the adaptive method).
+
+        Parameters
+        ----------
+        decimation : int, optional
+            Record the solution only every decimation steps. Default is 1.
+
+        Returns
+        -------
+        result : array
+            Solution at the recorded time steps, with shape (len(y0), n_steps).
+        """
+        return self._fixed_step(*CASH_KARP, decimation)
+
+    def _fixed_step(self, a, b, c, decimation=1):
+        """Explicit Runge-Kutta method given by its Butcher tableau."""
         # Count number of iterations using step size or
         # step height h
         n = int((self.x - self.x0) / self.h)
+        h = self.h
 
-        # Iterate for number of iterations
-        y = self.y0
-        result = np.zeros((24, n + 1))
-        result[:, 0] = self.y0
+        y = np.array(self.y0, dtype=float)
+        result = np.empty((len(y), n // decimation + 1))
+        result[:, 0] = y
 
-        # 4th-order Runge-Kutta
+        # stage buffers, reused along the integration
+        k = np.empty((len(b), len(y)))
+        stage = np.empty(len(y))
 
         for i in range(1, n + 1):
+            # time computed from the step index, to avoid accumulating round-off
+            x = self.x0 + (i - 1) * h
             if i % 10000 == 0 and self.print_progress:
-                print(f"Iteration: {i} \n Time: {self.x0}")
+                print(f"Iteration: {i} \n Time: {x}")
 
-            "Apply Runge Kutta Formulas to find next value of y"
-            k1 = self.h * self.func(self.x0, y, i)
-            k2 = self.h * self.func(self.x0 + 0.5 * self.h, y + 0.5 * k1, i)
-            k3 = self.h * self.func(self.x0 + 0.5 * self.h, y + 0.5 * k2, i)
-            k4 = self.h * self.func(self.x0 + self.h, y + k3, i)
+            k[0] = self.func(x, y, i)
+            for s in range(1, len(b)):
+                np.dot(a[s, :s], k[:s], out=stage)
+                stage *= h
+                stage += y
+                k[s] = self.func(x + c[s] * h, stage, i)
 
-            # Update next value of y
-            y = y + (1.0 / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
-            result[:, i] = np.copy(y)
+            np.dot(b, k, out=stage)
+            stage *= h
+            y += stage
 
-            # Update next value of x
-            self.x0 = self.x0 + self.h
+            if i % decimation == 0:
+                result[:, i // decimation] = y
 
         return result
 
-    def rk45(self):
-        # Runge-Kutta Cash-Karp (CK45)
+    def rkck(
+        self,
+        rtol=1e-6,
+        atol=1e-9,
+        max_step=np.inf,
+        interpolate=False,
+        decimation=1,
+        dense_output=False,
+    ):
+        """Runge-Kutta Cash-Karp 4(5) with adaptive time step.
 
-        # Count number of iterations using step size or
-        # step height h
+        The step size is controlled with the embedded 4th order solution of the
+        Cash-Karp pair, and the solution is interpolated (cubic Hermite) on the
+        time grid x0, x0 + h, ..., x. The function receives the index of the first
+        grid time not earlier than the stage time. The steps are not limited by
+        the grid, so they can span several grid intervals.
+
+        Parameters
+        ----------
+        rtol, atol : float, optional
+            Relative and absolute tolerances of the local error.
+            Defaults are 1e-6 and 1e-9.
+        max_step : float, optional
+            Maximum step size. Default is no limit.
+        interpolate : bool, optional
+            If True, the function is evaluated at the indexes of the grid times
+            around the stage time, and the results are linearly interpolated. Use
+            it when the function is tabulated on the grid. Default is False.
+        decimation : int, optional
+            Record the solution only every decimation points of the grid.
+            Default is 1.
+        dense_output : bool, optional
+            If True, the continuous solution is stored in Integrator.dense.
+            Default is False.
+
+        Returns
+        -------
+        result : array
+            Solution at the recorded time steps, with shape (len(y0), n_steps).
+        """
+        a, b, c = CASH_KARP
+        error_weights = b - CASH_KARP_4
         n = int((self.x - self.x0) / self.h)
+        x_end = self.x0 + n * self.h
 
-        # Iterate for number of iterations
-        y = self.y0
-        result = np.zeros((24, n + 1))
-        result[:, 0] = self.y0
+        def evaluate(x, y):
+            s = (x - self.x0) / self.h
+            if not interpolate:
+                return self.func(x, y, min(n, int(np.ceil(s - 1e-6))))
 
-        for i in range(1, n + 1):
-            if i % 10000 == 0 and self.print_progress:
-                print(f"Iteration: {i} \n Time: {self.x0}")
-
-            "Apply Runge Kutta Formulas to find next value of y"
-            k1 = 1 * self.func(self.x0, y, i)
-            yp2 = y + k1 * (self.h / 5)
-            k2 = 1 * self.func(self.x0 + (self.h / 5), yp2, i)
-            yp3 = y + k1 * (3 * self.h / 40) + k2 * (9 * self.h / 40)
-            k3 = 1 * self.func(self.x0 + (3 * self.h / 10), yp3, i)
-            yp4 = (
-                y
-                + k1 * (3 * self.h / 10)
-                - k2 * (9 * self.h / 10)
-                + k3 * (6 * self.h / 5)
-            )
-            k4 = 1 * self.func(self.x0 + (3 * self.h / 5), yp4, i)
-            yp5 = (
-                y
-                - k1 * (11 * self.h / 54)
-                + k2 * (5 * self.h / 2)
-                - k3 * (70 * self.h / 27)
-                + k4 * (35 * self.h / 27)
-            )
-            k5 = 1 * self.func(self.x0 + self.h, yp5, i)
-            yp6 = (
-                y
-                + k1 * (1631 * self.h / 55296)
-                + k2 * (175 * self.h / 512)
-                + k3 * (575 * self.h / 13824)
-                + k4 * (44275 * self.h / 110592)
-                + k5 * (253 * self.h / 4096)
-            )
-            k6 = 1 * self.func(self.x0 + (7 * self.h / 8), yp6, i)
-
-            # Update next value of y
-            y = y + self.h * (
-                37 * k1 / 378 + 250 * k3 / 621 + 125 * k4 / 594 + 512 * k6 / 1771
-            )
-            result[:, i] = np.copy(y)
-
-            # Update next value of x
-            self.x0 = self.x0 + self.h
+            j = min(n - 1, int(np.floor(s + 1e-6)))
+            theta = s - j
+            if theta <= 1e-6:
+                return self.func(x, y, j)
+            if theta >= 1 - 1e-6:
+                return self.func(x, y, j + 1)
+
+            self.nfev += 1
+            return (1 - theta) * self.func(x, y, j) + theta * self.func(x, y, j + 1)
+
+        y = np.array(self.y0, dtype=float)
+        size = len(y)
+        result = np.empty((size, n // decimation + 1))
+        result[:, 0] = y
+        record = decimation
+
+        # stage buffers, reused along the integration
+        k = np.empty((len(b), size))
+        stage = np.empty(size)
+        y_new = np.empty(size)
+        error = np.empty(size)
+
+        x = self.x0
+        self.nfev = 1
+        self.accepted = self.rejected = 0
+        f = evaluate(x, y)
+        h = min(self.h, max_step)
+        steps = [(x, y.copy(), np.array(f))] if dense_output else None
+
+        while x_end - x > 1e-12 * self.h:
+            h = min(h, max_step, x_end - x)
+
+            k[0] = f
+            for s in range(1, len(b)):
+                np.dot(a[s, :s], k[:s], out=stage)
+                stage *= h
+                stage += y
+                k[s] = evaluate(x + c[s] * h, stage)
+
+            np.dot(b, k, out=y_new)
+            y_new *= h
+            y_new += y
+            np.dot(error_weights, k, out=error)
+            error *= h
+            np.maximum(np.abs(y), np.abs(y_new), out=stage)
+            stage *= rtol
+            stage += atol
+            error /= stage
+            err = np.sqrt(np.mean(error**2))
+            self.nfev += len(b) - 1
+
+            if err > 1:
+                self.rejected += 1
+                h *= max(0.2, 0.9 * err**-0.25)
+                continue
+
+            x_new = x + h
+            f_new = evaluate(x_new, y_new)
+            self.nfev += 1
+
+            # cubic Hermite interpolation on the grid points inside the step
+            while record <= n and self.x0 + record * self.h <= x_new + 1e-9 * h:
+                theta = (self.x0 + record * self.h - x) / h
+                h00 = (1 + 2 * theta) * (1 - theta) ** 2
+                h10 = theta * (1 - theta) ** 2
+                h01 = theta**2 * (3 - 2 * theta)
+                h11 = theta**2 * (theta - 1)
+                result[:, record // decimation] = (
+                    h00 * y + h10 * h * f + h01 * y_new + h11 * h * f_new
+                )
+                record += decimation
+
+            self.accepted += 1
+            if self.accepted % 10000 == 0 and self.print_progress:
+                print(f"Iteration: {self.accepted} \n Time: {x_new}")
+
+            x, f = x_new, f_new
+            y, y_new = y_new, y
+            if dense_output:
+                steps.append((x, y.copy(), np.array(f)))
+
+            h *= min(5.0, 0.9 * err**-0.2) if err > 0 else 5.0
+
+        if dense_output:
+            t, ys, fs = zip(*steps)
+            self.dense = CubicHermiteSpline(t, np.array(ys), np.array(fs), axis=0)
 
         return result
@@ -1,10 +1,11 @@
 """Misalignment module.
 
-This module defines misalignments of various types on the shaft coupling. There are 
+This module defines misalignments of various types on the shaft coupling. There are
 a number of options, for the formulation of 6 DoFs (degrees of freedom).
 """
 
 import time
+from warnings import warn
 
 import numpy as np
 from scipy import linalg as la
@@ -13,7 +14,6 @@ import ross
 from ross.units import Q_, check_units
 
 from .abs_fault import Fault
-from .integrate_solver import Integrator
 
 __all__ = ["MisalignmentFlex", "MisalignmentRigid"]
 
@@ -56,6 +56,11 @@ class MisalignmentFlex(Fault):
         Array with the unbalance phase. The unit is rad.
     mis_type: string
         String containing the misalignment type choosed. The avaible types are: parallel, by default; angular; combined.
+    num_modes : int, optional
+        Number of modes kept in the modal reduction, by default 12.
+    adaptive : bool, dict, optional
+        Set it True to integrate with adaptive time step (see Integrator.rkck()),
+        or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
     print_progress : bool
         Set it True, to print the time iterations and the total time spent.
         False by default.
@@ -100,6 +105,8 @@ class MisalignmentFlex(Fault):
         unbalance_magnitude,
         unbalance_phase,
         mis_type,
+        num_modes=12,
+        adaptive=False,
         print_progress=False,
     ):
         self.dt = dt
@@ -122,6 +129,8 @@ class MisalignmentFlex(Fault):
         self.speedF = speed
 
         self.mis_type = mis_type
+        self.num_modes = num_modes
+        self.adaptive = adaptive
         self.print_progress = print_progress
 
         if self.mis_type is None or self.mis_type == "parallel":
@@ -138,14 +147,13 @@ class MisalignmentFlex(Fault):
                 "The unbalance magnitude vector and phase must have the same size!"
             )
 
-    def run(self, rotor):
-        """Calculates the shaft angular position and the misalignment amount at X / Y directions.
+    def _initialize(self, rotor):
+        """Set the rotor dependent parameters of the fault.
 
         Parameters
         ----------
         rotor : ross.Rotor Object
              6 DoF rotor model.
-
         """
         self.rotor = rotor
         self.n_disk = len(self.rotor.disk_elements)
@@ -163,6 +171,17 @@ class MisalignmentFlex(Fault):
             self.ks * self.radius * np.sqrt(2 - 2 * np.cos(self.misalignment_angle))
         )
 
+    def run(self, rotor):
+        """Calculates the shaft angular position and the misalignment amount at X / Y directions.
+
+        Parameters
+        ----------
+        rotor : ross.Rotor Object
+             6 DoF rotor model.
+
+        """
+        self._initialize(rotor)
+
         # parameters for the time integration
         self.lambdat = 0.00001
         Faxial = 0
@@ -201,7 +220,7 @@ class MisalignmentFlex(Fault):
         self.Ksdt = self.rotor.Ksdt()
 
         _, ModMat = la.eigh(self.K, self.M)
-        ModMat = ModMat[:, :12]
+        ModMat = ModMat[:, : self.num_modes]
         self.ModMat = ModMat
 
         # Modal transformations
@@ -213,7 +232,6 @@ class MisalignmentFlex(Fault):
 
         # Omega = self.speedI * np.pi / 30
 
-        y0 = np.zeros(24)
         t_eval = np.arange(self.tI, self.tF + self.dt, self.dt)
         T = t_eval
 
@@ -260,21 +278,13 @@ class MisalignmentFlex(Fault):
 
         self.ft_modal = (self.ModMat.T).dot(self.forces).T
 
-        x = Integrator(
-            self.tI,
-            y0,
-            self.tF,
-            self.dt,
-            self._equation_of_movement,
-            self.print_progress,
-        )
-        x = x.rk45()
+        x = self._integrate("rk45")
         t2 = time.time()
         if self.print_progress:
             print(f"Time spent: {t2-t1} s")
 
-        self.displacement = x[:12, :]
-        self.velocity = x[12:, :]
+        self.displacement = x[: self.num_modes, :]
+        self.velocity = x[self.num_modes :, :]
         self.time_vector = t_eval
         self.response = self.ModMat.dot(self.displacement)
 
@@ -296,8 +306,8 @@ class MisalignmentFlex(Fault):
             Array of the new displacement and velocity, in the modal domain.
         """
 
-        positions = Y[:12]
-        velocity = Y[12:]  # velocity ign space state
+        positions = Y[: self.num_modes]
+        velocity = Y[self.num_modes :]  # velocity ign space state
 
         ftmodal = self.ft_modal[i]
 
@@ -311,12 +321,14 @@ class MisalignmentFlex(Fault):
 
         new_X_dot = velocity
 
-        new_Y = np.zeros(24)
-        new_Y[:12] = new_X_dot
-        new_Y[12:] = new_V_dot
+        new_Y = np.concatenate((new_X_dot, new_V_dot))
 
         return new_Y
 
+    def _fault_force(self, angle, disp, velc, speed):
+        """Misalignment force for a given state of the rotor (see Fault._fault_force())."""
+        return self._force(np.array([angle]))[:, 0]
+
     def _parallel(self, angular_position):
         """Reaction forces of parallel misalignment.
 
@@ -533,6 +545,11 @@ class MisalignmentRigid(Fault):
         Array with the unbalance magnitude. The unit is kg.m.
     unbalance_phase : array
         Array with the unbalance phase. The unit is rad.
+    num_modes : int, optional
+        Number of modes kept in the modal reduction, by default 12.
+    adaptive : bool, dict, optional
+        Set it True to integrate with adaptive time step (see Integrator.rkck()),
+        or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
     print_progress : bool
         Set it True, to print the time iterations and the total time spent.
         False by default.
@@ -571,6 +588,8 @@ class MisalignmentRigid(Fault):
         speed,
         unbalance_magnitude,
         unbalance_phase,
+        num_modes=12,
+        adaptive=False,
         print_progress=False,
     ):
         self.dt = dt
@@ -587,6 +606,8 @@ class MisalignmentRigid(Fault):
         self.unbalance_magnitude = unbalance_magnitude
         self.unbalance_phase = unbalance_phase
         self.DoF = np.arange((self.n1 * 6), (self.n2 * 6 + 6))
+        self.num_modes = num_modes
+        self.adaptive = adaptive
         self.print_progress = print_progress
 
         if len(self.unbalance_magnitude) != len(self.unbalance_phase):
@@ -594,14 +615,13 @@ class MisalignmentRigid(Fault):
                 "The unbalance magnitude vector and phase must have the same size!"
             )
 
-    def run(self, rotor):
-        """Calculates the shaft angular position and the misalignment amount at X directions.
+    def _initialize(self, rotor):
+        """Set the rotor dependent parameters of the fault.
 
         Parameters
         ----------
         rotor : ross.Rotor Object
              6 DoF rotor model.
-
         """
         self.rotor = rotor
         self.n_disk = len(self.rotor.disk_elements)
@@ -614,6 +634,34 @@ class MisalignmentRigid(Fault):
         for ii in range(self.n_disk):
             self.ndofd[ii] = (self.rotor.disk_elements[ii].n) * 6
 
+        K = self.rotor.K(self.speed)
+        self.kcoup_auxt = 1 / (
+            K[5 + 6 * self.n1, 5 + 6 * self.n1] + K[5 + 6 * self.n2, 5 + 6 * self.n2]
+        )
+
+        self.kCOUP = (K[6 * self.n1, 6 * self.n1] * K[6 * self.n2, 6 * self.n2]) / (
+            K[6 * self.n1, 6 * self.n1] + K[6 * self.n2, 6 * self.n2]
+        )
+
+        self.Kcoup_auxI = K[5 + 6 * self.n1, 5 + 6 * self.n1] / (
+            K[5 + 6 * self.n1, 5 + 6 * self.n1] + K[5 + 6 * self.n2, 5 + 6 * self.n2]
+        )
+
+        self.Kcoup_auxF = K[5 + 6 * self.n2, 5 + 6 * self.n2] / (
+            K[5 + 6 * self.n1, 5 + 6 * self.n1] + K[5 + 6 * self.n2, 5 + 6 * self.n2]
+        )
+
+    def run(self, rotor):
+        """Calculates the shaft angular position and the misalignment amount at X directions.
+
+        Parameters
+        ----------
+        rotor : ross.Rotor Object
+             6 DoF rotor model.
+
+        """
+        self._initialize(rotor)
+
         self.lambdat = 0.00001
         # Faxial = 0
         # TorqueI = 0
@@ -651,7 +699,7 @@ class MisalignmentRigid(Fault):
         self.Ksdt = self.rotor.Ksdt()
 
         _, ModMat = la.eigh(self.K, self.M)
-        ModMat = ModMat[:, :12]
+        ModMat = ModMat[:, : self.num_modes]
         self.ModMat = ModMat
 
         # Modal transformations
@@ -663,30 +711,10 @@ class MisalignmentRigid(Fault):
 
         self.angANG = -np.pi / 180
 
-        self.kcoup_auxt = 1 / (
-            self.K[5 + 6 * self.n1, 5 + 6 * self.n1]
-            + self.K[5 + 6 * self.n2, 5 + 6 * self.n2]
-        )
-
-        self.kCOUP = (
-            self.K[6 * self.n1, 6 * self.n1] * self.K[6 * self.n2, 6 * self.n2]
-        ) / (self.K[6 * self.n1, 6 * self.n1] + self.K[6 * self.n2, 6 * self.n2])
-
-        self.Kcoup_auxI = self.K[5 + 6 * self.n1, 5 + 6 * self.n1] / (
-            self.K[5 + 6 * self.n1, 5 + 6 * self.n1]
-            + self.K[5 + 6 * self.n2, 5 + 6 * self.n2]
-        )
-
-        self.Kcoup_auxF = self.K[5 + 6 * self.n2, 5 + 6 * self.n2] / (
-            self.K[5 + 6 * self.n1, 5 + 6 * self.n1]
-            + self.K[5 + 6 * self.n2, 5 + 6 * self.n2]
-        )
-
         FFmis = np.zeros(self.ndof)
 
         # Omega = self.speedI * np.pi / 30
 
-        y0 = np.zeros(24)
         t_eval = np.arange(self.tI, self.tF + self.dt, self.dt)
         T = t_eval
 
@@ -731,21 +759,13 @@ class MisalignmentRigid(Fault):
         self.inv_Mmodal = np.linalg.pinv(self.Mmodal)
         t1 = time.time()
 
-        x = Integrator(
-            self.tI,
-            y0,
-            self.tF,
-            self.dt,
-            self._equation_of_movement,
-            self.print_progress,
-        )
-        x = x.rk45()
+        x = self._integrate("rk45")
         t2 = time.time()
         if self.print_progress:
             print(f"Time spent: {t2-t1} s")
 
-        self.displacement = x[:12, :]
-        self.velocity = x[12:, :]
+        self.displacement = x[: self.num_modes, :]
+        self.velocity = x[self.num_modes :, :]
         self.time_vector = t_eval
         self.response = self.ModMat.dot(self.displacement)
 
@@ -766,8 +786,8 @@ class MisalignmentRigid(Fault):
         new_Y :  array
             Array of the new displacement and velocity, in the modal domain.
         """
-        positions = Y[:12]
-        velocity = Y[12:]  # velocity ign space state
+        positions = Y[: self.num_modes]
+        velocity = Y[self.num_modes :]  # velocity ign space state
 
         positionsFis = self.ModMat.dot(positions)
 
@@ -799,12 +819,44 @@ class MisalignmentRigid(Fault):
 
         new_X_dot = velocity
 
-        new_Y = np.zeros(24)
-        new_Y[:12] = new_X_dot
-        new_Y[12:] = new_V_dot
+        new_Y = np.concatenate((new_X_dot, new_V_dot))
 
         return new_Y
 
+    def _fault_force(self, angle, disp, velc, speed):
+        """Misalignment force for a given state of the rotor (see Fault._fault_force()).
+
+        The coupling angular position is found iterating its implicit relation with
+        the shaft displacements, starting from the shaft angular position, until
+        the change is below 1e-12 rad.
+        """
+        ang = angle
+        for _ in range(50):
+            ang_new = (
+                self.Kcoup_auxI * angle
+                + self.Kcoup_auxF * angle
+                + self.kCOUP
+                * self.kcoup_auxt
+                * self.eCOUP
+                * (
+                    -disp[0 + 6 * self.n1] * np.sin(ang)
+                    + disp[0 + 6 * self.n2] * np.sin(ang)
+                    + disp[1 + 6 * self.n1] * np.cos(ang)
+                    - disp[1 + 6 * self.n2] * np.cos(ang)
+                )
+            )
+            converged = abs(ang_new - ang) <= 1e-12
+            ang = ang_new
+            if converged:
+                break
+        else:
+            warn(
+                "The coupling angular position did not converge for the "
+                f"shaft angular position {angle} rad."
+            )
+
+        return self._parallel(disp, ang)[1]
+
     def _parallel(self, positions, fir):
         """Reaction forces of parallel misalignment.
 
@@ -2,12 +2,12 @@ import time
 
 import numpy as np
 from scipy import linalg as la
+from scipy.special import expit
 
 import ross
 from ross.units import Q_, check_units
 
 from .abs_fault import Fault
-from .integrate_solver import Integrator
 
 __all__ = [
     "Rubbing",
@@ -44,8 +44,16 @@ class Rubbing(Fault):
         Array with the unbalance phase. The unit is rad.
     torque : bool
         Set it as True to consider the torque provided by the rubbing, by default False.
+    num_modes : int, optional
+        Number of modes kept in the modal reduction, by default 12.
+    adaptive : bool, dict, optional
+        Set it True to integrate with adaptive time step (see Integrator.rkck()),
+        or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
     print_progress : bool
         Set it True, to print the time iterations and the total time spent, by default False.
+    contact_width : float, optional
+        Penetration, relative to deltaRUB, over which the contact is regularized in
+        the harmonic balance (see Fault.run_harmonic_balance()), by default 1e-3.
 
     Returns
     -------
@@ -82,7 +90,10 @@ class Rubbing(Fault):
         unbalance_magnitude,
         unbalance_phase,
         torque=False,
+        num_modes=12,
+        adaptive=False,
         print_progress=False,
+        contact_width=1e-3,
     ):
         self.dt = dt
         self.tI = tI
@@ -99,23 +110,24 @@ class Rubbing(Fault):
         self.torque = torque
         self.unbalance_magnitude = unbalance_magnitude
         self.unbalance_phase = unbalance_phase
+        self.num_modes = num_modes
+        self.adaptive = adaptive
         self.print_progress = print_progress
+        self.contact_width = contact_width
 
         if len(self.unbalance_magnitude) != len(self.unbalance_phase):
             raise Exception(
                 "The unbalance magnitude vector and phase must have the same size!"
             )
 
-    def run(self, rotor):
-        """Calculates the shaft angular position and the unbalance forces at X / Y directions.
+    def _initialize(self, rotor):
+        """Set the rotor dependent parameters of the fault.
 
         Parameters
         ----------
         rotor : ross.Rotor Object
              6 DoF rotor model.
-
         """
-
         self.rotor = rotor
         self.n_disk = len(self.rotor.disk_elements)
         if self.n_disk != len(self.unbalance_magnitude):
@@ -129,6 +141,17 @@ class Rubbing(Fault):
         for ii in range(self.n_disk):
             self.ndofd[ii] = (self.rotor.disk_elements[ii].n) * 6
 
+    def run(self, rotor):
+        """Calculates the shaft angular position and the unbalance forces at X / Y directions.
+
+        Parameters
+        ----------
+        rotor : ross.Rotor Object
+             6 DoF rotor model.
+
+        """
+        self._initialize(rotor)
+
         self.lambdat = 0.00001
         # Faxial = 0
         # TorqueI = 0
@@ -162,8 +185,9 @@ class Rubbing(Fault):
 
         V1, ModMat = la.eigh(self.K, self.M)
 
-        ModMat = ModMat[:, :12]
+        ModMat = ModMat[:, : self.num_modes]
         self.ModMat = ModMat
+        self.ModMat_rub = ModMat[self.DoF]
 
         # Modal transformations
         self.Mmodal = ((ModMat.T).dot(self.M)).dot(ModMat)
@@ -172,7 +196,6 @@ class Rubbing(Fault):
         self.Kmodal = ((ModMat.T).dot(self.K)).dot(ModMat)
         self.Ksdtmodal = ((ModMat.T).dot(self.Ksdt)).dot(ModMat)
 
-        y0 = np.zeros(24)
         t_eval = np.arange(self.tI, self.tF + self.dt, self.dt)
         # t_eval = np.arange(self.tI, self.tF, self.dt)
         T = t_eval
@@ -218,21 +241,13 @@ class Rubbing(Fault):
         self.inv_Mmodal = np.linalg.pinv(self.Mmodal)
         t1 = time.time()
 
-        x = Integrator(
-            self.tI,
-            y0,
-            self.tF,
-            self.dt,
-            self._equation_of_movement,
-            self.print_progress,
-        )
-        x = x.rk4()
+        x = self._integrate("rk4")
         t2 = time.time()
         if self.print_progress:
             print(f"Time spent: {t2-t1} s")
 
-        self.displacement = x[:12, :]
-        self.velocity = x[12:, :]
+        self.displacement = x[: self.num_modes, :]
+        self.velocity = x[self.num_modes :, :]
         self.time_vector = t_eval
         self.response = self.ModMat.dot(self.displacement)
 
@@ -254,15 +269,16 @@ class Rubbing(Fault):
             Array of the new displacement and velocity, in the modal domain.
         """
 
-        positions = Y[:12]
-        velocity = Y[12:]  # velocity in space state
+        positions = Y[: self.num_modes]
+        velocity = Y[self.num_modes :]  # velocity in space state
 
-        positionsFis = self.ModMat.dot(positions)
-        velocityFis = self.ModMat.dot(velocity)
+        # the rubbing force only depends on the rubbing node
+        positionsFis = self.ModMat_rub.dot(positions)
+        velocityFis = self.ModMat_rub.dot(velocity)
 
-        Frub, ft = self._rub(positionsFis, velocityFis, self.Omega[i])
-        self.forces_rub[:, i] = ft
-        ftmodal = (self.ModMat.T).dot(ft)
+        ft = self._rub(positionsFis, velocityFis, self.Omega[i])
+        self.forces_rub[self.DoF, i] = ft
+        ftmodal = (self.ModMat_rub.T).dot(ft)
 
         # proper equation of movement to be integrated in time
         new_V_dot = (
@@ -274,37 +290,92 @@ class Rubbing(Fault):
 
         new_X_dot = velocity
 
-        new_Y = np.zeros(24)
-        new_Y[:12] = new_X_dot
-        new_Y[12:] = new_V_dot
+        new_Y = np.concatenate((new_X_dot, new_V_dot))
 
         return new_Y
 
+    def _fault_force(self, angle, disp, velc, speed):
+        """Rubbing force for a given state of the rotor (see Fault._fault_force()).
+
+        The contact law of Rubbing._rub() is regularized over a penetration of
+        contact_width * deltaRUB, so that the force is a smooth function of the
+        state and the Newton iterations of the harmonic balance converge across
+        the contact onset.
+        """
+        ii = self.DoF[0]  # x direction of the rubbing node
+        x, y = disp[ii], disp[ii + 1]
+        vx, vy = velc[ii], velc[ii + 1]
+
+        radial_displ = np.hypot(x, y)
+        width = self.contact_width * self.deltaRUB
+        penetration = (radial_displ - self.deltaRUB) / width
+
+        # smooth approximations of max(radial_displ - deltaRUB, 0), of the
+        # contact indicator and of abs()
+        F_k = (
+            -self.kRUB
+            * width
+            * np.logaddexp(0, penetration)
+            * np.array([x, y])
+            / max(radial_displ, width)
+        )
+        F_c = -self.cRUB * expit(penetration) * np.array([vx, vy])
+        force_width = self.kRUB * width
+        F_n = np.hypot(F_k + F_c, force_width) - force_width
+
+        phi_angle = np.arctan2(y, x)
+        Vt = -vy * np.sin(phi_angle) + vx * np.cos(phi_angle)
+        F_f = np.sign(Vt + speed * self.radius) * self.miRUB * F_n * [-1, 1]
+
+        force = np.zeros(self.ndof)
+        force[ii : ii + 2] = F_k + F_c + F_f
+        if self.torque:
+            force[ii + 5] = self.radius * np.hypot(*F_f) * x / max(radial_displ, width)
+
+        return force
+
     def _rub(self, positionsFis, velocityFis, ang):
-        self.F_k = np.zeros(self.ndof)
-        self.F_c = np.zeros(self.ndof)
-        self.F_f = np.zeros(self.ndof)
+        """Calculates the rubbing force on the rubbing node.
+
+        Parameters
+        ----------
+        positionsFis : numpy.ndarray
+            Displacements of the 6 degrees of freedom of the rubbing node.
+        velocityFis : numpy.ndarray
+            Velocities of the 6 degrees of freedom of the rubbing node.
+        ang : float
+            Rotor speed.
+
+        Returns
+        -------
+        Frub : numpy.ndarray
+            Force on the 6 degrees of freedom of the rubbing node.
+        """
+        self.F_k = np.zeros(6)
+        self.F_c = np.zeros(6)
+        self.F_f = np.zeros(6)
 
         self.y = np.concatenate((positionsFis, velocityFis))
 
-        ii = 0 + 6 * self.posRUB  # rubbing position
+        ii = 0  # x direction of the rubbing node
+        nv = 6  # offset of the velocities in y
 
         self.radial_displ_node = np.sqrt(
             self.y[ii] ** 2 + self.y[ii + 1] ** 2
         )  # radial displacement
         self.radial_displ_vel_node = np.sqrt(
-            self.y[ii + self.ndof] ** 2 + self.y[ii + 1 + self.ndof] ** 2
+            self.y[ii + nv] ** 2 + self.y[ii + 1 + nv] ** 2
         )  # velocity
         self.phi_angle = np.arctan2(self.y[ii + 1], self.y[ii])
 
         if self.radial_displ_node >= self.deltaRUB:
             self.F_k[ii] = self._stiffness_force(self.y[ii])
             self.F_k[ii + 1] = self._stiffness_force(self.y[ii + 1])
-            self.F_c[ii] = self._damping_force(self.y[ii + self.ndof])
-            self.F_c[ii + 1] = self._damping_force(self.y[ii + 1 + self.ndof])
+            self.F_c[ii] = self._damping_force(self.y[ii + nv])
+            self.F_c[ii + 1] = self._damping_force(self.y[ii + 1 + nv])
 
-            Vt = -self.y[ii + self.ndof + 1] * np.sin(self.phi_angle) + self.y[
-                ii + self.ndof
+            Vt = -self.y[ii + nv + 1] * np.sin(self.phi_angle) + self.y[
+                ii + nv
             ] * np.cos(self.phi_angle)
 
             if Vt + ang * self.radius > 0:
@@ -421,14 +492,11 @@ class Rubbing(Fault):
         Returns
         -------
         Frub : numpy.ndarray
-            Final force vector for each degree of freedom.
-        FFrub : numpy.ndarray
-            Final force vector.
+            Final force vector for each degree of freedom of the rubbing node.
         """
-        Frub = F_k[self.DoF] + F_c[self.DoF] + F_f[self.DoF]
-        FFrub = F_k + F_c + F_f
+        Frub = F_k + F_c + F_f
 
-        return Frub, FFrub
+        return Frub
 
     @property
     def forces(self):
@@ -38,6 +38,185 @@ __all__ = [
 ]
 
 
+def _lazy_attribute(name, calculate):
+    """Attribute calculated on first access.
+
+    The value is cached in the instance __dict__ under the same name. While it
+    is None, reading the attribute calls the method `calculate`, which must
+    assign it.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name.
+    calculate : str
+        Name of the method that calculates the attribute.
+
+    Returns
+    -------
+    property
+    """
+
+    def fget(self):
+        if self.__dict__.get(name) is None:
+            getattr(self, calculate)()
+        return self.__dict__[name]
+
+    def fset(self, value):
+        self.__dict__[name] = value
+
+    return property(fget, fset)
+
+
+def _orbit_axes(ru_e, rv_e):
+    """Minor and major axes and kappa of orbits (vectorized).
+
+    See Orbit for the definitions. The eigenvalues of H = T @ T.T are
+    obtained in closed form, using trace(H) = ru**2 + rv**2 and
+    sqrt(det(H)) = minor * major = ru * rv * |sin(nu - nv)|.
+
+    Parameters
+    ----------
+    ru_e, rv_e : complex, array
+        Response in the x and y directions. Arrays are broadcast.
+
+    Returns
+    -------
+    minor, major, kappa : float, array
+        Minor axis, major axis and kappa of each orbit.
+
+    Examples
+    --------
+    >>> minor, major, kappa = _orbit_axes(np.array([1 + 1j, 1 - 1j]), 1 - 1j)
+    >>> kappa
+    array([1., 0.])
+    """
+    ru = np.absolute(ru_e)
+    rv = np.absolute(rv_e)
+    nu = np.angle(ru_e)
+    nv = np.angle(rv_e)
+    diff = nv - nu
+
+    trace = ru**2 + rv**2
+    det = ru * rv * np.abs(np.sin(diff))
+    major = np.sqrt((trace + np.sqrt(np.maximum(trace**2 - 4 * det**2, 0))) / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        minor = np.where(major > 0, det / major, 0.0)
+        kappa = minor / major
+
+    # we need to evaluate if 0 < nv - nu < pi.
+    diff = np.where(diff < -np.pi, diff + 2 * np.pi, diff)
+    diff = np.where(diff > np.pi, diff - 2 * np.pi, diff)
+
+    # if nv = nu or nv = nu + pi then the response is a straight line.
+    # if 0 < nv - nu < pi, then a backward rotating mode exists.
+    kappa = np.where((diff == 0) | (diff == np.pi), 0.0, kappa)
+    kappa = np.where((0 < diff) & (diff < np.pi), -kappa, kappa)
+
+    return minor, major, kappa
+
+
+def _orbit_major_point(ru_e, rv_e):
+    """Position and angle of the major axis of orbits (vectorized).
+
+    The major axis is searched on the first half of a 360 points
+    discretization of the orbit, as in Orbit.
+
+    Parameters
+    ----------
+    ru_e, rv_e : complex, array
+        Response in the x and y directions. Arrays are broadcast.
+
+    Returns
+    -------
+    major_x, major_y, major_angle : float, array
+        Coordinates and angle (0 to 2 pi) of the major axis.
+    """
+    ru_e, rv_e = np.broadcast_arrays(ru_e, rv_e)
+    circle = np.exp(1j * np.linspace(0, 2 * np.pi, 360)[:180])
+    x = np.real(np.multiply.outer(ru_e, circle))
+    y = np.real(np.multiply.outer(rv_e, circle))
+
+    index = np.argmax(np.sqrt(x**2 + y**2), axis=-1)[..., np.newaxis]
+    major_x = np.take_along_axis(x, index, axis=-1)[..., 0]
+    major_y = np.take_along_axis(y, index, axis=-1)[..., 0]
+    major_angle = np.arctan2(major_y, major_x)
+    major_angle = np.where(major_angle < 0, major_angle + 2 * np.pi, major_angle)
+
+    return major_x, major_y, major_angle
+
+
+def _normalize_modes(modes, number_dof):
+    """Normalize mode shapes as Shape(normalize=True) does.
+
+    Each mode (column) is divided by its largest x or y component.
+
+    Parameters
+    ----------
+    modes : array
+        Complex array with shape (..., ndof, n_modes).
+    number_dof : int
+        Number of degrees of freedom per node.
+
+    Returns
+    -------
+    modes : array
+        Normalized modes.
+    """
+    modex = modes[..., 0::number_dof, :]
+    modey = modes[..., 1::number_dof, :]
+    ixmax = np.argmax(np.abs(modex), axis=-2)[..., np.newaxis, :]
+    iymax = np.argmax(np.abs(modey), axis=-2)[..., np.newaxis, :]
+    xmax = np.take_along_axis(modex, ixmax, axis=-2)
+    ymax = np.take_along_axis(modey, iymax, axis=-2)
+
+    return modes / np.where(np.abs(ymax) > np.abs(xmax), ymax, xmax)
+
+
+def _modes_axes(modes, nodes, number_dof):
+    """Orbit axes and kappa for all nodes and modes.
+
+    Parameters
+    ----------
+    modes : array
+        Complex array with the mode shapes (columns), with shape
+        (..., ndof, n_modes). Leading dimensions (e.g. speeds) are kept.
+    nodes : list
+        List of nodes number.
+    number_dof : int
+        Number of degrees of freedom per node.
+
+    Returns
+    -------
+    minor, major, kappa : array
+        Arrays with shape (..., n_nodes, n_modes).
+    """
+    modes = _normalize_modes(np.asarray(modes), number_dof)
+    dofs = number_dof * np.asarray(nodes)
+
+    return _orbit_axes(modes[..., dofs, :], modes[..., dofs + 1, :])
+
+
+def _whirl_direction(kappa):
+    """Whirl direction from kappa values (vectorized).
+
+    Parameters
+    ----------
+    kappa : array
+        Kappa values with shape (..., n_nodes, n_modes).
+
+    Returns
+    -------
+    whirl : array
+        Array of strings with shape (..., n_modes) with "Forward", "Backward"
+        or "Mixed", following ModalResults.whirl().
+    """
+    forward = np.all(kappa >= -1e-3, axis=-2)
+    backward = np.all(kappa <= 1e-3, axis=-2)
+
+    return np.where(forward, "Forward", np.where(backward, "Backward", "Mixed"))
+
+
 class Results(ABC):
     """Results class.
 
@@ -258,45 +437,16 @@ class Orbit(Results):
         self.major_angle = self.angle[self.major_index]
         self.minor_angle = self.major_angle + np.pi / 2
 
-        # calculate T matrix
-        ru = np.absolute(ru_e)
-        rv = np.absolute(rv_e)
-
-        nu = np.angle(ru_e)
-        nv = np.angle(rv_e)
-        self.nu = nu
-        self.nv = nv
-        # fmt: off
-        T = np.array([[ru * np.cos(nu), -ru * np.sin(nu)],
-                      [rv * np.cos(nv), -rv * np.sin(nv)]])
-        # fmt: on
-        H = T @ T.T
+        self.nu = np.angle(ru_e)
+        self.nv = np.angle(rv_e)
 
-        lam = la.eig(H)[0]
-        # lam is the eigenvalue -> sqrt(lam) is the minor/major axis.
+        # the eigenvalues of H = T.T^T are the squared minor/major axes and
         # kappa encodes the relation between the axis and the precession.
-        minor = np.sqrt(lam.min())
-        major = np.sqrt(lam.max())
-        kappa = minor / major
-        diff = nv - nu
-
-        # we need to evaluate if 0 < nv - nu < pi.
-        if diff < -np.pi:
-            diff += 2 * np.pi
-        elif diff > np.pi:
-            diff -= 2 * np.pi
-
-        # if nv = nu or nv = nu + pi then the response is a straight line.
-        if diff == 0 or diff == np.pi:
-            kappa = 0
+        minor, major, kappa = _orbit_axes(ru_e, rv_e)
 
-        # if 0 < nv - nu < pi, then a backward rotating mode exists.
-        elif 0 < diff < np.pi:
-            kappa *= -1
-
-        self.minor_axis = np.real(minor)
-        self.major_axis = np.real(major)
-        self.kappa = np.real(kappa)
+        self.minor_axis = minor[()]
+        self.major_axis = major[()]
+        self.kappa = kappa[()]
         self.whirl = "Forward" if self.kappa > 0 else "Backward"
         self.color = (
             tableau_colors["blue"] if self.whirl == "Forward" else tableau_colors["red"]
@@ -418,8 +568,22 @@ class Shape(Results):
         self.yn = None
         self.zn = None
         self.major_axis = None
+        self.major_x = None
+        self.major_y = None
+        self.major_angle = None
         self._classify()
-        self._calculate()
+
+    # orbits and shape lines are only calculated when accessed
+    orbits = _lazy_attribute("orbits", "_calculate_orbits")
+    whirl = _lazy_attribute("whirl", "_calculate_whirl")
+    color = _lazy_attribute("color", "_calculate_whirl")
+    xn = _lazy_attribute("xn", "_calculate")
+    yn = _lazy_attribute("yn", "_calculate")
+    zn = _lazy_attribute("zn", "_calculate")
+    major_axis = _lazy_attribute("major_axis", "_calculate")
+    major_x = _lazy_attribute("major_x", "_calculate")
+    major_y = _lazy_attribute("major_y", "_calculate")
+    major_angle = _lazy_attribute("major_angle", "_calculate")
 
     def _classify(self):
         self.mode_type = "Lateral"
@@ -439,19 +603,22 @@ class Shape(Results):
 
     def _calculate_orbits(self):
         orbits = []
-        whirl = []
         for node, node_pos in zip(self.nodes, self.nodes_pos):
             ru_e, rv_e = self._evec[self.number_dof * node : self.number_dof * node + 2]
             orbit = Orbit(node=node, node_pos=node_pos, ru_e=ru_e, rv_e=rv_e)
             orbits.append(orbit)
-            whirl.append(orbit.whirl)
 
         self.orbits = orbits
-        # check shape whirl
-        if all(w == "Forward" for w in whirl):
+
+    def _calculate_whirl(self):
+        dofs = self.number_dof * np.asarray(self.nodes)
+        kappa = _orbit_axes(self._evec[dofs], self._evec[dofs + 1])[2]
+
+        # check shape whirl (each orbit is forward if kappa > 0)
+        if np.all(kappa > 0):
             self.whirl = "Forward"
             self.color = tableau_colors["blue"]
-        elif all(w == "Backward" for w in whirl):
+        elif np.all(kappa <= 0):
             self.whirl = "Backward"
             self.color = tableau_colors["red"]
         else:
@@ -465,9 +632,6 @@ class Shape(Results):
         nodes_pos = self.nodes_pos
         num_dof = self.number_dof
 
-        # calculate each orbit
-        self._calculate_orbits()
-
         # plot lines
         nn = 5  # number of points in each line between nodes
         zeta = np.linspace(0, 1, nn)
@@ -481,10 +645,6 @@ class Shape(Results):
         xn_complex = np.zeros(nn * (len(nodes) - 1), dtype=np.complex128)
         yn_complex = np.zeros(nn * (len(nodes) - 1), dtype=np.complex128)
         zn = np.zeros(nn * (len(nodes) - 1))
-        major = np.zeros(nn * (len(nodes) - 1))
-        major_x = np.zeros(nn * (len(nodes) - 1))
-        major_y = np.zeros(nn * (len(nodes) - 1))
-        major_angle = np.zeros(nn * (len(nodes) - 1))
 
         N1 = onn - 3 * zeta**2 + 2 * zeta**3
         N2 = zeta - 2 * zeta**2 + zeta**3
@@ -517,15 +677,12 @@ class Shape(Results):
             yn[pos0:pos1] = Ny @ evec[yy].real
             zn[pos0:pos1] = (node_pos * onn + Le * zeta).reshape(nn)
 
-            # major axes calculation
             xn_complex[pos0:pos1] = Nx @ evec[xx]
             yn_complex[pos0:pos1] = Ny @ evec[yy]
-            for i in range(pos0, pos1):
-                orb = Orbit(node=0, node_pos=0, ru_e=xn_complex[i], rv_e=yn_complex[i])
-                major[i] = orb.major_axis
-                major_x[i] = orb.major_x
-                major_y[i] = orb.major_y
-                major_angle[i] = orb.major_angle
+
+        # major axes calculation
+        major = _orbit_axes(xn_complex, yn_complex)[1]
+        major_x, major_y, major_angle = _orbit_major_point(xn_complex, yn_complex)
 
         self.xn = xn
         self.yn = yn
@@ -891,25 +1048,37 @@ class ModalResults(Results):
         self.shaft_elements_length = shaft_elements_length
         self.number_dof = number_dof
         self.modes = self.evectors[: self.ndof]
-        self.shapes = []
-        kappa_modes = []
-        for mode in range(len(self.wn)):
-            self.shapes.append(
-                Shape(
-                    vector=self.modes[:, mode],
-                    nodes=self.nodes,
-                    nodes_pos=self.nodes_pos,
-                    shaft_elements_length=self.shaft_elements_length,
-                    normalize=True,
-                    number_dof=self.number_dof,
-                )
+        self.shapes = None
+        self.kappa_modes = None
+        self._orbit_axes = None
+
+    # mode shapes are only calculated when accessed
+    shapes = _lazy_attribute("shapes", "_calculate_shapes")
+    kappa_modes = _lazy_attribute("kappa_modes", "_calculate_kappa_modes")
+    _orbit_axes = _lazy_attribute("_orbit_axes", "_calculate_orbit_axes")
+
+    def _calculate_orbit_axes(self):
+        # minor axis, major axis and kappa for all nodes (rows) and modes
+        self._orbit_axes = _modes_axes(
+            self.modes[:, : len(self.wn)], self.nodes, self.number_dof
+        )
+
+    def _calculate_shapes(self):
+        self.shapes = [
+            Shape(
+                vector=self.modes[:, mode],
+                nodes=self.nodes,
+                nodes_pos=self.nodes_pos,
+                shaft_elements_length=self.shaft_elements_length,
+                normalize=True,
+                number_dof=self.number_dof,
             )
-            kappa_color = []
-            kappa_mode = self.kappa_mode(mode)
-            for kappa in kappa_mode:
-                kappa_color.append("blue" if kappa > 0 else "red")
-            kappa_modes.append(kappa_color)
-        self.kappa_modes = kappa_modes
+            for mode in range(len(self.wn))
+        ]
+
+    def _calculate_kappa_modes(self):
+        kappa = self._orbit_axes[2]
+        self.kappa_modes = np.where(kappa > 0, "blue", "red").T.tolist()
 
     @staticmethod
     def whirl(kappa_mode):
@@ -1009,11 +1178,13 @@ class ModalResults(Results):
         else:
             nat_freq = self.wn[w]
 
+        minor, major, kappa = self._orbit_axes
+
         k = {
             "Frequency": nat_freq,
-            "Minor axis": self.shapes[w].orbits[node].minor_axis,
-            "Major axis": self.shapes[w].orbits[node].major_axis,
-            "kappa": self.shapes[w].orbits[node].kappa,
+            "Minor axis": minor[node, w],
+            "Major axis": major[node, w],
+            "kappa": kappa[node, w],
         }
 
         return k
@@ -1038,7 +1209,7 @@ class ModalResults(Results):
             A list with the value of kappa for each node related
             to the mode/natural frequency of interest.
         """
-        kappa_mode = [orb.kappa for orb in self.shapes[w].orbits]
+        kappa_mode = list(self._orbit_axes[2][:, w])
         return kappa_mode
 
     def whirl_direction(self):
@@ -1051,10 +1222,7 @@ class ModalResults(Results):
             to the kappa_mode. Backward, Mixed or Forward depending on values
             of kappa_mode.
         """
-        # whirl direction/values are methods because they are expensive.
-        whirl_w = [self.whirl(self.kappa_mode(wd)) for wd in range(len(self.wd))]
-
-        return np.array(whirl_w)
+        return _whirl_direction(self._orbit_axes[2])[: len(self.wd)]
 
     def whirl_values(self):
         r"""Get the whirl value (0., 0.5, or 1.) for each frequency.
@@ -1107,8 +1275,12 @@ class ModalResults(Results):
         data["wn"] = Q_(self.wn[mode], "rad/s").to(frequency_units).m
         data["speed"] = Q_(self.speed, "rad/s").to(frequency_units).m
 
+        shape = self.shapes[mode]
+        # make sure lazy attributes are calculated before exporting them
+        shape.orbits, shape.xn
+
         data[mode] = {}
-        for _key, _values in self.shapes[mode].__dict__.items():
+        for _key, _values in shape.__dict__.items():
             data[mode][_key] = _values
 
         df = pd.DataFrame(data)
@@ -1404,6 +1576,15 @@ class CampbellResults(Results):
         Array with the whirl values (0, 0.5 or 1)
     modal_results : dict
         Dictionary with the modal results for each speed in the speed range.
+    mac : array, optional
+        Array with the modal assurance criterion between each tracked mode and
+        the same mode at the previous speed. Only available when the modes are
+        tracked (see Rotor.run_campbell()).
+        Default is None.
+    mode_index : array, optional
+        Array with the index, in the modal results of each speed, of the mode
+        in each column of the results. Default is None, meaning that the
+        columns follow the modal results order.
 
     Returns
     -------
@@ -1421,6 +1602,8 @@ class CampbellResults(Results):
         modal_results,
         number_dof,
         run_modal,
+        mac=None,
+        mode_index=None,
     ):
         self.speed_range = speed_range
         self.wd = wd
@@ -1430,6 +1613,8 @@ class CampbellResults(Results):
         self.modal_results = modal_results
         self.number_dof = number_dof
         self.run_modal = run_modal
+        self.mac = mac
+        self.mode_index = mode_index
 
     @check_units
     def plot(
@@ -1580,9 +1765,19 @@ class CampbellResults(Results):
                 whirl_i = whirl[:, i]
                 damping_values_i = damping_values[:, i]
 
-                mode_shape = np.array(
-                    [self.modal_results[j].shapes[i].mode_type for j in speed_range]
-                )
+                if self.mode_index is None:
+                    mode_shape = np.array(
+                        [self.modal_results[j].shapes[i].mode_type for j in speed_range]
+                    )
+                else:
+                    mode_shape = np.array(
+                        [
+                            self.modal_results[w]
+                            .shapes[self.mode_index[j, i]]
+                            .mode_type
+                            for j, w in enumerate(speed_range)
+                        ]
+                    )
                 mode_mask_g = np.array([mode in legends for mode in mode_shape])
 
                 mode_mask = mode_shape == legend
@@ -1841,14 +2036,22 @@ class FrequencyResponseResults(Results):
     ----------
     freq_resp : array
         Array with the frequency response (displacement).
-    velc_resp : array
+    velc_resp : array, None
         Array with the frequency response (velocity).
-    accl_resp : array
+        If None, it is calculated from freq_resp when accessed.
+    accl_resp : array, None
         Array with the frequency response (acceleration).
+        If None, it is calculated from freq_resp when accessed.
     speed_range : array
         Array with the speed range in rad/s.
     number_dof : int
         Number of degrees of freedom per node.
+    inputs : array, optional
+        Global dofs stored in the first axis of the response arrays.
+        Default is None (all dofs).
+    outputs : array, optional
+        Global dofs stored in the second axis of the response arrays.
+        Default is None (all dofs).
 
     Returns
     -------
@@ -1856,18 +2059,80 @@ class FrequencyResponseResults(Results):
         Plotly figure with Amplitude vs Frequency and Phase vs Frequency plots.
     """
 
-    def __init__(self, freq_resp, velc_resp, accl_resp, speed_range, number_dof):
+    def __init__(
+        self,
+        freq_resp,
+        velc_resp,
+        accl_resp,
+        speed_range,
+        number_dof,
+        inputs=None,
+        outputs=None,
+    ):
         self.freq_resp = freq_resp
         self.velc_resp = velc_resp
         self.accl_resp = accl_resp
         self.speed_range = speed_range
         self.number_dof = number_dof
+        self.inputs = inputs
+        self.outputs = outputs
 
         if self.number_dof == 4:
             self.dof_dict = {"0": "x", "1": "y", "2": "α", "3": "β"}
         elif self.number_dof == 6:
             self.dof_dict = {"0": "x", "1": "y", "2": "z", "3": "α", "4": "β", "5": "θ"}
 
+    @property
+    def velc_resp(self):
+        """Frequency response (velocity), i * w * H."""
+        if self._velc_resp is None:
+            return 1j * np.asarray(self.speed_range) * self.freq_resp
+        return self._velc_resp
+
+    @velc_resp.setter
+    def velc_resp(self, value):
+        self._velc_resp = value
+
+    @property
+    def accl_resp(self):
+        """Frequency response (acceleration), -w**2 * H."""
+        if self._accl_resp is None:
+            return -(np.asarray(self.speed_range) ** 2) * self.freq_resp
+        return self._accl_resp
+
+    @accl_resp.setter
+    def accl_resp(self, value):
+        self._accl_resp = value
+
+    def _index(self, inp, out):
+        """Position of the global dofs inp and out in the response arrays.
+
+        Parameters
+        ----------
+        inp : int
+            Input global dof.
+        out : int
+            Output global dof.
+
+        Returns
+        -------
+        i, o : int
+            Indexes for the first and second axes of freq_resp.
+        """
+        index = []
+        for dof, dofs, name in [(inp, self.inputs, "inp"), (out, self.outputs, "out")]:
+            if dofs is None:
+                index.append(dof)
+            elif dof in dofs:
+                index.append(list(dofs).index(dof))
+            else:
+                raise ValueError(
+                    f"{name}={dof} was not stored in the results. "
+                    f"Available dofs are {list(dofs)}."
+                )
+
+        return tuple(index)
+
     def plot_magnitude(
         self,
         inp,
@@ -1920,19 +2185,20 @@ class FrequencyResponseResults(Results):
         idof = self.dof_dict[str(inp % self.number_dof)]
         outn = out // self.number_dof
         odof = self.dof_dict[str(out % self.number_dof)]
+        i, o = self._index(inp, out)
 
         frequency_range = Q_(self.speed_range, "rad/s").to(frequency_units).m
 
         dummy_var = Q_(1, amplitude_units)
         y_label = "Magnitude"
         if dummy_var.check("[length]/[force]"):
-            mag = np.abs(self.freq_resp)
+            mag = np.abs(self.freq_resp[i, o, :])
             mag = Q_(mag, "m/N").to(amplitude_units).m
         elif dummy_var.check("[speed]/[force]"):
-            mag = np.abs(self.velc_resp)
+            mag = np.abs(self.velc_resp[i, o, :])
             mag = Q_(mag, "m/s/N").to(amplitude_units).m
         elif dummy_var.check("[acceleration]/[force]"):
-            mag = np.abs(self.accl_resp)
+            mag = np.abs(self.accl_resp[i, o, :])
             mag = Q_(mag, "m/s**2/N").to(amplitude_units).m
         else:
             raise ValueError(
@@ -1946,7 +2212,7 @@ class FrequencyResponseResults(Results):
         fig.add_trace(
             go.Scatter(
                 x=frequency_range,
-                y=mag[inp, out, :],
+                y=mag,
                 mode="lines",
                 line=dict(color=list(tableau_colors)[idx]),
                 name=f"inp: node {inpn} | dof: {idof}<br>out: node {outn} | dof: {odof}",
@@ -2020,16 +2286,17 @@ class FrequencyResponseResults(Results):
         idof = self.dof_dict[str(inp % self.number_dof)]
         outn = out // self.number_dof
         odof = self.dof_dict[str(out % self.number_dof)]
+        i, o = self._index(inp, out)
 
         frequency_range = Q_(self.speed_range, "rad/s").to(frequency_units).m
 
         dummy_var = Q_(1, amplitude_units)
         if dummy_var.check("[length]/[force]"):
-            phase = np.angle(self.freq_resp[inp, out, :])
+            phase = np.angle(self.freq_resp[i, o, :])
         elif dummy_var.check("[speed]/[force]"):
-            phase = np.angle(self.velc_resp[inp, out, :])
+            phase = np.angle(self.velc_resp[i, o, :])
         elif dummy_var.check("[acceleration]/[force]"):
-            phase = np.angle(self.accl_resp[inp, out, :])
+            phase = np.angle(self.accl_resp[i, o, :])
         else:
             raise ValueError(
                 "Not supported unit. Options are '[length]/[force]', '[speed]/[force]', '[acceleration]/[force]'"
@@ -2127,24 +2394,25 @@ class FrequencyResponseResults(Results):
         idof = self.dof_dict[str(inp % self.number_dof)]
         outn = out // self.number_dof
         odof = self.dof_dict[str(out % self.number_dof)]
+        i, o = self._index(inp, out)
 
         frequency_range = Q_(self.speed_range, "rad/s").to(frequency_units).m
 
         dummy_var = Q_(1, amplitude_units)
         if dummy_var.check("[length]/[force]"):
-            mag = np.abs(self.freq_resp[inp, out, :])
+            mag = np.abs(self.freq_resp[i, o, :])
             mag = Q_(mag, "m/N").to(amplitude_units).m
-            phase = np.angle(self.freq_resp[inp, out, :])
+            phase = np.angle(self.freq_resp[i, o, :])
             y_label = "Displacement"
         elif dummy_var.check("[speed]/[force]"):
-            mag = np.abs(self.velc_resp[inp, out, :])
+            mag = np.abs(self.velc_resp[i, o, :])
             mag = Q_(mag, "m/s/N").to(amplitude_units).m
-            phase = np.angle(self.velc_resp[inp, out, :])
+            phase = np.angle(self.velc_resp[i, o, :])
             y_label = "Velocity"
         elif dummy_var.check("[acceleration]/[force]"):
-            mag = np.abs(self.accl_resp[inp, out, :])
+            mag = np.abs(self.accl_resp[i, o, :])
             mag = Q_(mag, "m/s**2/N").to(amplitude_units).m
-            phase = np.angle(self.accl_resp[inp, out, :])
+            phase = np.angle(self.accl_resp[i, o, :])
             y_label = "Acceleration"
         else:
             raise ValueError(
@@ -4505,6 +4773,9 @@ class TimeResponseResults(Results):
         System response.
     xout : array
         Time evolution of the state vector.
+    dofs : array_like, optional
+        Rotor dofs corresponding to the columns of yout, if only some of the
+        dofs were recorded. Default is None (all dofs).
 
     Returns
     -------
@@ -4512,11 +4783,37 @@ class TimeResponseResults(Results):
         The figure object with the plot.
     """
 
-    def __init__(self, rotor, t, yout, xout):
+    def __init__(self, rotor, t, yout, xout, dofs=None):
         self.t = t
         self.yout = yout
         self.xout = xout
         self.rotor = rotor
+        self.dofs = dofs
+
+    def _response(self, dof):
+        """Time response of a rotor dof.
+
+        Parameters
+        ----------
+        dof : int
+            Global index of the dof.
+
+        Returns
+        -------
+        response : array
+            Column of yout corresponding to the dof.
+        """
+        if self.dofs is None:
+            return self.yout[:, dof]
+
+        try:
+            column = list(self.dofs).index(dof)
+        except ValueError:
+            raise ValueError(
+                f"The dof {dof} was not recorded in the time response."
+            ) from None
+
+        return self.yout[:, column]
 
     def data_time_response(
         self,
@@ -4594,12 +4891,12 @@ class TimeResponseResults(Results):
                     [-np.sin(angle), np.cos(angle)]]
                 )
 
-                _probe_resp = operator @ np.vstack((self.yout[:, dofx], self.yout[:, dofy]))
+                _probe_resp = operator @ np.vstack((self._response(dofx), self._response(dofy)))
                 probe_resp = _probe_resp[0,:]
                 # fmt: on
             else:
                 dofz = ndof * node + 2 - fix_dof
-                probe_resp = self.yout[:, dofz]
+                probe_resp = self._response(dofz)
 
             probe_resp = Q_(probe_resp, "m").to(displacement_units).m
             data[f"probe_resp[{i}]"] = probe_resp
@@ -4716,8 +5013,8 @@ class TimeResponseResults(Results):
 
         fig.add_trace(
             go.Scatter(
-                x=Q_(self.yout[:, dofx], "m").to(displacement_units).m,
-                y=Q_(self.yout[:, dofy], "m").to(displacement_units).m,
+                x=Q_(self._response(dofx), "m").to(displacement_units).m,
+                y=Q_(self._response(dofy), "m").to(displacement_units).m,
                 mode="lines",
                 name="Orbit",
                 legendgroup="Orbit",
@@ -4775,8 +5072,8 @@ class TimeResponseResults(Results):
             fig.add_trace(
                 go.Scatter3d(
                     x=Q_(x_pos, "m").to(rotor_length_units).m,
-                    y=Q_(self.yout[:, ndof * n], "m").to(displacement_units).m,
-                    z=Q_(self.yout[:, ndof * n + 1], "m").to(displacement_units).m,
+                    y=Q_(self._response(ndof * n), "m").to(displacement_units).m,
+                    z=Q_(self._response(ndof * n + 1), "m").to(displacement_units).m,
                     mode="lines",
                     line=dict(color=tableau_colors["blue"]),
                     name="Mean",
@@ -1,9 +1,13 @@
 import inspect
+import os
 import sys
 import warnings
 from collections import Counter
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import copy, deepcopy
+from functools import lru_cache, partial
 from itertools import chain, cycle
 from pathlib import Path
 
@@ -16,7 +20,8 @@ from scipy import io as sio
 from scipy import linalg as la
 from scipy import signal as signal
 from scipy.interpolate import UnivariateSpline
-from scipy.optimize import newton
+from scipy.optimize import linear_sum_assignment, newton
+from scipy.sparse import bmat, block_diag, coo_matrix, csr_matrix, identity, issparse
 from scipy.sparse import linalg as las
 
 from ross.bearing_seal_element import (
@@ -32,6 +37,7 @@ from ross.faults import Crack, MisalignmentFlex, MisalignmentRigid, Rubbing
 from ross.disk_element import DiskElement, DiskElement6DoF
 from ross.materials import steel
 from ross.point_mass import PointMass, PointMass6DoF
+from ross.probe import Probe
 from ross.results import (
     CampbellResults,
     ConvergenceResults,
@@ -44,20 +50,24 @@ from ross.results import (
     SummaryResults,
     TimeResponseResults,
     UCSResults,
+    _modes_axes,
+    _whirl_direction,
 )
 from ross.shaft_element import ShaftElement, ShaftElement6DoF
 from ross.units import Q_, check_units
 from ross.utils import (
     intersection,
+    modal_propagation,
     newmark,
-    assemble_C_K_matrices,
     remove_dofs,
     convert_6dof_to_4dof,
+    _factorize,
 )
 
 __all__ = [
     "Rotor",
     "CoAxialRotor",
+    "ReducedRotor",
     "rotor_example",
     "compressor_example",
     "coaxrotor_example",
@@ -68,6 +78,34 @@ __all__ = [
 colors = px.colors.qualitative.Dark24
 
 
+def _dataframe_property(name):
+    """Rotor summary DataFrame built on first access.
+
+    Parameters
+    ----------
+    name : str
+        Name of the DataFrame attribute (e.g. "df_shaft").
+
+    Returns
+    -------
+    property
+        Property that calls Rotor._build_dataframes() when the DataFrame has
+        not been built or assigned yet.
+    """
+
+    def fget(self):
+        dataframes = self.__dict__.setdefault("_dataframes", {})
+        if name not in dataframes:
+            for key, value in self._build_dataframes().items():
+                dataframes.setdefault(key, value)
+        return dataframes[name]
+
+    def fset(self, value):
+        self.__dict__.setdefault("_dataframes", {})[name] = value
+
+    return property(fget, fset)
+
+
 class Rotor(object):
     r"""A rotor object.
 
@@ -226,133 +264,75 @@ class Rotor(object):
         self.number_dof = self._check_number_dof()
 
         ####################################################
-        # Rotor summary
+        # Rotor topology
         ####################################################
-        columns = [
-            "type",
-            "n",
-            "n_link",
-            "L",
-            "node_pos",
-            "node_pos_r",
-            "idl",
-            "odl",
-            "idr",
-            "odr",
-            "i_d",
-            "o_d",
-            "beam_cg",
-            "axial_cg_pos",
-            "y_pos",
-            "material",
-            "rho",
-            "volume",
-            "m",
-            "tag",
-        ]
-
-        df_shaft = pd.DataFrame([el.summary() for el in self.shaft_elements])
-        df_disks = pd.DataFrame([el.summary() for el in self.disk_elements])
-        df_bearings = pd.DataFrame(
-            [
-                el.summary()
-                for el in self.bearing_elements
-                if not (isinstance(el, SealElement))
-            ]
-        )
-        df_seals = pd.DataFrame(
-            [
-                el.summary()
-                for el in self.bearing_elements
-                if (isinstance(el, SealElement))
-            ]
-        )
-        df_point_mass = pd.DataFrame([el.summary() for el in self.point_mass_elements])
-
-        nodes_pos_l = np.zeros(len(df_shaft.n_l))
-        nodes_pos_r = np.zeros(len(df_shaft.n_l))
-        axial_cg_pos = np.zeros(len(df_shaft.n_l))
-
-        for i, sh in enumerate(self.shaft_elements):
-            if i == 0:
-                nodes_pos_r[i] = nodes_pos_r[i] + df_shaft.loc[i, "L"]
-                axial_cg_pos[i] = sh.beam_cg + nodes_pos_l[i]
-                sh.axial_cg_pos = axial_cg_pos[i]
-                continue
-            if df_shaft.loc[i, "n_l"] == df_shaft.loc[i - 1, "n_l"]:
-                nodes_pos_l[i] = nodes_pos_l[i - 1]
-                nodes_pos_r[i] = nodes_pos_r[i - 1]
-            else:
-                nodes_pos_l[i] = nodes_pos_r[i - 1]
-                nodes_pos_r[i] = nodes_pos_l[i] + df_shaft.loc[i, "L"]
-            axial_cg_pos[i] = sh.beam_cg + nodes_pos_l[i]
-            sh.axial_cg_pos = axial_cg_pos[i]
-
-        df_shaft["nodes_pos_l"] = nodes_pos_l
-        df_shaft["nodes_pos_r"] = nodes_pos_r
-        df_shaft["axial_cg_pos"] = axial_cg_pos
-
-        df = pd.concat(
-            [df_shaft, df_disks, df_bearings, df_point_mass, df_seals], sort=True
-        )
-        df = df.sort_values(by="n_l")
-        df = df.reset_index(drop=True)
-        df["shaft_number"] = np.zeros(len(df))
-
-        df_shaft["shaft_number"] = np.zeros(len(df_shaft))
-        df_disks["shaft_number"] = np.zeros(len(df_disks))
-        df_bearings["shaft_number"] = np.zeros(len(df_bearings))
-        df_seals["shaft_number"] = np.zeros(len(df_seals))
-        df_point_mass["shaft_number"] = np.zeros(len(df_point_mass))
+        # The topology is built from element attributes with integer arrays.
+        # The summary DataFrames (df, df_shaft, ...) are only built when they
+        # are first accessed (see Rotor._build_dataframes()).
+        self._dataframes = {}
 
-        self.df_disks = df_disks
-        self.df_bearings = df_bearings
-        self.df_shaft = df_shaft
-        self.df_point_mass = df_point_mass
-        self.df_seals = df_seals
+        nodes_pos_l, nodes_pos_r, _ = self._shaft_nodes_pos()
+        shaft_n_l = np.array([sh.n_l for sh in self.shaft_elements], dtype=int)
+        shaft_n_r = np.array([sh.n_r for sh in self.shaft_elements], dtype=int)
 
         # check consistence for disks and bearings location
-        if len(df_point_mass) > 0:
-            max_loc_point_mass = df_point_mass.n.max()
-        else:
-            max_loc_point_mass = 0
-        max_location = max(df_shaft.n_r.max(), max_loc_point_mass)
-        if df.n_l.max() > max_location:
+        max_loc_point_mass = max((p.n for p in point_mass_elements), default=0)
+        max_location = max(shaft_n_r.max(), max_loc_point_mass)
+        max_n_l = max(
+            el.n_l for el in chain(self.shaft_elements, disk_elements, bearing_elements)
+        )
+        if max_n_l > max_location:
             raise ValueError("Trying to set disk or bearing outside shaft")
 
+        # check if every bearing is connected to another element
+        node_count = Counter(
+            n
+            for el in chain(self.shaft_elements, disk_elements, bearing_elements)
+            for n in {el.n_l, el.n_r}
+        )
+        n_links = Counter(
+            brg.n_link for brg in bearing_elements if brg.n_link is not None
+        )
+        for brg in bearing_elements:
+            own_link = int(brg.n_link == brg.n)
+            if node_count[brg.n] < 2 and n_links[brg.n] - own_link < 1:
+                raise ValueError(
+                    f"The following bearing is not connected to the rotor. Check n_link. {brg}"
+                )
+
         # nodes axial position and diameter
-        nodes_pos = list(df_shaft.groupby("n_l")["nodes_pos_l"].max())
-        nodes_pos.append(df_shaft["nodes_pos_r"].iloc[-1])
+        shaft_nodes, shaft_inv = np.unique(shaft_n_l, return_inverse=True)
+        nodes_pos = np.full(len(shaft_nodes), -np.inf)
+        np.maximum.at(nodes_pos, shaft_inv, nodes_pos_l)
+        nodes_pos = list(nodes_pos)
+        nodes_pos.append(nodes_pos_r[-1])
         self.nodes_pos = nodes_pos
         self.nodes = list(range(len(self.nodes_pos)))
 
-        nodes_i_d = []
-        for n in self.nodes:
-            nodes_i_d.append(
-                self.df_shaft[
-                    (self.df_shaft.n_l == n) | (self.df_shaft.n_r == n)
-                ].i_d.min()
-            )
-        self.nodes_i_d = nodes_i_d
-
-        nodes_o_d = []
-        for n in self.nodes:
-            nodes_o_d.append(
-                self.df_shaft[
-                    (self.df_shaft.n_l == n) | (self.df_shaft.n_r == n)
-                ].o_d.max()
-            )
-        self.nodes_o_d = nodes_o_d
-
-        shaft_elements_length = list(df_shaft.groupby("n_l")["L"].min())
-        self.shaft_elements_length = shaft_elements_length
+        n_nodes = max(len(self.nodes), shaft_n_r.max() + 1)
+        i_d = np.array([sh.i_d for sh in self.shaft_elements])
+        o_d = np.array([sh.o_d for sh in self.shaft_elements])
+        nodes_i_d = np.full(n_nodes, np.inf)
+        nodes_o_d = np.full(n_nodes, -np.inf)
+        for shaft_n in (shaft_n_l, shaft_n_r):
+            np.minimum.at(nodes_i_d, shaft_n, i_d)
+            np.maximum.at(nodes_o_d, shaft_n, o_d)
+        nodes_i_d[np.isinf(nodes_i_d)] = np.nan
+        nodes_o_d[np.isinf(nodes_o_d)] = np.nan
+        self.nodes_i_d = list(nodes_i_d[: len(self.nodes)])
+        self.nodes_o_d = list(nodes_o_d[: len(self.nodes)])
+
+        shaft_elements_length = np.full(len(shaft_nodes), np.inf)
+        np.minimum.at(
+            shaft_elements_length,
+            shaft_inv,
+            [sh.L for sh in self.shaft_elements],
+        )
+        self.shaft_elements_length = list(shaft_elements_length)
 
         self.L = nodes_pos[-1]
 
-        if "n_link" in df.columns:
-            self.link_nodes = list(df["n_link"].dropna().unique().astype(int))
-        else:
-            self.link_nodes = []
+        self.link_nodes = [int(n) for n in n_links]
 
         # rotor mass can also be calculated with self.M()[::4, ::4].sum()
         self.m_disks = np.sum([disk.m for disk in self.disk_elements])
@@ -372,8 +352,6 @@ class Rotor(object):
         Ip_dsk = np.sum([disk.Ip for disk in self.disk_elements])
         self.Ip = Ip_sh + Ip_dsk
 
-        self._v0 = None  # used to call eigs
-
         # number of dofs
         half_ndof = self.number_dof / 2
         self.ndof = int(
@@ -432,10 +410,145 @@ class Rotor(object):
                         )
 
             elm.dof_global_index = global_dof_mapping
-            df.at[df.loc[df.tag == elm.tag].index[0], "dof_global_index"] = (
-                elm.dof_global_index
+
+        self._build_assembly_index()
+
+    def _check_number_dof(self):
+        """Verify the consistency of degrees of freedom.
+
+        This method loops for all the elements, checking if the number of degrees of
+        freedom is consistent.
+        E.g.: inputting 2 shaft elements, one with 4 dof and one with 6, will raise
+        an error.
+
+        Raises
+        ------
+        Exception
+            Error pointing out difference between the number of DoF's from each element
+            type.
+
+        Returns
+        -------
+        number_dof : int
+            Number of degrees of freedom from the adopted shaft element.
+        """
+        number_dof = len(self.shaft_elements[0].dof_mapping()) / 2
+
+        if any(len(sh.dof_mapping()) != number_dof * 2 for sh in self.shaft_elements):
+            raise Exception(
+                "The number of degrees o freedom of all elements must be the same! There are SHAFT elements with discrepant DoFs."
+            )
+
+        if any(len(disk.dof_mapping()) != number_dof for disk in self.disk_elements):
+            raise Exception(
+                "The number of degrees o freedom of all elements must be the same! There are DISK elements with discrepant DoFs."
+            )
+
+        if any(
+            len(brg.dof_mapping()) != number_dof / 2 for brg in self.bearing_elements
+        ):
+            raise Exception(
+                "The number of degrees o freedom of all elements must be the same! There are BEARING elements with discrepant DoFs."
             )
 
+        return int(number_dof)
+
+    df = _dataframe_property("df")
+    df_shaft = _dataframe_property("df_shaft")
+    df_disks = _dataframe_property("df_disks")
+    df_bearings = _dataframe_property("df_bearings")
+    df_seals = _dataframe_property("df_seals")
+    df_point_mass = _dataframe_property("df_point_mass")
+
+    def _shaft_nodes_pos(self):
+        """Axial positions of the shaft elements.
+
+        The axial position of the center of gravity is also assigned to each
+        shaft element (axial_cg_pos attribute).
+
+        Returns
+        -------
+        nodes_pos_l : np.ndarray
+            Axial position of the left node of each shaft element.
+        nodes_pos_r : np.ndarray
+            Axial position of the right node of each shaft element.
+        axial_cg_pos : np.ndarray
+            Axial position of the center of gravity of each shaft element.
+        """
+        nodes_pos_l = np.zeros(len(self.shaft_elements))
+        nodes_pos_r = np.zeros(len(self.shaft_elements))
+        axial_cg_pos = np.zeros(len(self.shaft_elements))
+
+        for i, sh in enumerate(self.shaft_elements):
+            if i == 0:
+                nodes_pos_r[i] = nodes_pos_r[i] + sh.L
+            elif sh.n_l == self.shaft_elements[i - 1].n_l:
+                nodes_pos_l[i] = nodes_pos_l[i - 1]
+                nodes_pos_r[i] = nodes_pos_r[i - 1]
+            else:
+                nodes_pos_l[i] = nodes_pos_r[i - 1]
+                nodes_pos_r[i] = nodes_pos_l[i] + sh.L
+            axial_cg_pos[i] = sh.beam_cg + nodes_pos_l[i]
+            sh.axial_cg_pos = axial_cg_pos[i]
+
+        return nodes_pos_l, nodes_pos_r, axial_cg_pos
+
+    def _build_dataframes(self):
+        """Build the rotor summary DataFrames.
+
+        This is called the first time one of the DataFrames (df, df_shaft,
+        df_disks, df_bearings, df_seals or df_point_mass) is accessed.
+
+        Returns
+        -------
+        dataframes : dict
+            Dictionary with the DataFrames, using the attribute names as keys.
+        """
+        disk_elements = self.disk_elements
+        bearing_elements = self.bearing_elements
+        point_mass_elements = self.point_mass_elements
+        nodes_pos = self.nodes_pos
+        nodes_o_d = self.nodes_o_d
+
+        df_shaft = pd.DataFrame([el.summary() for el in self.shaft_elements])
+        df_disks = pd.DataFrame([el.summary() for el in self.disk_elements])
+        df_bearings = pd.DataFrame(
+            [
+                el.summary()
+                for el in self.bearing_elements
+                if not (isinstance(el, SealElement))
+            ]
+        )
+        df_seals = pd.DataFrame(
+            [
+                el.summary()
+                for el in self.bearing_elements
+                if (isinstance(el, SealElement))
+            ]
+        )
+        df_point_mass = pd.DataFrame([el.summary() for el in self.point_mass_elements])
+
+        nodes_pos_l, nodes_pos_r, axial_cg_pos = self._shaft_nodes_pos()
+        df_shaft["nodes_pos_l"] = nodes_pos_l
+        df_shaft["nodes_pos_r"] = nodes_pos_r
+        df_shaft["axial_cg_pos"] = axial_cg_pos
+
+        df = pd.concat(
+            [df_shaft, df_disks, df_bearings, df_point_mass, df_seals], sort=True
+        )
+        df = df.sort_values(by="n_l")
+        df = df.reset_index(drop=True)
+        df["shaft_number"] = np.zeros(len(df))
+
+        df_shaft["shaft_number"] = np.zeros(len(df_shaft))
+        df_disks["shaft_number"] = np.zeros(len(df_disks))
+        df_bearings["shaft_number"] = np.zeros(len(df_bearings))
+        df_seals["shaft_number"] = np.zeros(len(df_seals))
+        df_point_mass["shaft_number"] = np.zeros(len(df_point_mass))
+
+        dof_global_index = {elm.tag: elm.dof_global_index for elm in self.elements}
+        df["dof_global_index"] = [dof_global_index[tag] for tag in df.tag]
+
         # define positions for disks
         for disk in disk_elements:
             z_pos = nodes_pos[disk.n]
@@ -550,71 +663,38 @@ class Rotor(object):
             df.loc[df.tag == p.tag, "nodes_pos_r"] = z_pos
             df.loc[df.tag == p.tag, "y_pos"] = y_pos
 
-        self.df = df
-
-    def _check_number_dof(self):
-        """Verify the consistency of degrees of freedom.
+        return {
+            "df": df,
+            "df_shaft": df_shaft,
+            "df_disks": df_disks,
+            "df_bearings": df_bearings,
+            "df_seals": df_seals,
+            "df_point_mass": df_point_mass,
+        }
 
-        This method loops for all the elements, checking if the number of degrees of
-        freedom is consistent.
-        E.g.: inputting 2 shaft elements, one with 4 dof and one with 6, will raise
-        an error.
+    def __eq__(self, other):
+        """Equality method for comparasions.
 
-        Raises
-        ------
-        Exception
-            Error pointing out difference between the number of DoF's from each element
-            type.
+        Parameters
+        ----------
+        other : obj
+            parameter for comparasion
 
         Returns
         -------
-        number_dof : int
-            Number of degrees of freedom from the adopted shaft element.
+        True if other is equal to the reference parameter.
+        False if not.
         """
-        number_dof = len(self.shaft_elements[0].dof_mapping()) / 2
+        if self.elements == other.elements and self.parameters == other.parameters:
+            return True
+        else:
+            return False
 
-        if any(len(sh.dof_mapping()) != number_dof * 2 for sh in self.shaft_elements):
-            raise Exception(
-                "The number of degrees o freedom of all elements must be the same! There are SHAFT elements with discrepant DoFs."
-            )
+    def add_nodes(self, new_nodes_pos):
+        """Add nodes to rotor.
 
-        if any(len(disk.dof_mapping()) != number_dof for disk in self.disk_elements):
-            raise Exception(
-                "The number of degrees o freedom of all elements must be the same! There are DISK elements with discrepant DoFs."
-            )
-
-        if any(
-            len(brg.dof_mapping()) != number_dof / 2 for brg in self.bearing_elements
-        ):
-            raise Exception(
-                "The number of degrees o freedom of all elements must be the same! There are BEARING elements with discrepant DoFs."
-            )
-
-        return int(number_dof)
-
-    def __eq__(self, other):
-        """Equality method for comparasions.
-
-        Parameters
-        ----------
-        other : obj
-            parameter for comparasion
-
-        Returns
-        -------
-        True if other is equal to the reference parameter.
-        False if not.
-        """
-        if self.elements == other.elements and self.parameters == other.parameters:
-            return True
-        else:
-            return False
-
-    def add_nodes(self, new_nodes_pos):
-        """Add nodes to rotor.
-
-        This method returns the modified rotor with additional nodes according to
-        the positions of the new nodes provided.
+        This method returns the modified rotor with additional nodes according to
+        the positions of the new nodes provided.
 
         Parameters
         ----------
@@ -737,7 +817,8 @@ class Rotor(object):
             Default is 12.
         sparse : bool, optional
             If True, ARPACK is used to calculate a desired number (according to
-            num_modes) or eigenvalues and eigenvectors.
+            num_modes) or eigenvalues and eigenvectors, using shift-invert with a
+            sparse LU factorization of the linearized pencil (see Rotor._pencil()).
             If False, scipy.linalg.eig() is used to calculate all the eigenvalues and
             eigenvectors.
             Default is True.
@@ -771,6 +852,28 @@ class Rotor(object):
         evalues, evectors = self._eigen(
             speed, num_modes=num_modes, sparse=sparse, synchronous=synchronous
         )
+
+        return self._modal_results(speed, evalues, evectors, num_modes)
+
+    def _modal_results(self, speed, evalues, evectors, num_modes):
+        """Create the modal results from sorted eigenvalues and eigenvectors.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed.
+        evalues : array
+            Eigenvalues sorted by Rotor._index().
+        evectors : array
+            Eigenvectors of the state space matrix.
+        num_modes : int
+            Number of eigenvalues calculated. The modal parameters are
+            returned for num_modes // 2 modes.
+
+        Returns
+        -------
+        results : ross.ModalResults
+        """
         wn_len = num_modes // 2
         wn = (np.absolute(evalues))[:wn_len]
         wd = (np.imag(evalues))[:wn_len]
@@ -796,7 +899,9 @@ class Rotor(object):
 
         return modal_results
 
-    def run_critical_speed(self, speed_range=None, num_modes=12, rtol=0.005):
+    def run_critical_speed(
+        self, speed_range=None, num_modes=12, rtol=0.005, method="newton", num_points=20
+    ):
         """Calculate the critical speeds and damping ratios for the rotor model.
 
         This function runs an iterative method over "run_modal()" to minimize
@@ -829,6 +934,16 @@ class Rotor(object):
         rtol : float, optional
             Tolerance (relative) for termination. Applied to scipy.optimize.newton.
             Default is 0.005 (0.5%).
+        method : str, optional
+            Method used to find the critical speeds.
+            "newton" runs scipy.optimize.newton for each natural frequency.
+            "campbell" calculates a coarse Campbell diagram with tracked modes,
+            brackets the 1X crossings of all modes at once and refines the
+            brackets with modal analyses shared between the modes.
+            Default is "newton".
+        num_points : int, optional
+            Number of speeds in the coarse Campbell diagram used when
+            method="campbell". Default is 20.
 
         Returns
         -------
@@ -860,33 +975,55 @@ class Rotor(object):
         Retrieving whirl directions
         >>> results.whirl_direction # doctest: +ELLIPSIS
         array([...
+
+        Finding the critical speeds from a single Campbell diagram
+        >>> results = rotor.run_critical_speed(num_modes=8, method="campbell")
+        >>> np.round(results.wd())
+        array([ 92.,  96., 271., 300.])
         """
         num_modes = (self.ndof - 4) * 2 if speed_range is not None else num_modes
 
-        modal = self.run_modal(0, num_modes)
-        _wn = modal.wn
-        _wd = modal.wd
-        wn = np.zeros_like(_wn)
-        wd = np.zeros_like(_wd)
-
-        for i in range(len(wn)):
-            wn_func = lambda s: (s - self.run_modal(s, num_modes).wn[i])
-            wn[i] = newton(func=wn_func, x0=_wn[i], rtol=rtol)
-
-        for i in range(len(wd)):
-            wd_func = lambda s: (s - self.run_modal(s, num_modes).wd[i])
-            wd[i] = newton(func=wd_func, x0=_wd[i], rtol=rtol)
-
-        log_dec = np.zeros_like(wn)
-        damping_ratio = np.zeros_like(wn)
-        whirl_direction = list(np.zeros_like(wn))
-        for i, s in enumerate(wd):
-            modal = self.run_modal(s, num_modes)
-            log_dec[i] = modal.log_dec[i]
-            damping_ratio[i] = modal.damping_ratio[i]
-            whirl_direction[i] = modal.whirl_direction()[i]
-
-        whirl_direction = np.array(whirl_direction)
+        if method == "campbell":
+            (
+                wn,
+                wd,
+                log_dec,
+                damping_ratio,
+                whirl_direction,
+            ) = self._critical_speed_sweep(
+                num_modes,
+                rtol,
+                num_points,
+                speed_max=None if speed_range is None else 1.1 * speed_range[1],
+            )
+        elif method == "newton":
+            modal = self.run_modal(0, num_modes)
+            _wn = modal.wn
+            _wd = modal.wd
+            wn = np.zeros_like(_wn)
+            wd = np.zeros_like(_wd)
+
+            for i in range(len(wn)):
+                wn_func = lambda s: (s - self.run_modal(s, num_modes).wn[i])
+                wn[i] = newton(func=wn_func, x0=_wn[i], rtol=rtol)
+
+            for i in range(len(wd)):
+                wd_func = lambda s: (s - self.run_modal(s, num_modes).wd[i])
+                wd[i] = newton(func=wd_func, x0=_wd[i], rtol=rtol)
+
+            log_dec = np.zeros_like(wn)
+            damping_ratio = np.zeros_like(wn)
+            whirl_direction = list(np.zeros_like(wn))
+            for i, s in enumerate(wd):
+                modal = self.run_modal(s, num_modes)
+                log_dec[i] = modal.log_dec[i]
+                damping_ratio[i] = modal.damping_ratio[i]
+                whirl_direction[i] = modal.whirl_direction()[i]
+
+            whirl_direction = np.array(whirl_direction)
+        else:
+            raise ValueError(f"method must be 'newton' or 'campbell', not {method!r}.")
+
         if speed_range is not None:
             vmin, vmax = speed_range
             idx = np.where((wd >= vmin) & (wd <= vmax))
@@ -898,6 +1035,220 @@ class Rotor(object):
 
         return CriticalSpeedResults(wn, wd, log_dec, damping_ratio, whirl_direction)
 
+    def _critical_speed_sweep(
+        self, num_modes, rtol, num_points, speed_max=None, max_iter=50
+    ):
+        """Find the critical speeds from a tracked Campbell diagram.
+
+        The modes are tracked (see Rotor._track_modes()) over a coarse speed range
+        to bracket the crossings of each natural frequency with the 1X line. The
+        brackets are refined with the regula falsi method (Illinois variant).
+        At each iteration the modal analysis is run once for estimates that are
+        closer than rtol, starting the solver from the mode shapes in the
+        brackets.
+
+        Parameters
+        ----------
+        num_modes : int
+            The number of eigenvalues and eigenvectors calculated for each speed.
+        rtol : float
+            Tolerance (relative) for the critical speeds.
+        num_points : int
+            Number of speeds in the coarse Campbell diagram.
+        speed_max : float, optional
+            Maximum speed of the coarse Campbell diagram. Modes whose damped
+            natural frequency does not cross the 1X line below it are dropped
+            from the results, and undamped critical speeds above it are returned
+            as NaN. Default is None, in which case the diagram is extended until
+            all the modes cross the 1X line.
+        max_iter : int, optional
+            Maximum number of refinement iterations. Default is 50.
+
+        Returns
+        -------
+        wn, wd, log_dec, damping_ratio, whirl_direction : array
+            Critical speeds and modal parameters as in run_critical_speed(). The
+            arrays are given per mode with a damped critical speed, sorted by it.
+        """
+        solved = {}
+        # two spare modes are calculated so that modes coming from above the
+        # frequency range can be matched at crossings
+        num_solve = min(num_modes + 4, (self.ndof - 4) * 2)
+
+        def modal_data(speed, v0=None):
+            if speed not in solved:
+                evalues, evectors = self._eigen(speed, num_modes=num_solve, v0=v0)
+                modal = self._modal_results(speed, evalues, evectors, num_solve)
+                evalues = modal.evalues[: len(modal.wn)]
+                wn = np.absolute(evalues)
+                damping_ratio = -np.real(evalues) / wn
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    log_dec = 2 * np.pi * damping_ratio / np.sqrt(1 - damping_ratio**2)
+                solved[speed] = dict(
+                    modes=modal.evectors[: self.ndof, : len(evalues)],
+                    wn=wn,
+                    wd=np.imag(evalues),
+                    log_dec=log_dec,
+                    damping_ratio=damping_ratio,
+                    v0=np.real(modal.evectors[:, : len(evalues)]),
+                )
+            return solved[speed]
+
+        data = modal_data(0.0)
+        n_modes = num_modes // 2
+        idx = np.argsort(data["wn"], kind="stable")[:n_modes]
+
+        # coarse sweep, extended until every mode crosses the 1X line
+        speeds = [0.0]
+        tracked = [idx]
+        extend = speed_max is None
+        if extend:
+            speed_max = 1.5 * data["wn"][idx].max()
+        for _ in range(4):
+            for speed in np.linspace(speeds[-1], speed_max, num_points)[1:]:
+                previous = solved[speeds[-1]]
+                p_idx = tracked[-1]
+                data = modal_data(speed, v0=np.sum(previous["v0"][:, p_idx], axis=1))
+                idx, _ = self._track_modes(
+                    previous["modes"][:, p_idx],
+                    previous["wd"][p_idx],
+                    data["modes"],
+                    data["wd"],
+                )
+                speeds.append(speed)
+                tracked.append(idx)
+            last = solved[speeds[-1]]
+            if (
+                not extend
+                or np.all(speeds[-1] > last["wn"][tracked[-1]])
+                and np.all(speeds[-1] > last["wd"][tracked[-1]])
+            ):
+                break
+            speed_max *= 2
+
+        speeds = np.array(speeds)
+        tracked = np.array(tracked)
+
+        # brackets [a, b] with residual (speed - frequency) changing sign
+        brackets = []
+        for key in ("wn", "wd"):
+            freqs = np.array([solved[s][key][i] for s, i in zip(speeds, tracked)])
+            residual = speeds[:, np.newaxis] - freqs
+            for mode in range(n_modes):
+                crossing = np.flatnonzero(
+                    (residual[:-1, mode] <= 0) & (residual[1:, mode] > 0)
+                )
+                if len(crossing) == 0:
+                    brackets.append(None)
+                    continue
+                k = crossing[0]
+                brackets.append(
+                    dict(
+                        key=key,
+                        a=speeds[k],
+                        fa=residual[k, mode],
+                        b=speeds[k + 1],
+                        fb=residual[k + 1, mode],
+                        idx=tracked[k, mode],
+                        ref=speeds[k],
+                        side=0,
+                        root=None,
+                    )
+                )
+
+        for _ in range(max_iter):
+            active = [br for br in brackets if br is not None and br["root"] is None]
+            if not active:
+                break
+
+            for br in active:
+                if br["fa"] == 0:
+                    br["x"] = br["a"]
+                else:
+                    br["x"] = br["a"] - br["fa"] * (br["b"] - br["a"]) / (
+                        br["fb"] - br["fa"]
+                    )
+
+            # estimates closer than rtol share the same modal analysis
+            active.sort(key=lambda br: br["x"])
+            groups = [[active[0]]]
+            for br in active[1:]:
+                if br["x"] - groups[-1][0]["x"] <= rtol * groups[-1][0]["x"]:
+                    groups[-1].append(br)
+                else:
+                    groups.append([br])
+
+            for group in groups:
+                speed = np.mean([br["x"] for br in group])
+                v0 = sum(solved[br["ref"]]["v0"][:, br["idx"]] for br in group)
+                data = modal_data(speed, v0=np.real(v0))
+                for br in group:
+                    ref = solved[br["ref"]]
+                    i = self._track_modes(
+                        ref["modes"][:, [br["idx"]]],
+                        ref[br["key"]][[br["idx"]]],
+                        data["modes"],
+                        data[br["key"]],
+                    )[0][0]
+                    residual = speed - data[br["key"]][i]
+
+                    if (
+                        abs(residual) <= rtol * speed
+                        or br["b"] - br["a"] <= rtol * speed
+                    ):
+                        br["root"] = speed
+                        br["speed_idx"] = (speed, i)
+                    elif residual <= 0:
+                        br["a"], br["fa"] = speed, residual
+                        br["idx"], br["ref"] = i, speed
+                        if br["side"] == -1:
+                            br["fb"] /= 2
+                        br["side"] = -1
+                    else:
+                        br["b"], br["fb"] = speed, residual
+                        if br["side"] == 1:
+                            br["fa"] /= 2
+                        br["side"] = 1
+
+        wn = np.full(n_modes, np.nan)
+        wd = np.full(n_modes, np.nan)
+        log_dec = np.full(n_modes, np.nan)
+        damping_ratio = np.full(n_modes, np.nan)
+        modes = np.zeros((self.ndof, n_modes), dtype=complex)
+        for n, br in enumerate(brackets):
+            mode = n % n_modes
+            if br is None or br["root"] is None:
+                if extend:
+                    key = "wn" if n < n_modes else "wd"
+                    warnings.warn(f"Critical speed ({key}) of mode {mode} not found.")
+                continue
+            if n < n_modes:
+                wn[mode] = br["root"]
+            else:
+                speed, i = br["speed_idx"]
+                wd[mode] = br["root"]
+                log_dec[mode] = solved[speed]["log_dec"][i]
+                damping_ratio[mode] = solved[speed]["damping_ratio"][i]
+                modes[:, mode] = solved[speed]["modes"][:, i]
+
+        # modes without a wd crossing have no mode shape to take the whirl from
+        found = np.flatnonzero(~np.isnan(wd))
+        kappa = _modes_axes(modes[:, found], self.nodes, self.number_dof)[2]
+        whirl_direction = _whirl_direction(kappa)
+
+        # one ordering for all the arrays: ascending critical speed, as in
+        # run_modal()
+        order = np.argsort(wd[found])
+        idx = found[order]
+        return (
+            wn[idx],
+            wd[idx],
+            log_dec[idx],
+            damping_ratio[idx],
+            whirl_direction[order],
+        )
+
     def convergence(self, n_eigval=0, err_max=1e-02):
         """Run convergence analysis.
 
@@ -1013,13 +1364,296 @@ class Rotor(object):
             nel_r *= 2
 
         self.__dict__ = aux_rotor.__dict__
+        self.clear_cache()
         self.error_arr = error_arr
 
         results = ConvergenceResults(el_num[1:], eigv_arr[1:], error_arr[1:])
 
         return results
 
-    def M(self, frequency=None, synchronous=False):
+    def _build_assembly_index(self):
+        """Precompute the global dof indexes used to assemble the rotor matrices.
+
+        For each element in self.elements the global dofs and the row/column
+        indexes of its matrix entries (flattened in C order) are stored, so that
+        the global matrices can be scattered in a single vectorized operation
+        instead of one np.ix_ assignment per element.
+        """
+        self._elements_dofs = []
+        self._elements_rows = []
+        self._elements_cols = []
+
+        for elm in self.elements:
+            dofs = np.array(list(elm.dof_global_index.values()), dtype=int)
+            self._elements_dofs.append(dofs)
+            self._elements_rows.append(np.repeat(dofs, len(dofs)))
+            self._elements_cols.append(np.tile(dofs, len(dofs)))
+
+        # bearings and seals given for a range of frequencies are the only
+        # elements with frequency dependent coefficients, all the other
+        # elements are assembled once and cached
+        bearings = {
+            id(brg)
+            for brg in self.bearing_elements
+            if getattr(brg, "frequency", None) is not None
+        }
+        self._variable_index = [
+            i for i, elm in enumerate(self.elements) if id(elm) in bearings
+        ]
+        self._constant_index = [
+            i for i, elm in enumerate(self.elements) if id(elm) not in bearings
+        ]
+
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear the cached speed independent matrices.
+
+        The parts of M, K, C, G and Ksdt that do not depend on the frequency are
+        cached after the first call. This method has to be called if the
+        elements are modified after the rotor is built.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> m0 = rotor.M(0).sum()
+        >>> rotor.disk_elements[0].m += 1
+        >>> rotor.clear_cache()
+        >>> float(rotor.M(0).sum() - m0)
+        2.0
+        """
+        self._matrix_cache = {}
+        self._bearing_table = {}
+
+    @contextmanager
+    def _tabulated_bearings(self, frequency):
+        """Evaluate the bearing and seal coefficients for an array of frequencies.
+
+        The coefficients of each bearing are interpolated once for the whole
+        array (see BearingElement.coefficients_at()) and, inside the context,
+        M(), K() and C() use the tabulated values when called with one of these
+        frequencies. The table is discarded when the context exits.
+
+        Parameters
+        ----------
+        frequency : array
+            Array with the frequencies (rad/s) that will be evaluated.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> with rotor._tabulated_bearings([0, 100]):
+        ...     K = rotor.K(100)
+        >>> rotor._bearing_table
+        {}
+        """
+        frequency = np.atleast_1d(np.asarray(frequency, dtype=np.float64))
+
+        elements = {}
+        for i in self._variable_index:
+            elm = self.elements[i]
+            if hasattr(elm, "coefficients_at"):
+                elements[i] = dict(zip(["K", "C", "M"], elm.coefficients_at(frequency)))
+
+        previous = self._bearing_table
+        self._bearing_table = {
+            "frequency": {f: j for j, f in enumerate(frequency.tolist())},
+            "elements": elements,
+        }
+        try:
+            yield
+        finally:
+            self._bearing_table = previous
+
+    def _bearing_matrices(self, name, frequency, index):
+        """Frequency dependent element matrices.
+
+        Parameters
+        ----------
+        name : str
+            Matrix name: "K", "C" or "M".
+        frequency : float
+            Excitation frequency.
+        index : list
+            Position in self.elements of the elements to be evaluated.
+
+        Returns
+        -------
+        matrices : list
+            List with the element matrices.
+        """
+        row = None
+        if self._bearing_table and isinstance(frequency, (int, float, np.number)):
+            row = self._bearing_table["frequency"].get(float(frequency))
+
+        matrices = []
+        for i in index:
+            if row is not None and i in self._bearing_table["elements"]:
+                matrices.append(self._bearing_table["elements"][i][name][row])
+            else:
+                matrices.append(_element_matrix(self.elements[i], name, frequency))
+
+        return matrices
+
+    def _bearing_profile(self, elements, speed, max_points=1000):
+        """Bearing stiffness and damping along a speed profile.
+
+        The coefficients of the elements are tabulated once on the values of
+        speed or, if there are more than max_points different values (e.g. in
+        a run-up), on a uniform grid that is linearly interpolated.
+
+        Parameters
+        ----------
+        elements : list
+            Bearing and seal elements.
+        speed : array
+            Speed at each time step (rad/s).
+        max_points : int, optional
+            Maximum number of tabulated speeds. Default is 1000.
+
+        Returns
+        -------
+        coefficients : callable
+            Function that takes the time step and returns the lists with the
+            stiffness and damping matrices of the elements.
+        """
+        speed = np.asarray(speed, dtype=np.float64)
+        grid, position = np.unique(speed, return_inverse=True)
+        position = position.astype(np.float64)
+
+        if len(grid) > max_points:
+            grid = np.linspace(grid[0], grid[-1], max_points)
+            position = np.interp(speed, grid, np.arange(max_points))
+
+        lower = np.minimum(position.astype(int), max(len(grid) - 2, 0))
+        weight = position - lower
+
+        tables = []
+        for elm in elements:
+            if hasattr(elm, "coefficients_at"):
+                K, C, _ = elm.coefficients_at(grid)
+            else:
+                K = np.array([elm.K(f) for f in grid])
+                C = np.array([elm.C(f) for f in grid])
+            tables.append((K, C))
+
+        def coefficients(step):
+            j, w = lower[step], weight[step]
+            if w == 0:
+                return [K[j] for K, _ in tables], [C[j] for _, C in tables]
+
+            return (
+                [(1 - w) * K[j] + w * K[j + 1] for K, _ in tables],
+                [(1 - w) * C[j] + w * C[j + 1] for _, C in tables],
+            )
+
+        return coefficients
+
+    def _cached_matrix(self, key, sparse, build):
+        """Return a copy of a cached speed independent matrix.
+
+        Parameters
+        ----------
+        key : hashable
+            Key used to identify the matrix.
+        sparse : bool
+            If True, the sparse version of the matrix is returned.
+        build : callable
+            Function that receives the sparse argument and assembles the
+            matrix when it is not in the cache.
+
+        Returns
+        -------
+        matrix : np.ndarray, scipy.sparse.csr_matrix
+            Copy of the cached matrix.
+        """
+        key = (key, sparse)
+        if key not in self._matrix_cache:
+            self._matrix_cache[key] = build(sparse)
+
+        return self._matrix_cache[key].copy()
+
+    def _add_blocks(self, matrix, matrices, index, sparse=False):
+        """Add element matrices to a global matrix.
+
+        The global matrix is modified in place if it is a np.ndarray.
+        """
+        if sparse:
+            return matrix + self._assemble(matrices, index, sparse=True)
+
+        for m, i in zip(matrices, index):
+            dofs = self._elements_dofs[i]
+            matrix[np.ix_(dofs, dofs)] += m
+
+        return matrix
+
+    def _assemble(self, matrices, index, sparse=False):
+        """Assemble element matrices into a global matrix.
+
+        Parameters
+        ----------
+        matrices : list
+            List with the element matrices.
+        index : list
+            Position in self.elements of the element related to each matrix.
+        sparse : bool, optional
+            If True, a scipy.sparse.csr_matrix is returned.
+            Default is False.
+
+        Returns
+        -------
+        matrix : np.ndarray, scipy.sparse.csr_matrix
+            Global matrix with shape (ndof, ndof).
+        """
+        if len(index):
+            rows = np.concatenate([self._elements_rows[i] for i in index])
+            cols = np.concatenate([self._elements_cols[i] for i in index])
+            data = np.concatenate([np.ravel(matrix) for matrix in matrices])
+        else:
+            rows = cols = np.array([], dtype=int)
+            data = np.array([], dtype=float)
+
+        if sparse:
+            return coo_matrix(
+                (data, (rows, cols)), shape=(self.ndof, self.ndof)
+            ).tocsr()
+
+        # entries sharing the same position are summed in element order,
+        # which gives the same result as accumulating each element block
+        matrix = np.bincount(
+            rows * self.ndof + cols, weights=data, minlength=self.ndof**2
+        )
+
+        return matrix.reshape(self.ndof, self.ndof)
+
+    def _constant_matrices(self, name):
+        """Element matrices of the elements that do not depend on the frequency.
+
+        Parameters
+        ----------
+        name : str
+            Matrix name: "M", "K" or "C".
+
+        Returns
+        -------
+        matrices : list
+            List with the element matrices, in the order of self._constant_index.
+        """
+        # bearings with constant coefficients still take a frequency
+        return [
+            _element_matrix(self.elements[i], name, 0) for i in self._constant_index
+        ]
+
+    def _ignore_variable(self, ignore):
+        """Check if ignore only has frequency dependent elements."""
+        variable = [self.elements[i] for i in self._variable_index]
+        return all(elm in variable for elm in ignore)
+
+    def _elements_index(self, ignore=[]):
+        """Position in self.elements of the elements not in ignore."""
+        return [i for i, elm in enumerate(self.elements) if elm not in ignore]
+
+    def M(self, frequency=None, synchronous=False, sparse=False):
         """Mass matrix for an instance of a rotor.
 
         Parameters
@@ -1027,10 +1661,13 @@ class Rotor(object):
         synchronous : bool, optional
             If True a synchronous analysis is carried out.
             Default is False.
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
 
         Returns
         -------
-        M0 : np.ndarray
+        M0 : np.ndarray, scipy.sparse.csr_matrix
             Mass matrix for the rotor.
 
         Examples
@@ -1041,45 +1678,51 @@ class Rotor(object):
                [ 0.        ,  1.42050794, -0.04931719,  0.        ],
                [ 0.        , -0.04931719,  0.00231392,  0.        ],
                [ 0.04931719,  0.        ,  0.        ,  0.00231392]])
+        >>> rotor.M(0, sparse=True).shape
+        (28, 28)
         """
-        M0 = np.zeros((self.ndof, self.ndof))
-
         # if frequency is None, we assume the rotor does not have any elements
         # with frequency dependent mass matrices
         if frequency is None:
             frequency = 0
 
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            try:
-                M = elm.M(frequency)
-            except TypeError:
-                M = elm.M()
-
-            if synchronous:
-                if elm in self.shaft_elements:
-                    G = elm.G()
-                    for i in range(8):
-                        if i in (0, 3, 4, 7):
-                            M[i, 0] = M[i, 0] - G[i, 1]
-                            M[i, 3] = M[i, 3] + G[i, 2]
-                            M[i, 4] = M[i, 4] - G[i, 5]
-                            M[i, 7] = M[i, 7] + G[i, 6]
-                        else:
-                            M[i, 1] = M[i, 1] + G[i, 0]
-                            M[i, 2] = M[i, 2] - G[i, 3]
-                            M[i, 5] = M[i, 5] + G[i, 4]
-                            M[i, 6] = M[i, 6] - G[i, 7]
-                elif elm in self.disk_elements:
-                    G = elm.G()
-                    M[2, 2] = M[2, 2] - G[2, 3]
-                    M[3, 3] = M[3, 3] + G[3, 2]
-
-            M0[np.ix_(dofs, dofs)] += M
+        def build(sparse):
+            matrices = self._constant_matrices("M")
+            n_shaft = len(self.shaft_elements)
+            n_disk = len(self.disk_elements)
+            for j, M in zip(self._constant_index, matrices):
+                elm = self.elements[j]
+
+                # self.elements starts with the shaft elements and the disks
+                if synchronous:
+                    if j < n_shaft:
+                        G = elm.G()
+                        for i in range(8):
+                            if i in (0, 3, 4, 7):
+                                M[i, 0] = M[i, 0] - G[i, 1]
+                                M[i, 3] = M[i, 3] + G[i, 2]
+                                M[i, 4] = M[i, 4] - G[i, 5]
+                                M[i, 7] = M[i, 7] + G[i, 6]
+                            else:
+                                M[i, 1] = M[i, 1] + G[i, 0]
+                                M[i, 2] = M[i, 2] - G[i, 3]
+                                M[i, 5] = M[i, 5] + G[i, 4]
+                                M[i, 6] = M[i, 6] - G[i, 7]
+                    elif j < n_shaft + n_disk:
+                        G = elm.G()
+                        M[2, 2] = M[2, 2] - G[2, 3]
+                        M[3, 3] = M[3, 3] + G[3, 2]
+
+            return self._assemble(matrices, self._constant_index, sparse=sparse)
+
+        M0 = self._cached_matrix(("M", synchronous), sparse, build)
+
+        matrices = self._bearing_matrices("M", frequency, self._variable_index)
+        M0 = self._add_blocks(M0, matrices, self._variable_index, sparse=sparse)
 
         return M0
 
-    def K(self, frequency, ignore=[]):
+    def K(self, frequency, ignore=[], sparse=False):
         """Stiffness matrix for an instance of a rotor.
 
         Parameters
@@ -1088,10 +1731,13 @@ class Rotor(object):
             Excitation frequency.
         ignore : list, optional
             List of elements to leave out of the matrix.
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
 
         Returns
         -------
-        K0 : np.ndarray
+        K0 : np.ndarray, scipy.sparse.csr_matrix
             Stiffness matrix for the rotor.
 
         Examples
@@ -1103,29 +1749,43 @@ class Rotor(object):
                [ 0., -6.,  1.,  0.],
                [ 6.,  0.,  0.,  1.]])
         """
-        K0 = np.zeros((self.ndof, self.ndof))
+        if not self._ignore_variable(ignore):
+            index = self._elements_index(ignore)
 
-        elements = sorted(set(self.elements) - set(ignore), key=self.elements.index)
+            matrices = [
+                _element_matrix(self.elements[i], "K", frequency) for i in index
+            ]
 
-        for elm in elements:
-            dofs = list(elm.dof_global_index.values())
-            try:
-                K0[np.ix_(dofs, dofs)] += elm.K(frequency)
-            except TypeError:
-                K0[np.ix_(dofs, dofs)] += elm.K()
+            return self._assemble(matrices, index, sparse=sparse)
+
+        def build(sparse):
+            matrices = self._constant_matrices("K")
+            return self._assemble(matrices, self._constant_index, sparse=sparse)
+
+        K0 = self._cached_matrix("K", sparse, build)
+
+        index = [i for i in self._variable_index if self.elements[i] not in ignore]
+        matrices = self._bearing_matrices("K", frequency, index)
+        K0 = self._add_blocks(K0, matrices, index, sparse=sparse)
 
         return K0
 
-    def Ksdt(self):
+    def Ksdt(self, sparse=False):
         """Dynamic stiffness matrix for an instance of a rotor.
 
         Stiffness matrix associated with the transient motion of the
         shaft and disks. It needs to be multiplied by the angular
         acceleration when considered in time dependent analyses.
 
+        Parameters
+        ----------
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
+
         Returns
         -------
-        Ksdt0 : np.ndarray
+        Ksdt0 : np.ndarray, scipy.sparse.csr_matrix
             Dynamic stiffness matrix for the rotor. Only useable to
             the 6 DoF model in variable speed analyses.
 
@@ -1140,20 +1800,28 @@ class Rotor(object):
                [  0.  ,  -0.48,   0.  ,   0.16,   0.  ,   0.  ],
                [  0.  ,   0.  ,   0.  ,   0.  ,   0.  ,   0.  ]])
         """
-        Ksdt0 = np.zeros((self.ndof, self.ndof))
 
-        if self.number_dof == 6:
-            for elm in self.shaft_elements:
-                dofs = list(elm.dof_global_index.values())
-                Ksdt0[np.ix_(dofs, dofs)] += elm.Kst()
+        def build(sparse):
+            index = []
+            matrices = []
+
+            if self.number_dof == 6:
+                # self.elements starts with the shaft elements and the disks
+                n_shaft = len(self.shaft_elements)
+                for i, elm in enumerate(self.shaft_elements):
+                    index.append(i)
+                    matrices.append(elm.Kst())
+                for i, elm in enumerate(self.disk_elements):
+                    index.append(n_shaft + i)
+                    matrices.append(elm.Kdt())
 
-            for elm in self.disk_elements:
-                dofs = list(elm.dof_global_index.values())
-                Ksdt0[np.ix_(dofs, dofs)] += elm.Kdt()
+            return self._assemble(matrices, index, sparse=sparse)
+
+        Ksdt0 = self._cached_matrix("Ksdt", sparse, build)
 
         return Ksdt0
 
-    def C(self, frequency, ignore=[]):
+    def C(self, frequency, ignore=[], sparse=False):
         """Damping matrix for an instance of a rotor.
 
         Parameters
@@ -1162,10 +1830,13 @@ class Rotor(object):
             Excitation frequency.
         ignore : list, optional
             List of elements to leave out of the matrix.
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
 
         Returns
         -------
-        C0 : np.ndarray
+        C0 : np.ndarray, scipy.sparse.csr_matrix
             Damping matrix for the rotor.
 
         Examples
@@ -1177,25 +1848,39 @@ class Rotor(object):
                [0., 0., 0., 0.],
                [0., 0., 0., 0.]])
         """
-        C0 = np.zeros((self.ndof, self.ndof))
+        if not self._ignore_variable(ignore):
+            index = self._elements_index(ignore)
+
+            matrices = [
+                _element_matrix(self.elements[i], "C", frequency) for i in index
+            ]
 
-        elements = sorted(set(self.elements) - set(ignore), key=self.elements.index)
+            return self._assemble(matrices, index, sparse=sparse)
 
-        for elm in elements:
-            dofs = list(elm.dof_global_index.values())
-            try:
-                C0[np.ix_(dofs, dofs)] += elm.C(frequency)
-            except TypeError:
-                C0[np.ix_(dofs, dofs)] += elm.C()
+        def build(sparse):
+            matrices = self._constant_matrices("C")
+            return self._assemble(matrices, self._constant_index, sparse=sparse)
+
+        C0 = self._cached_matrix("C", sparse, build)
+
+        index = [i for i in self._variable_index if self.elements[i] not in ignore]
+        matrices = self._bearing_matrices("C", frequency, index)
+        C0 = self._add_blocks(C0, matrices, index, sparse=sparse)
 
         return C0
 
-    def G(self):
+    def G(self, sparse=False):
         """Gyroscopic matrix for an instance of a rotor.
 
+        Parameters
+        ----------
+        sparse : bool, optional
+            If True, the matrix is returned as a scipy.sparse.csr_matrix.
+            Default is False.
+
         Returns
         -------
-        G0 : np.ndarray
+        G0 : np.ndarray, scipy.sparse.csr_matrix
             Gyroscopic matrix for the rotor.
 
         Examples
@@ -1207,11 +1892,12 @@ class Rotor(object):
                [ 0.00022681,  0.        ,  0.        ,  0.0001524 ],
                [ 0.        ,  0.00022681, -0.0001524 ,  0.        ]])
         """
-        G0 = np.zeros((self.ndof, self.ndof))
 
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            G0[np.ix_(dofs, dofs)] += elm.G()
+        def build(sparse):
+            matrices = [elm.G() for elm in self.elements]
+            return self._assemble(matrices, range(len(self.elements)), sparse=sparse)
+
+        G0 = self._cached_matrix("G", sparse, build)
 
         return G0
 
@@ -1251,10 +1937,14 @@ class Rotor(object):
         Z = np.zeros((self.ndof, self.ndof))
         I = np.eye(self.ndof)
 
+        # factorize M once and use it for both blocks (banded Cholesky for
+        # long rotors, see ross.utils._factorize)
+        solve_M = _factorize(self.M(frequency, synchronous=synchronous), symmetric=True)
+
         # fmt: off
         A = np.vstack(
             [np.hstack([Z, I]),
-             np.hstack([la.solve(-self.M(frequency, synchronous=synchronous), self.K(frequency)), la.solve(-self.M(frequency,synchronous=synchronous), (self.C(frequency) + self.G() * speed))])])
+             np.hstack([-solve_M(self.K(frequency)), -solve_M(self.C(frequency) + self.G() * speed)])])
         # fmt: on
 
         return A
@@ -1363,56 +2053,155 @@ class Rotor(object):
         return speed_range
 
     @staticmethod
-    def _index(eigenvalues):
-        """Generate indexes to sort eigenvalues and eigenvectors.
+    def _dense(matrix):
+        """Return matrix as a np.ndarray, converting it if it is sparse."""
+        if issparse(matrix):
+            return matrix.toarray()
+        return matrix
 
-        Function used to generate an index that will sort
-        eigenvalues and eigenvectors based on the imaginary (wd)
-        part of the eigenvalues. Positive eigenvalues will be
-        positioned at the first half of the array.
+    def _map(self, method, args_list, executor=None, n_jobs=None):
+        """Evaluate a rotor method for each set of arguments in a list.
+
+        This is used by the speed sweeps (e.g. run_campbell, run_freq_response,
+        run_ucs), in which each point is an independent solve.
 
         Parameters
         ----------
-        eigenvalues: array
-            Array with the eigenvalues.
+        method : str
+            Name of the rotor method to be called.
+        args_list : list
+            List with the tuple of positional arguments of each call.
+        executor : str, concurrent.futures.Executor, optional
+            If None, the points are evaluated serially.
+            If "process", a ProcessPoolExecutor is used and the rotor is sent
+            once to each worker process when the pool is created.
+            If "thread", a ThreadPoolExecutor is used.
+            Any object with a map(func, iterable) method (such as an instance of
+            concurrent.futures.Executor) can also be passed. In this case the
+            rotor is sent with each task.
+            With threads and executor objects, each task is evaluated on a copy
+            of the rotor (see Rotor._worker_copy()), so the workers do not
+            write to the caches of the rotor.
+            Default is None.
+        n_jobs : int, optional
+            Number of workers used when executor is "process" or "thread".
+            Default is None (number of processors in the machine).
 
         Returns
         -------
-        idx:
-            An array with indices that will sort the
-            eigenvalues and eigenvectors.
+        results : list
+            List with the results, in the same order as args_list.
 
         Examples
         --------
         >>> rotor = rotor_example()
-        >>> evalues, evectors = rotor._eigen(0, sorted_=True)
-        >>> idx = rotor._index(evalues)
-        >>> idx[:6] # doctest: +ELLIPSIS
-        array([0, 1, 2, 3, 4, ...
+        >>> modal = rotor._map("run_modal", [(0,), (100,)], executor="thread", n_jobs=2)
+        >>> np.round(modal[1].wn[0], 2)
+        91.79
         """
-        # avoid float point errors when sorting
-        evals_truncated = np.around(eigenvalues, decimals=10)
-        a = np.imag(evals_truncated)  # First column
-        b = np.absolute(evals_truncated)  # Second column
-        ind = np.lexsort((b, a))  # Sort by imag (wd), then by absolute (wn)
-        # Positive eigenvalues first
-        positive = [i for i in ind[len(a) // 2 :]]
-        negative = [i for i in ind[: len(a) // 2]]
+        args_list = list(args_list)
 
-        idx = np.array([positive, negative]).flatten()
+        if executor is None:
+            return [getattr(self, method)(*args) for args in args_list]
 
-        return idx
+        if executor == "process":
+            n_workers = n_jobs or os.cpu_count() or 1
+            chunksize = max(1, len(args_list) // (4 * n_workers))
+            with ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_init_worker, initargs=(self,)
+            ) as pool:
+                tasks = [(method, args) for args in args_list]
+                return list(pool.map(_call_worker, tasks, chunksize=chunksize))
 
-    @check_units
-    def _eigen(
-        self,
-        speed,
-        num_modes=12,
+        if executor == "thread":
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                return list(pool.map(partial(_call_method, self, method), args_list))
+
+        if isinstance(executor, str):
+            raise ValueError(
+                f"executor can be None, 'process', 'thread' or an executor object. "
+                f"{executor} is not valid"
+            )
+
+        return list(executor.map(partial(_call_method, self, method), args_list))
+
+    def _worker_copy(self):
+        """Shallow copy of the rotor used by a worker in Rotor._map().
+
+        The elements and the cached matrices are shared, but the copy has its
+        own matrix cache, so the matrices built by a worker are not written to
+        this rotor. The bearing table is only read by the workers.
+
+        Returns
+        -------
+        rotor : ross.Rotor
+            Copy of the rotor.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> worker = rotor._worker_copy()
+        >>> _ = worker.M(0)
+        >>> len(rotor._matrix_cache), len(worker._matrix_cache)
+        (0, 1)
+        """
+        rotor = copy(self)
+        rotor._matrix_cache = dict(self._matrix_cache)
+
+        return rotor
+
+    @staticmethod
+    def _index(eigenvalues):
+        """Generate indexes to sort eigenvalues and eigenvectors.
+
+        Function used to generate an index that will sort
+        eigenvalues and eigenvectors based on the imaginary (wd)
+        part of the eigenvalues. Positive eigenvalues will be
+        positioned at the first half of the array.
+
+        Parameters
+        ----------
+        eigenvalues: array
+            Array with the eigenvalues.
+
+        Returns
+        -------
+        idx:
+            An array with indices that will sort the
+            eigenvalues and eigenvectors.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> evalues, evectors = rotor._eigen(0, sorted_=True)
+        >>> idx = rotor._index(evalues)
+        >>> idx[:6] # doctest: +ELLIPSIS
+        array([0, 1, 2, 3, 4, ...
+        """
+        # avoid float point errors when sorting
+        evals_truncated = np.around(eigenvalues, decimals=10)
+        a = np.imag(evals_truncated)  # First column
+        b = np.absolute(evals_truncated)  # Second column
+        ind = np.lexsort((b, a))  # Sort by imag (wd), then by absolute (wn)
+        # Positive eigenvalues first
+        positive = [i for i in ind[len(a) // 2 :]]
+        negative = [i for i in ind[: len(a) // 2]]
+
+        idx = np.array([positive, negative]).flatten()
+
+        return idx
+
+    @check_units
+    def _eigen(
+        self,
+        speed,
+        num_modes=12,
         frequency=None,
         sorted_=True,
         A=None,
         sparse=True,
         synchronous=False,
+        v0=None,
     ):
         """Calculate eigenvalues and eigenvectors.
 
@@ -1441,11 +2230,15 @@ class Rotor(object):
             Matrix for which eig will be calculated.
             Defaul is the rotor A matrix.
         sparse : bool, optional
-            If sparse, eigenvalues will be calculated with arpack.
+            If sparse, eigenvalues will be calculated with arpack. If A is not
+            given, the sparse linearized pencil is used (see Rotor._eigs_pencil()).
             Default is True.
         synchronous : bool, optional
             If True a synchronous analysis is carried out.
             Default is False.
+        v0 : array, optional
+            Starting vector for ARPACK, e.g. a combination of the eigenvectors
+            calculated at a close speed. Default is random.
 
         Returns
         -------
@@ -1461,11 +2254,14 @@ class Rotor(object):
         >>> evalues[0].imag # doctest: +ELLIPSIS
         91.796...
         """
-        if A is None:
+        # without a given A matrix, ARPACK works on the sparse linearized pencil
+        use_pencil = A is None and sparse is True and not synchronous
+
+        if A is None and not use_pencil:
             A = self.A(speed=speed, frequency=frequency, synchronous=synchronous)
 
         if synchronous:
-            evalues, evectors = la.eig(A)
+            evalues, evectors = la.eig(self._dense(A))
             idx = np.where(np.imag(evalues) != 0)[0]
             evalues = evalues[idx]
             evectors = evectors[:, idx]
@@ -1475,26 +2271,30 @@ class Rotor(object):
         else:
             if sparse is True:
                 try:
-                    evalues, evectors = las.eigs(
-                        A,
-                        k=2 * num_modes,
-                        sigma=1,
-                        ncv=4 * num_modes,
-                        which="LM",
-                        v0=self._v0,
-                    )
-                    # store v0 as a linear combination of the previously
-                    # calculated eigenvectors to use in the next call to eigs
-                    self._v0 = np.real(sum(evectors.T))
+                    if use_pencil:
+                        evalues, evectors = self._eigs_pencil(
+                            speed, frequency, num_modes, v0=v0
+                        )
+                    else:
+                        evalues, evectors = las.eigs(
+                            A,
+                            k=2 * num_modes,
+                            sigma=1,
+                            ncv=4 * num_modes,
+                            which="LM",
+                            v0=v0,
+                        )
 
                     # Disregard rigid body modes:
                     idx = np.where(np.abs(evalues) > 0.1)[0]
                     evalues = evalues[idx]
                     evectors = evectors[:, idx]
                 except las.ArpackError:
-                    evalues, evectors = la.eig(A)
+                    if A is None:
+                        A = self.A(speed=speed, frequency=frequency)
+                    evalues, evectors = la.eig(self._dense(A))
             else:
-                evalues, evectors = la.eig(A)
+                evalues, evectors = la.eig(self._dense(A))
 
         if sorted_ is False:
             return evalues, evectors
@@ -1503,6 +2303,107 @@ class Rotor(object):
 
         return evalues[idx], evectors[:, idx]
 
+    def _pencil(self, speed, frequency=None):
+        """Sparse linearized pencil of the quadratic eigenvalue problem.
+
+        The equation of motion is written in the first order form B x' = A x,
+        with x = [q, q']:
+
+            A = [[0, I], [-K, -(C + G * speed)]]
+            B = [[I, 0], [0, M]]
+
+        The eigenvalues of the pencil (A, B) are the eigenvalues of the state
+        space matrix returned by Rotor.A(), but the inverse of M is never formed.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed.
+        frequency : float, optional
+            Excitation frequency. Default is rotor speed.
+
+        Returns
+        -------
+        A, B : scipy.sparse.csc_matrix
+            Matrices of the linearized pencil.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> A, B = rotor._pencil(speed=0)
+        >>> A.shape
+        (56, 56)
+        """
+        if frequency is None:
+            frequency = speed
+
+        M = self.M(frequency, sparse=True)
+        K = self.K(frequency, sparse=True)
+        C = self.C(frequency, sparse=True) + self.G(sparse=True) * speed
+        I = identity(M.shape[0], format="csr")
+
+        A = bmat([[None, I], [-K, -C]], format="csc")
+        B = block_diag([I, M], format="csc")
+
+        return A, B
+
+    def _eigs_pencil(self, speed, frequency=None, num_modes=12, sigma=1, v0=None):
+        """Calculate eigenvalues and eigenvectors with shift-invert on the pencil.
+
+        ARPACK is used in shift-invert mode on the generalized problem
+        A x = lambda B x (see Rotor._pencil()), with the operator
+        (A - sigma * B)^-1 applied with a sparse LU factorization. Only
+        2 * num_modes eigenpairs closest to sigma are extracted.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed.
+        frequency : float, optional
+            Excitation frequency. Default is rotor speed.
+        num_modes : int, optional
+            Number of modes to be calculated. Default is 12.
+        sigma : float, optional
+            Shift used in the shift-invert mode. Default is 1.
+        v0 : array, optional
+            Starting vector for ARPACK. Default is random.
+
+        Returns
+        -------
+        evalues : array
+            Array with the eigenvalues.
+        evectors : array
+            Array with the eigenvectors of the state space matrix.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> evalues, evectors = rotor._eigs_pencil(0)
+        >>> np.round(np.sort(np.abs(evalues.imag))[0], 3)
+        91.797
+        """
+        A, B = self._pencil(speed, frequency)
+        n = A.shape[0]
+        k = 2 * num_modes
+
+        if k >= n - 1:
+            # ARPACK requires k < n - 1, all eigenvalues are calculated instead
+            return la.eig(self._dense(self.A(speed=speed, frequency=frequency)))
+
+        lu = las.splu(A - sigma * B)
+        OPinv = las.LinearOperator((n, n), matvec=lu.solve, dtype=A.dtype)
+
+        return las.eigs(
+            A,
+            k=k,
+            M=B,
+            sigma=sigma,
+            OPinv=OPinv,
+            ncv=min(2 * k, n),
+            which="LM",
+            v0=v0,
+        )
+
     def _lti(self, speed, frequency=None):
         """Continuous-time linear time invariant system.
 
@@ -1540,9 +2441,10 @@ class Rotor(object):
         if frequency is None:
             frequency = speed
         A = self.A(speed=speed, frequency=frequency)
+        solve_M = _factorize(self.M(frequency), symmetric=True)
         # fmt: off
         B = np.vstack([Z,
-                       la.solve(self.M(frequency), B2)])
+                       solve_M(B2)])
         # fmt: on
 
         # y = Cx + Du
@@ -1552,9 +2454,9 @@ class Rotor(object):
         Ca = Z
 
         # fmt: off
-        C = np.hstack((Cd - Ca @ la.solve(self.M(frequency), self.K(frequency)), Cv - Ca @ la.solve(self.M(frequency), self.C(frequency))))
+        C = np.hstack((Cd - Ca @ solve_M(self.K(frequency)), Cv - Ca @ solve_M(self.C(frequency))))
         # fmt: on
-        D = Ca @ la.solve(self.M(frequency), B2)
+        D = Ca @ solve_M(B2)
 
         sys = signal.lti(A, B, C, D)
 
@@ -1600,6 +2502,32 @@ class Rotor(object):
         226.92798
         """
 
+        return self._projection(self._modal_basis(speed, num_modes))
+
+    def _modal_basis(self, speed, num_modes):
+        """Undamped modes used as a basis for model reduction.
+
+        The modes are calculated without the cross-coupled coefficients of the
+        bearings, so that the eigenvalue problem is symmetric.
+
+        Parameters
+        ----------
+        speed : float
+            Rotor speed.
+        num_modes : int
+            The number of modes.
+
+        Returns
+        -------
+        modal_matrix : array
+            Array with the mode shapes (columns), shape (ndof, num_modes).
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> rotor._modal_basis(0, num_modes=12).shape
+        (28, 12)
+        """
         M = self.M(speed)
         K_aux = self.K(speed)
 
@@ -1613,15 +2541,42 @@ class Rotor(object):
             K_aux[np.ix_(dofs, dofs)] -= elm.K(speed) * rmv_cross_coeffs
 
         _, modal_matrix = la.eigh(K_aux, M)
-        modal_matrix = modal_matrix[:, :num_modes]
 
-        matrix_to_modal = lambda array: (modal_matrix.T @ array) @ modal_matrix
-        vector_to_modal = lambda array: modal_matrix.T @ array
-        vector_from_modal = lambda array: modal_matrix @ array
+        return modal_matrix[:, :num_modes]
+
+    @staticmethod
+    def _projection(basis):
+        """Functions to project arrays on a reduction basis.
+
+        Parameters
+        ----------
+        basis : array
+            Array with the basis vectors (columns), shape (ndof, n).
+
+        Returns
+        -------
+        matrix_to_modal : callable
+            Function to transform a square matrix from physical to reduced space.
+        vector_to_modal : callable
+            Function to transform a vector from physical to reduced space.
+        vector_from_modal : callable
+            Function to transform a vector from reduced to physical space.
+        """
+        matrix_to_modal = lambda array: (basis.T @ array) @ basis
+        vector_to_modal = lambda array: basis.T @ array
+        vector_from_modal = lambda array: basis @ array
 
         return matrix_to_modal, vector_to_modal, vector_from_modal
 
-    def transfer_matrix(self, speed=None, frequency=None, modes=None):
+    def transfer_matrix(
+        self,
+        speed=None,
+        frequency=None,
+        modes=None,
+        method="modal",
+        inputs=None,
+        outputs=None,
+    ):
         """Calculate the fer matrix for the frequency response function (FRF).
 
         Paramenters
@@ -1633,22 +2588,62 @@ class Rotor(object):
         modes : list, optional
             List with modes used to calculate the matrix.
             (all modes will be used if a list is not given).
+        method : str, optional
+            If "modal", the matrix is obtained by modal superposition from the
+            complete eigendecomposition of the state space matrix.
+            If "direct", the dynamic stiffness matrix
+            Z = K + 1j * w * (C + G * speed) - w**2 * M
+            is factorized with a sparse LU decomposition and H = Z^-1, which
+            is much cheaper for large models. The modes argument is not
+            available with this method.
+            Default is "modal".
+        inputs : array, optional
+            Degrees of freedom kept in the first axis (rows) of the matrix.
+            Default is None (all degrees of freedom).
+        outputs : array, optional
+            Degrees of freedom kept in the second axis (columns) of the matrix.
+            Only these columns are solved for. Default is None (all degrees of
+            freedom).
 
         Returns
         -------
         H : matrix
-            System transfer matrix
+            System transfer matrix with shape (len(inputs), len(outputs)).
 
         Example
         -------
         >>> rotor = rotor_example()
         >>> speed = 100.0
         >>> H = rotor.transfer_matrix(speed=speed)
+        >>> H_direct = rotor.transfer_matrix(speed=speed, method="direct")
+        >>> np.allclose(H, H_direct)
+        True
+
+        Only a few entries of the matrix can be calculated:
+        >>> H_13 = rotor.transfer_matrix(speed=speed, inputs=[13], outputs=[12, 13])
+        >>> np.allclose(H_13, H[[13], :][:, [12, 13]])
+        True
         """
-        lti = self._lti(speed=speed)
-        B = lti.B
-        C = lti.C
-        D = lti.D
+        if frequency is None:
+            frequency = speed
+
+        if inputs is None:
+            inputs = np.arange(self.ndof)
+        if outputs is None:
+            outputs = np.arange(self.ndof)
+
+        if method == "direct":
+            if modes is not None:
+                raise ValueError("modes can only be selected with method='modal'.")
+
+            Z = self._dynamic_stiffness(speed, speed, frequency)
+            rhs = np.eye(self.ndof, dtype=complex)[:, outputs]
+            return las.splu(Z).solve(rhs)[inputs]
+
+        if method != "modal":
+            raise ValueError(
+                f"method can be 'modal' or 'direct'. {method} is not valid"
+            )
 
         # calculate eigenvalues and eigenvectors using la.eig to get
         # left and right eigenvectors.
@@ -1668,12 +2663,94 @@ class Rotor(object):
             psi = psi[np.ix_(range(2 * n), idx)]
             psi_inv = psi_inv[np.ix_(idx, range(2 * n))]
 
-        diag = np.diag([1 / (1j * speed - lam) for lam in evals])
+        diag = 1 / (1j * speed - evals)
+
+        # the input matrix of the state space system is [0, M^-1] and the
+        # output matrix is [I, 0], so only the corresponding blocks are used
+        M_inv = _factorize(self.M(frequency), symmetric=True)(
+            np.eye(self.ndof)[:, outputs]
+        )
+        psi_inv_B = psi_inv[:, self.ndof :] @ M_inv
 
-        H = C @ psi @ diag @ psi_inv @ B + D
+        H = (psi[inputs] * diag) @ psi_inv_B
 
         return H
 
+    def _response_dofs(self, dofs):
+        """Global dof indexes from a list of dofs and/or probes.
+
+        Parameters
+        ----------
+        dofs : list
+            Items can be global dof indexes or ross.Probe objects. Radial probes
+            select the x and y dofs of the probe node and axial probes select the
+            z dof. If None, all dofs are selected.
+
+        Returns
+        -------
+        dofs : np.ndarray
+            Sorted array with the unique global dof indexes.
+
+        Examples
+        --------
+        >>> from ross.probe import Probe
+        >>> rotor = rotor_example()
+        >>> rotor._response_dofs([Probe(3, 0), 2])
+        array([ 2, 12, 13])
+        """
+        if dofs is None:
+            return np.arange(self.ndof)
+
+        indexes = []
+        for dof in dofs:
+            if isinstance(dof, Probe):
+                # link nodes only have the lateral dofs
+                first = self.number_dof * dof.node
+                if dof.node in self.link_nodes:
+                    first -= (dof.node - self.nodes[-1] - 1) * self.number_dof // 2
+
+                if dof.direction == "axial":
+                    if self.number_dof != 6:
+                        raise ValueError("Axial probes require a 6 dof model.")
+                    indexes.append(first + 2)
+                else:
+                    indexes.extend(first + np.array([0, 1]))
+            else:
+                indexes.append(int(dof))
+
+        return np.unique(indexes)
+
+    def _dynamic_stiffness(self, omega, speed, frequency=None):
+        """Dynamic stiffness matrix.
+
+        Z = K + 1j * omega * (C + G * speed) - omega**2 * M
+
+        Parameters
+        ----------
+        omega : float
+            Excitation frequency (rad/s).
+        speed : float
+            Rotor speed (rad/s).
+        frequency : float, optional
+            Frequency used to evaluate the bearing coefficients.
+            Default is omega.
+
+        Returns
+        -------
+        Z : scipy.sparse.csc_matrix
+            Complex dynamic stiffness matrix.
+        """
+        if frequency is None:
+            frequency = omega
+
+        M = self.M(frequency, sparse=True)
+        K = self.K(frequency, sparse=True)
+        C = self.C(frequency, sparse=True) + self.G(sparse=True) * speed
+
+        Z = K + 1j * omega * C - omega**2 * M
+
+        return Z.tocsc()
+
     def run_freq_response(
         self,
         speed_range=None,
@@ -1682,6 +2759,11 @@ class Rotor(object):
         num_modes=12,
         num_points=10,
         rtol=0.005,
+        executor=None,
+        n_jobs=None,
+        method="modal",
+        inputs=None,
+        outputs=None,
     ):
         """Frequency response for a mdof system.
 
@@ -1723,6 +2805,28 @@ class Rotor(object):
             Tolerance (relative) for termination. Applied to scipy.optimize.newton to
             calculate the approximated critical speeds.
             Default is 0.005 (0.5%).
+        executor : str, concurrent.futures.Executor, optional
+            Executor used to calculate the transfer matrix of each frequency in
+            parallel. It can be "process", "thread" or an executor object
+            (see Rotor._map()). Default is None (serial execution).
+        n_jobs : int, optional
+            Number of workers used by the executor.
+            Default is None (number of processors in the machine).
+        method : str, optional
+            Method used to calculate the transfer matrix at each frequency.
+            If "modal", modal superposition from the full eigendecomposition is used.
+            If "direct", the dynamic stiffness matrix is factorized at each
+            frequency, which scales much better for large models.
+            See Rotor.transfer_matrix() for more details.
+            Default is "modal".
+        inputs : list, optional
+            Input degrees of freedom to be stored. Items can be global dof
+            indexes or ross.Probe objects (the lateral dofs of the probe node
+            are used, or the axial dof for axial probes).
+            Default is None (all degrees of freedom).
+        outputs : list, optional
+            Output degrees of freedom to be stored, with the same options as
+            inputs. Default is None (all degrees of freedom).
 
         Returns
         -------
@@ -1745,6 +2849,20 @@ class Rotor(object):
         >>> np.angle(response.freq_resp) # doctest: +ELLIPSIS
         array([[[...
 
+        Using the direct method, which factorizes the dynamic stiffness matrix:
+        >>> response_direct = rotor.run_freq_response(speed_range=speed, method="direct")
+        >>> np.allclose(response_direct.freq_resp, response.freq_resp)
+        True
+
+        Storing only the dofs that will be plotted:
+        >>> response_13 = rotor.run_freq_response(
+        ...     speed_range=speed, inputs=[13], outputs=[13]
+        ... )
+        >>> response_13.freq_resp.shape
+        (1, 1, 101)
+        >>> np.allclose(response_13.freq_resp[0, 0], response.freq_resp[13, 13])
+        True
+
         Using clustered points option.
         Set `cluster_points=True` and choose how many modes the method must search and
         how many points to add just before and after each critical speed.
@@ -1782,22 +2900,48 @@ class Rotor(object):
 
         self._check_frequency_array(speed_range)
 
-        freq_resp = np.empty((self.ndof, self.ndof, len(speed_range)), dtype=complex)
-        velc_resp = np.empty((self.ndof, self.ndof, len(speed_range)), dtype=complex)
-        accl_resp = np.empty((self.ndof, self.ndof, len(speed_range)), dtype=complex)
+        with self._tabulated_bearings(speed_range):
+
+            inp_dofs = self._response_dofs(inputs)
+            out_dofs = self._response_dofs(outputs)
+
+            freq_resp = np.empty(
+                (len(inp_dofs), len(out_dofs), len(speed_range)), complex
+            )
+
+            H_list = None
+            if executor is not None:
+                H_list = self._map(
+                    "transfer_matrix",
+                    [
+                        (speed, None, modes, method, inp_dofs, out_dofs)
+                        for speed in speed_range
+                    ],
+                    executor,
+                    n_jobs,
+                )
 
-        for i, speed in enumerate(speed_range):
-            H = self.transfer_matrix(speed=speed, modes=modes)
-            freq_resp[..., i] = H
-            velc_resp[..., i] = 1j * speed * H
-            accl_resp[..., i] = -(speed**2) * H
+            for i, speed in enumerate(speed_range):
+                if H_list is None:
+                    H = self.transfer_matrix(
+                        speed=speed,
+                        modes=modes,
+                        method=method,
+                        inputs=inp_dofs,
+                        outputs=out_dofs,
+                    )
+                else:
+                    H = H_list[i]
+                freq_resp[..., i] = H
 
         results = FrequencyResponseResults(
             freq_resp=freq_resp,
-            velc_resp=velc_resp,
-            accl_resp=accl_resp,
+            velc_resp=None,
+            accl_resp=None,
             speed_range=speed_range,
             number_dof=self.number_dof,
+            inputs=None if inputs is None else inp_dofs,
+            outputs=None if outputs is None else out_dofs,
         )
 
         return results
@@ -1900,14 +3044,12 @@ class Rotor(object):
             speed_range, modes, cluster_points, num_modes, num_points, rtol
         )
 
-        forced_resp = np.zeros((self.ndof, len(freq_resp.speed_range)), dtype=complex)
-        velc_resp = np.zeros((self.ndof, len(freq_resp.speed_range)), dtype=complex)
-        accl_resp = np.zeros((self.ndof, len(freq_resp.speed_range)), dtype=complex)
+        n_freq = len(freq_resp.speed_range)
+        forced_resp = np.einsum("ijk,jk->ik", freq_resp.freq_resp, force[:, :n_freq])
 
-        for i in range(len(freq_resp.speed_range)):
-            forced_resp[:, i] = freq_resp.freq_resp[..., i] @ force[..., i]
-            velc_resp[:, i] = freq_resp.velc_resp[..., i] @ force[..., i]
-            accl_resp[:, i] = freq_resp.accl_resp[..., i] @ force[..., i]
+        omega = np.asarray(freq_resp.speed_range)
+        velc_resp = 1j * omega * forced_resp
+        accl_resp = -(omega**2) * forced_resp
 
         forced_resp = ForcedResponseResults(
             rotor=self,
@@ -1950,6 +3092,7 @@ class Rotor(object):
         >>> rotor._unbalance_force(3, 10.0, 0.0, speed)[12] # doctest: +ELLIPSIS
         array([0.000e+00+0.j, 1.000e+03+0.j, 4.000e+03+0.j, ...
         """
+        omega = np.asarray(omega)
         F0 = np.zeros((self.ndof, len(omega)), dtype=np.complex128)
 
         b0 = np.zeros((self.number_dof), dtype=np.complex128)
@@ -1959,8 +3102,7 @@ class Rotor(object):
 
         n0 = self.number_dof * node
         n1 = n0 + self.number_dof
-        for i, w in enumerate(omega):
-            F0[n0:n1, i] += w**2 * b0
+        F0[n0:n1] += np.outer(b0, omega**2)
 
         return F0
 
@@ -2117,6 +3259,82 @@ class Rotor(object):
 
         return forced_response
 
+    @check_units
+    def run_unbalance_batch(
+        self, node, unbalance_magnitude, unbalance_phase, frequency, dofs=None
+    ):
+        """Unbalance response for a batch of unbalance configurations.
+
+        The dynamic stiffness matrix is factorized once for each frequency and
+        the responses to all configurations are obtained with a single solve
+        with multiple right-hand sides. This is useful for influence coefficient
+        balancing studies with many trial weights.
+
+        Parameters
+        ----------
+        node : array
+            Nodes where the unbalances are applied, with shape
+            (n_cases, n_planes). A 1D array is treated as one plane per case.
+        unbalance_magnitude : array, pint.Quantity
+            Unbalance magnitudes (kg.m) with the same shape as node.
+        unbalance_phase : array, pint.Quantity
+            Unbalance phases (rad) with the same shape as node.
+        frequency : array, pint.Quantity
+            Array with the desired range of frequencies (rad/s).
+        dofs : list, optional
+            Degrees of freedom returned. Items can be global dof indexes or
+            ross.Probe objects (see Rotor._response_dofs()).
+            Default is None (all degrees of freedom).
+
+        Returns
+        -------
+        response : np.ndarray
+            Complex response with shape (n_cases, len(dofs), len(frequency)).
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> speed = np.linspace(0, 1000, 101)
+        >>> response = rotor.run_unbalance_batch(
+        ...     node=[3, 3, 4], unbalance_magnitude=[10.0, 5.0, 10.0],
+        ...     unbalance_phase=[0.0, np.pi, 0.0], frequency=speed
+        ... )
+        >>> response.shape
+        (3, 28, 101)
+        >>> unb = rotor.run_unbalance_response(3, 10.0, 0.0, speed)
+        >>> np.allclose(response[0], unb.forced_resp)
+        True
+        """
+        node, magnitude, phase = np.broadcast_arrays(
+            np.asarray(node, dtype=int), unbalance_magnitude, unbalance_phase
+        )
+        if node.ndim == 1:
+            node, magnitude, phase = node[:, None], magnitude[:, None], phase[:, None]
+
+        frequency = np.asarray(frequency)
+        dofs = self._response_dofs(dofs)
+        n_cases = node.shape[0]
+
+        # unbalance force per unit of squared speed for each case (columns)
+        case = np.repeat(np.arange(n_cases), node.shape[1])
+        n0 = self.number_dof * node.ravel()
+        unbalance = (magnitude * np.exp(1j * phase)).ravel()
+        F = np.zeros((self.ndof, n_cases), dtype=complex)
+        np.add.at(F, (n0, case), unbalance)
+        np.add.at(F, (n0 + 1, case), -1j * unbalance)
+
+        with self._tabulated_bearings(frequency):
+
+            response = np.zeros((n_cases, len(dofs), len(frequency)), dtype=complex)
+            for i, w in enumerate(frequency):
+                if w == 0:
+                    # unbalance forces vanish at rest
+                    continue
+                Z = self._dynamic_stiffness(w, w)
+                response[..., i] = las.splu(Z).solve(w**2 * F)[dofs].T
+
+        return response
+
     def integrate_system(self, speed, F, t, **kwargs):
         """Time integration for a rotor system.
 
@@ -2134,11 +3352,18 @@ class Rotor(object):
         **kwargs : optional
             Additional keyword arguments can be passed to define the parameters
             of the Newmark method if it is used (e.g. `gamma`, `beta`, `tol`, ...).
+            The adaptive time step (HHT-alpha) integration is chosen with
+            `adaptive=True` (see also `alpha`, `rtol` and `atol`), in which case
+            `t` defines the initial time step and the output times. With a
+            constant speed, `reuse_factorization` is True by default.
             See `newmark` for more details. Other optional arguments are listed
             below.
         num_modes : int, optional
             If `num_modes` is passed as argument, the pseudo-modal method is applied reducing
             the model to the chosen number of modes.
+        basis : array, optional
+            Reduction basis with shape (ndof, n) used instead of the pseudo-modal
+            basis (e.g. ReducedRotor.basis). The model is integrated with n dofs.
         add_to_RHS : callable, optional
             An optional function that computes and returns an additional array to be added to
             the right-hand side of the equation of motion. This function should take the time
@@ -2148,13 +3373,23 @@ class Rotor(object):
             length as the degrees of freedom of the rotor system `rotor.ndof`. This function
             allows for the incorporation of supplementary terms or external effects in the rotor
             system dynamics beyond the specified force input during the time integration process.
+        sparse : bool, optional
+            If True, the rotor matrices are assembled as scipy.sparse matrices and the
+            Newmark iterations use a sparse solver. It has no effect if the pseudo-modal
+            method is applied. Default is False.
+        dofs : array_like, optional
+            Rotor dofs recorded in the output. Only these columns of the response are
+            stored during the integration. Default is to record all the dofs.
+        decimation : int, optional
+            Only every `decimation`-th time step is recorded (`t[::decimation]`), while
+            the integration is carried out with the time step of `t`. Default is 1.
 
         Returns
         -------
         t : ndarray
             Time values for the output.
         yout : ndarray
-            System response.
+            System response with shape (len(t), len(dofs)).
 
         Examples
         --------
@@ -2174,6 +3409,12 @@ class Rotor(object):
         >>> yout[:, dof] # doctest: +ELLIPSIS
         array([0.00000000e+00, 8.49140057e-09, 4.34296767e-08, ...,
                1.16148468e-05, 1.16492353e-05, 1.16859622e-05])
+
+        Recording a single dof every 10 time steps
+        >>> t_, yout = rotor.integrate_system(speed, F, t, dofs=[dof], decimation=10)
+        Running direct method
+        >>> yout.shape
+        (1000, 1)
         """
 
         # Check if speed is array
@@ -2186,8 +3427,12 @@ class Rotor(object):
 
         # Check if the pseudo-modal method has to be applied
         num_modes = kwargs.get("num_modes")
+        basis = kwargs.get("basis")
 
-        if num_modes and num_modes > 0:
+        if basis is not None:
+            print("Running reduced model, number of dofs =", basis.shape[1])
+            get_array = self._projection(basis)
+        elif num_modes and num_modes > 0:
             print("Running pseudo-modal method, number of modes =", num_modes)
             get_array = self._pseudo_modal(speed_ref, num_modes)
         else:
@@ -2195,10 +3440,15 @@ class Rotor(object):
             return_array = lambda array: array
             get_array = [return_array for j in range(3)]
 
+        reduced = basis is not None or bool(num_modes and num_modes > 0)
+
+        # Sparse matrices are only kept in the physical space
+        sparse = kwargs.get("sparse", False) and not reduced
+
         # Assemble matrices
-        M = get_array[0](kwargs.get("M", self.M()))
-        C2 = get_array[0](kwargs.get("G", self.G()))
-        K2 = get_array[0](kwargs.get("Ksdt", self.Ksdt()))
+        M = get_array[0](kwargs.get("M", self.M(sparse=sparse)))
+        C2 = get_array[0](kwargs.get("G", self.G(sparse=sparse)))
+        K2 = get_array[0](kwargs.get("Ksdt", self.Ksdt(sparse=sparse)))
         F = get_array[1](F.T).T
 
         # Consider any additional RHS function (extra forces)
@@ -2232,16 +3482,39 @@ class Rotor(object):
                         "The bearing coefficients vary with speed. Therefore, C and K matrices are not being replaced by the matrices defined as input arguments."
                     )
 
-                C0 = self.C(speed_ref, ignore=brgs_with_var_coeffs)
-                K0 = self.K(speed_ref, ignore=brgs_with_var_coeffs)
+                C0 = self.C(speed_ref, ignore=brgs_with_var_coeffs, sparse=sparse)
+                K0 = self.K(speed_ref, ignore=brgs_with_var_coeffs, sparse=sparse)
+
+                # the bearing coefficients are tabulated once for the speed
+                # profile and, at each step, only the bearing dofs are updated
+                index = [
+                    i
+                    for i in self._variable_index
+                    if self.elements[i] in brgs_with_var_coeffs
+                ]
+                bearing_coefficients = self._bearing_profile(
+                    [self.elements[i] for i in index], speed
+                )
+                blocks = [np.ix_(*[self._elements_dofs[i]] * 2) for i in index]
+                Cb, Kb = (C0, K0) if sparse else (np.copy(C0), np.copy(K0))
 
                 def rotor_system(step, **current_state):
-                    Cb, Kb = assemble_C_K_matrices(
-                        brgs_with_var_coeffs, np.copy(C0), np.copy(K0), speed[step]
-                    )
+                    Kbrg, Cbrg = bearing_coefficients(step)
+
+                    if sparse:
+                        Cs = C0 + self._assemble(Cbrg, index, sparse=True)
+                        Ks = K0 + self._assemble(Kbrg, index, sparse=True)
+                    else:
+                        for block in blocks:
+                            Cb[block] = C0[block]
+                            Kb[block] = K0[block]
+                        for block, Cm, Km in zip(blocks, Cbrg, Kbrg):
+                            Cb[block] += Cm
+                            Kb[block] += Km
+                        Cs, Ks = Cb, Kb
 
-                    C1 = get_array[0](Cb)
-                    K1 = get_array[0](Kb)
+                    C1 = get_array[0](Cs)
+                    K1 = get_array[0](Ks)
 
                     return (
                         M,
@@ -2251,8 +3524,8 @@ class Rotor(object):
                     )
 
             else:  # Option 2
-                C1 = get_array[0](kwargs.get("C", self.C(speed_ref)))
-                K1 = get_array[0](kwargs.get("K", self.K(speed_ref)))
+                C1 = get_array[0](kwargs.get("C", self.C(speed_ref, sparse=sparse)))
+                K1 = get_array[0](kwargs.get("K", self.K(speed_ref, sparse=sparse)))
 
                 rotor_system = lambda step, **current_state: (
                     M,
@@ -2262,20 +3535,36 @@ class Rotor(object):
                 )
 
         else:  # Option 3
-            C1 = get_array[0](kwargs.get("C", self.C(speed_ref)))
-            K1 = get_array[0](kwargs.get("K", self.K(speed_ref)))
+            C1 = get_array[0](kwargs.get("C", self.C(speed_ref, sparse=sparse)))
+            K1 = get_array[0](kwargs.get("K", self.K(speed_ref, sparse=sparse)))
+
+            # the same matrix objects are returned at every step, so that
+            # newmark factorizes the effective matrix only once
+            C = C1 + C2 * speed_ref
+            kwargs = {"reuse_factorization": True, **kwargs}
 
             rotor_system = lambda step, **current_state: (
                 M,
-                C1 + C2 * speed_ref,
+                C,
                 K1,
                 forces(step, **current_state),
             )
 
-        size = len(M)
-        response = newmark(rotor_system, t, size, **kwargs)
-        yout = get_array[2](response.T).T
-        return t, yout
+        size = M.shape[0]
+        dofs = kwargs.get("dofs")
+        decimation = kwargs.get("decimation", 1)
+
+        if dofs is None:
+            response = newmark(rotor_system, t, size, **kwargs)
+            yout = get_array[2](response.T).T
+        else:
+            # only the recorded dofs are stored; for the reduced models the
+            # rows of the basis are used as output matrix
+            dofs = np.asarray(dofs, dtype=int)
+            output = get_array[2](np.eye(size))[dofs] if reduced else dofs
+            yout = newmark(rotor_system, t, size, **{**kwargs, "output": output})
+
+        return t[::decimation], yout
 
     def time_response(self, speed, F, t, ic=None, method="default", **kwargs):
         """Time response for a rotor.
@@ -2296,6 +3585,13 @@ class Rotor(object):
             The initial conditions on the state vector (zero by default).
         method : str, optional
             The Newmark method can be chosen by setting `method='newmark'`.
+            With `method='modal'`, the state space system is diagonalized once
+            and each mode is propagated exactly over the time step, which
+            requires a uniform time step (see `ross.utils.modal_propagation`).
+            The modal basis can be truncated with the `num_modes` keyword
+            argument (number of eigenvalues kept), and the state vector is not
+            returned (xout is empty).
+            Default is 'default' (scipy.signal.lsim).
         **kwargs : optional
             Additional keyword arguments can be passed to define the parameters
             of the Newmark method if it is used (e.g. gamma, beta, tol, ...).
@@ -2303,6 +3599,8 @@ class Rotor(object):
             Other keyword arguments can also be passed to be used in numerical
             integration (e.g. num_modes, add_to_RHS).
             See `Rotor.integrate_system` for more details.
+            The recorded dofs (`dofs`) and the output decimation (`decimation`)
+            can be chosen with all the methods.
 
         Returns
         -------
@@ -2322,6 +3620,11 @@ class Rotor(object):
         >>> F = np.ones((size, rotor.ndof))
         >>> rotor.time_response(speed, F, t) # doctest: +ELLIPSIS
         (array([0.        , 0.18518519, 0.37037037, ...
+
+        Exact propagation in the modal basis
+        >>> t_, yout, _ = rotor.time_response(speed, F, t, method="modal")
+        >>> np.allclose(yout, rotor.time_response(speed, F, t)[1])
+        True
         """
         speed_is_array = isinstance(speed, (list, tuple, np.ndarray))
 
@@ -2329,9 +3632,30 @@ class Rotor(object):
             t_, yout = self.integrate_system(speed, F, t, **kwargs)
             return t_, yout, []
 
+        dofs = kwargs.get("dofs")
+        decimation = kwargs.get("decimation", 1)
+
+        if method.lower() == "modal":
+            solve_M = _factorize(self.M(speed), symmetric=True)
+            # B @ u = [0, M^-1 @ u], without forming the inverse of M
+            B = lambda u: np.vstack([np.zeros_like(u), solve_M(u)])
+            yout = modal_propagation(
+                self.A(speed),
+                B,
+                F,
+                t,
+                X0=ic,
+                outputs=np.arange(self.ndof) if dofs is None else dofs,
+                num_modes=kwargs.get("num_modes"),
+            )
+            return t[::decimation], yout[::decimation], []
+
         else:
             lti = self._lti(speed)
-            return signal.lsim(lti, F, t, X0=ic)
+            t_, yout, xout = signal.lsim(lti, F, t, X0=ic)
+            if dofs is not None:
+                yout = yout[:, dofs]
+            return t_[::decimation], yout[::decimation], xout[::decimation]
 
     def plot_rotor(self, nodes=1, check_sld=False, length_units="m", **kwargs):
         """Plot a rotor object.
@@ -2503,7 +3827,19 @@ class Rotor(object):
         return fig
 
     @check_units
-    def run_campbell(self, speed_range, frequencies=6, frequency_type="wd"):
+    def run_campbell(
+        self,
+        speed_range,
+        frequencies=6,
+        frequency_type="wd",
+        mode_tracking=False,
+        executor=None,
+        n_jobs=None,
+        adaptive=False,
+        tol=0.01,
+        harmonics=(1,),
+        max_points=None,
+    ):
         """Calculate the Campbell diagram.
 
         This function will calculate the damped natural frequencies
@@ -2523,6 +3859,36 @@ class Rotor(object):
             Choose between displaying results related to the undamped natural
             frequencies ("wn") or damped natural frequencies ("wd").
             The default is "wd".
+        mode_tracking : bool, optional
+            If True, the modes are tracked along the speed range by the correlation
+            (MAC) of their mode shapes with the ones at the previous speed, instead
+            of being sorted by frequency at each speed. Each column of the results
+            then follows the same mode across crossings, and the eigenvectors of
+            the tracked modes are used to start the solver at the next speed.
+            Default is False.
+        executor : str, concurrent.futures.Executor, optional
+            Executor used to run the modal analysis of each speed in parallel.
+            It can be "process", "thread" or an executor object (see Rotor._map()).
+            If mode_tracking is True, the modes are tracked after all speeds are
+            solved. Default is None (serial execution).
+        n_jobs : int, optional
+            Number of workers used by the executor.
+            Default is None (number of processors in the machine).
+        adaptive : bool, optional
+            If True, speed_range is used as a coarse grid and speeds are inserted
+            where the frequencies or log dec deviate from a linear variation by
+            more than tol, where the whirl direction changes and where the
+            frequencies cross the harmonic excitation lines.
+            Default is False.
+        tol : float, optional
+            Relative tolerance used by the adaptive refinement. Intervals shorter
+            than tol times the speed range are not refined. Default is 0.01.
+        harmonics : list, optional
+            Harmonics of the rotor speed (NX lines) whose intersections with the
+            frequencies are refined when adaptive=True. Default is (1,).
+        max_points : int, optional
+            Maximum number of speeds when adaptive=True.
+            Default is None (no limit).
 
         Returns
         -------
@@ -2542,34 +3908,137 @@ class Rotor(object):
         Diagram with damped natural frequencies
         >>> camp = rotor1.run_campbell(speed)
 
+        Diagram with tracked modes
+        >>> camp = rotor1.run_campbell(speed, mode_tracking=True)
+        >>> camp.mac.min() > 0.9
+        True
+
+        Diagram refined around crossings and 1X intersections
+        >>> camp = rotor1.run_campbell(speed, adaptive=True, mode_tracking=True)
+        >>> len(camp.speed_range) > len(speed)
+        True
+
         Plotting Campbell Diagram
         >>> fig = camp.plot()
         """
         # store in results [speeds(x axis), frequencies[0] or logdec[1] or
         # whirl[2](y axis), 3]
         self._check_frequency_array(speed_range)
+        if adaptive:
+            speed_range = np.asarray(speed_range, dtype=np.float64)
 
-        results = np.zeros([len(speed_range), frequencies, 6])
+        # when tracking, two spare modes are calculated so that modes coming
+        # from above the frequency range can be matched at crossings
+        num_modes = 2 * frequencies + 4 if mode_tracking else 2 * frequencies
 
+        # modal analyses are kept between passes of the adaptive refinement
         modal_results = {}
-        for i, w in enumerate(speed_range):
-            modal = self.run_modal(speed=w, num_modes=2 * frequencies)
-            modal_results[w] = modal
-
-            if frequency_type == "wd":
-                results[i, :, 0] = modal.wd[:frequencies]
-                results[i, :, 1] = modal.log_dec[:frequencies]
-                results[i, :, 2] = modal.damping_ratio[:frequencies]
-                results[i, :, 3] = modal.whirl_values()[:frequencies]
-            else:
-                idx = modal.wn.argsort()
-                results[i, :, 0] = modal.wn[idx][:frequencies]
-                results[i, :, 1] = modal.log_dec[idx][:frequencies]
-                results[i, :, 2] = modal.damping_ratio[idx][:frequencies]
-                results[i, :, 3] = modal.whirl_values()[idx][:frequencies]
 
-            results[i, :, 4] = w
-            results[i, :, 5] = modal.wn[:frequencies]
+        while True:
+            with self._tabulated_bearings(speed_range):
+
+                results = np.zeros([len(speed_range), frequencies, 6])
+                mac = None
+                mode_index = None
+                if mode_tracking:
+                    mac = np.ones((len(speed_range), frequencies))
+                    mode_index = np.zeros((len(speed_range), frequencies), dtype=int)
+
+                # modes used to classify the whirl of the whole sweep at once
+                whirl_modes = np.zeros(
+                    (len(speed_range), self.ndof, frequencies), complex
+                )
+
+                if executor is not None:
+                    new_speeds = [w for w in speed_range if w not in modal_results]
+                    modal_list = self._map(
+                        "run_modal",
+                        [(w, num_modes) for w in new_speeds],
+                        executor,
+                        n_jobs,
+                    )
+                    modal_results.update(zip(new_speeds, modal_list))
+
+                v0 = None
+                for i, w in enumerate(speed_range):
+                    if w not in modal_results:
+                        evalues, evectors = self._eigen(w, num_modes=num_modes, v0=v0)
+                        modal_results[w] = self._modal_results(
+                            w, evalues, evectors, num_modes
+                        )
+                    modal = modal_results[w]
+
+                    if mode_tracking:
+                        # candidates are the modes with shapes available in modal results
+                        evalues = modal.evalues[: len(modal.wn)]
+                        modes = modal.evectors[: self.ndof, : len(evalues)]
+                        wn = np.absolute(evalues)
+                        damping_ratio = -np.real(evalues) / wn
+                        with warnings.catch_warnings():
+                            warnings.simplefilter("ignore")
+                            log_dec = (
+                                2
+                                * np.pi
+                                * damping_ratio
+                                / np.sqrt(1 - damping_ratio**2)
+                            )
+
+                        if frequency_type == "wd":
+                            freqs = np.imag(evalues)
+                        else:
+                            freqs = wn
+
+                        if i == 0:
+                            idx = np.argsort(freqs, kind="stable")[:frequencies]
+                        else:
+                            idx, mac[i] = self._track_modes(
+                                tracked_modes, tracked_freqs, modes, freqs
+                            )
+
+                        tracked_modes = modes[:, idx]
+                        tracked_freqs = freqs[idx]
+                        mode_index[i] = idx
+                        whirl_modes[i] = tracked_modes
+
+                        # start the next solve from the tracked eigenvectors
+                        v0 = np.real(np.sum(modal.evectors[:, idx], axis=1))
+
+                        results[i, :, 0] = freqs[idx]
+                        results[i, :, 1] = log_dec[idx]
+                        results[i, :, 2] = damping_ratio[idx]
+                        results[i, :, 4] = w
+                        results[i, :, 5] = wn[idx]
+                        continue
+
+                    if frequency_type == "wd":
+                        results[i, :, 0] = modal.wd[:frequencies]
+                        results[i, :, 1] = modal.log_dec[:frequencies]
+                        results[i, :, 2] = modal.damping_ratio[:frequencies]
+                        whirl_modes[i] = modal.modes[:, :frequencies]
+                    else:
+                        idx = modal.wn.argsort()
+                        results[i, :, 0] = modal.wn[idx][:frequencies]
+                        results[i, :, 1] = modal.log_dec[idx][:frequencies]
+                        results[i, :, 2] = modal.damping_ratio[idx][:frequencies]
+                        whirl_modes[i] = modal.modes[:, idx[:frequencies]]
+
+                    results[i, :, 4] = w
+                    results[i, :, 5] = modal.wn[:frequencies]
+
+            kappa = _modes_axes(whirl_modes, self.nodes, self.number_dof)[2]
+            results[..., 3] = ModalResults.whirl_to_cmap(_whirl_direction(kappa))
+
+            if not adaptive:
+                break
+
+            new_speeds = self._campbell_refinement(speed_range, results, tol, harmonics)
+            if max_points is not None:
+                new_speeds = new_speeds[: max(max_points - len(speed_range), 0)]
+            if len(new_speeds) == 0:
+                break
+            speed_range = np.union1d(speed_range, new_speeds)
+
+        modal_results = {w: modal_results[w] for w in speed_range}
 
         results = CampbellResults(
             speed_range=speed_range,
@@ -2580,10 +4049,123 @@ class Rotor(object):
             modal_results=modal_results,
             number_dof=self.number_dof,
             run_modal=lambda w: self.run_modal(speed=w, num_modes=2 * frequencies),
+            mac=mac,
+            mode_index=mode_index,
         )
 
         return results
 
+    @staticmethod
+    def _track_modes(previous_modes, previous_freqs, modes, freqs):
+        """Match modes between two consecutive speeds.
+
+        Each previous mode is assigned to a different current mode by solving a
+        linear assignment problem. The cost of each pair is (1 - MAC) plus the
+        relative change in frequency, which is used to distinguish modes with
+        similar shapes (e.g. forward and backward modes at low speeds).
+
+        Parameters
+        ----------
+        previous_modes : array
+            Mode shapes (columns) tracked at the previous speed.
+        previous_freqs : array
+            Frequencies of the modes tracked at the previous speed.
+        modes : array
+            Mode shapes (columns) calculated at the current speed.
+        freqs : array
+            Frequencies of the modes calculated at the current speed.
+
+        Returns
+        -------
+        idx : array
+            Index of the current mode matched to each previous mode.
+        mac : array
+            Modal assurance criterion between each pair of matched modes.
+
+        Examples
+        --------
+        >>> modes = np.eye(3)
+        >>> idx, mac = Rotor._track_modes(modes[:, :2], np.array([1.0, 2.0]),
+        ...                               modes[:, ::-1], np.array([3.0, 2.0, 1.0]))
+        >>> idx
+        array([2, 1])
+        """
+        mac = np.abs(previous_modes.conj().T @ modes) ** 2 / np.outer(
+            np.sum(np.abs(previous_modes) ** 2, axis=0),
+            np.sum(np.abs(modes) ** 2, axis=0),
+        )
+        freq_change = np.abs(freqs[np.newaxis, :] - previous_freqs[:, np.newaxis]) / (
+            np.abs(previous_freqs[:, np.newaxis]) + np.finfo(float).eps
+        )
+
+        row, col = linear_sum_assignment(1 - mac + freq_change)
+
+        return col, mac[row, col]
+
+    @staticmethod
+    def _campbell_refinement(speed_range, results, tol, harmonics):
+        """Speeds to be added to a Campbell diagram.
+
+        An interval of the speed range is split in half if the frequencies or the
+        log dec at its ends deviate from a linear variation (evaluated with the
+        neighbouring speeds) by more than tol times their maximum value (at least
+        1 for the log dec), if the whirl changes between forward and backward in
+        it or if a frequency crosses one of the harmonic excitation lines in it.
+        Intervals shorter than tol times the speed range are not split.
+
+        Parameters
+        ----------
+        speed_range : array
+            Sorted array with the speeds of the diagram.
+        results : array
+            Array with the results calculated in run_campbell(), with shape
+            (speeds, frequencies, 6).
+        tol : float
+            Relative tolerance.
+        harmonics : list
+            Harmonics of the rotor speed.
+
+        Returns
+        -------
+        speeds : array
+            Midpoints of the intervals to be refined.
+
+        Examples
+        --------
+        >>> speed_range = np.linspace(0, 10, 6)
+        >>> results = np.zeros((6, 1, 6))
+        >>> results[:, 0, 0] = 5.0
+        >>> Rotor._campbell_refinement(speed_range, results, 0.01, [1])
+        array([5.])
+        """
+        refine = np.zeros(len(speed_range) - 1, dtype=bool)
+        ds = np.diff(speed_range)
+
+        for q, floor in ((results[..., 0], 0.0), (results[..., 1], 1.0)):
+            if len(speed_range) < 3:
+                break
+            alpha = ((speed_range[1:-1] - speed_range[:-2]) / (ds[:-1] + ds[1:]))[
+                :, np.newaxis
+            ]
+            linear = q[:-2] + alpha * (q[2:] - q[:-2])
+            scale = np.maximum(np.max(np.abs(q), axis=0), floor)
+            deviation = np.any(np.abs(q[1:-1] - linear) > tol * scale, axis=1)
+            refine[:-1] |= deviation
+            refine[1:] |= deviation
+
+        # mixed modes are not refined, since their classification is sensitive
+        # to nearly repeated frequencies
+        whirl = results[..., 3]
+        refine |= np.any(np.abs(whirl[1:] - whirl[:-1]) == 1, axis=1)
+
+        for h in harmonics:
+            residual = results[..., 0] - h * speed_range[:, np.newaxis]
+            refine |= np.any(residual[1:] * residual[:-1] < 0, axis=1)
+
+        refine &= ds > tol * (speed_range[-1] - speed_range[0])
+
+        return speed_range[:-1][refine] + ds[refine] / 2
+
     def run_ucs(
         self,
         stiffness_range=None,
@@ -2591,6 +4173,8 @@ class Rotor(object):
         num_modes=16,
         num=20,
         synchronous=False,
+        executor=None,
+        n_jobs=None,
         **kwargs,
     ):
         """Run Undamped Critical Speeds analyzes.
@@ -2621,6 +4205,15 @@ class Rotor(object):
         synchronous : bool, optional
             If True a synchronous analysis is carried out according to :cite:`rouch1980dynamic`.
             Default is False.
+        executor : str, concurrent.futures.Executor, optional
+            Executor used to run the modal analysis of each stiffness value in
+            parallel. It can be "process", "thread" or an executor object
+            (see Rotor._map()). Default is None (serial execution), in which
+            case the rotor is assembled once and the bearing stiffness is
+            updated between the points (see _ParametricModal).
+        n_jobs : int, optional
+            Number of workers used by the executor.
+            Default is None (number of processors in the machine).
 
         Returns
         -------
@@ -2652,19 +4245,24 @@ class Rotor(object):
             if not isinstance(bearing, SealElement):
                 bearings_elements.append(bearing)
 
-        bearing_class = BearingElement6DoF if self.number_dof == 6 else BearingElement
-
-        for i, k in enumerate(stiffness_log):
-            bearings = [bearing_class(b.n, kxx=k, cxx=0) for b in bearings_elements]
-            rotor = self.__class__(self.shaft_elements, self.disk_elements, bearings)
+        rotor0, rotor1 = (self._ucs_rotor(k, bearings_elements) for k in [0, 1])
 
-            if self.number_dof == 6:
-                rotor = convert_6dof_to_4dof(rotor)
-
-            modal = rotor.run_modal(
-                speed=0, num_modes=num_modes, synchronous=synchronous
+        # the factorization of the rotor is reused for all the points of the
+        # map and for the modal analysis at the intersection points
+        parametric = _ParametricModal(rotor0, rotor1)
+        if executor is None and not synchronous:
+            wn_list = [
+                parametric.run_modal(k, num_modes).wn[::2] for k in stiffness_log
+            ]
+        else:
+            wn_list = self._map(
+                "_ucs_point",
+                [(k, bearings_elements, num_modes, synchronous) for k in stiffness_log],
+                executor,
+                n_jobs,
             )
-            rotor_wn[:, i] = modal.wn[::2]
+        for i, wn in enumerate(wn_list):
+            rotor_wn[:, i] = wn
 
         bearing0 = bearings_elements[0]
 
@@ -2703,22 +4301,7 @@ class Rotor(object):
                         intersection_points["x"].append(float(k))
                         intersection_points["y"].append(float(speed))
 
-                        # create bearing
-                        bearings = [
-                            bearing_class(b.n, kxx=k, cxx=0) for b in bearings_elements
-                        ]
-
-                        # create rotor
-                        rotor_critical = Rotor(
-                            shaft_elements=self.shaft_elements,
-                            disk_elements=self.disk_elements,
-                            bearing_elements=bearings,
-                        )
-
-                        if self.number_dof == 6:
-                            rotor_critical = convert_6dof_to_4dof(rotor_critical)
-
-                        modal_critical = rotor_critical.run_modal(speed=speed)
+                        modal_critical = parametric.run_modal(k, speed=speed)
                         critical_points_modal.append(modal_critical)
 
         results = UCSResults(
@@ -2733,6 +4316,55 @@ class Rotor(object):
 
         return results
 
+    def _ucs_rotor(self, stiffness, bearings_elements):
+        """Rotor used in the undamped critical speed map.
+
+        Parameters
+        ----------
+        stiffness : float
+            Stiffness used for all the bearings.
+        bearings_elements : list
+            Bearings that will be replaced.
+
+        Returns
+        -------
+        rotor : ross.Rotor
+            Rotor with the shaft and disk elements and the bearings replaced by
+            bearings with the given stiffness and no damping.
+        """
+        bearing_class = BearingElement6DoF if self.number_dof == 6 else BearingElement
+        bearings = [bearing_class(b.n, kxx=stiffness, cxx=0) for b in bearings_elements]
+        rotor = self.__class__(self.shaft_elements, self.disk_elements, bearings)
+
+        if self.number_dof == 6:
+            rotor = convert_6dof_to_4dof(rotor)
+
+        return rotor
+
+    def _ucs_point(self, stiffness, bearings_elements, num_modes, synchronous):
+        """Natural frequencies for one point of the undamped critical speed map.
+
+        Parameters
+        ----------
+        stiffness : float
+            Stiffness used for all the bearings.
+        bearings_elements : list
+            Bearings that will be replaced.
+        num_modes : int
+            Number of modes to be calculated.
+        synchronous : bool
+            If True a synchronous analysis is carried out.
+
+        Returns
+        -------
+        wn : array
+            Array with the forward natural frequencies.
+        """
+        rotor = self._ucs_rotor(stiffness, bearings_elements)
+        modal = rotor.run_modal(speed=0, num_modes=num_modes, synchronous=synchronous)
+
+        return modal.wn[::2]
+
     def run_level1(self, n=5, stiffness_range=None, num=5, **kwargs):
         """Plot level 1 stability analysis.
 
@@ -2800,16 +4432,20 @@ class Rotor(object):
 
         # set rotor speed to mcs
         speed = self.rated_w
-        modal = self.run_modal(speed=speed)
 
-        for i, Q in enumerate(stiffness):
+        # the rotor is assembled once and the cross-coupling is updated
+        rotors = []
+        for Q in [0, 1]:
             bearings = [copy(b) for b in self.bearing_elements]
             cross_coupling = bearings[0].__class__(n=n, kxx=0, cxx=0, kxy=Q, kyx=-Q)
             bearings.append(cross_coupling)
+            rotors.append(
+                self.__class__(self.shaft_elements, self.disk_elements, bearings)
+            )
+        parametric = _ParametricModal(*rotors, speed=speed)
 
-            rotor = self.__class__(self.shaft_elements, self.disk_elements, bearings)
-
-            modal = rotor.run_modal(speed=speed)
+        for i, Q in enumerate(stiffness):
+            modal = parametric.run_modal(Q)
             non_backward = modal.whirl_direction() != "Backward"
             log_dec[i] = modal.log_dec[non_backward][0]
 
@@ -2839,14 +4475,18 @@ class Rotor(object):
         t : array
             Time array.
         method : str, optional
-            The Newmark method can be chosen by setting `method='newmark'`.
+            The Newmark method can be chosen by setting `method='newmark'` and the
+            exact modal propagation with `method='modal'` (see Rotor.time_response()).
         **kwargs : optional
             Additional keyword arguments can be passed to define the parameters
             of the Newmark method if it is used (e.g. gamma, beta, tol, ...).
             See `ross.utils.newmark` for more details.
             Other keyword arguments can also be passed to be used in numerical
-            integration (e.g. num_modes, add_to_RHS).
+            integration (e.g. num_modes, add_to_RHS, dofs, decimation).
             See `Rotor.integrate_system` for more details.
+        probes : list, optional
+            List with rs.Probe objects. If given, only the dofs measured by
+            the probes are recorded (it replaces the `dofs` argument).
 
         Returns
         -------
@@ -2876,10 +4516,20 @@ class Rotor(object):
         >>> fig2 = response.plot_2d(node=node)
         >>> # plot orbit response - plotting 3D orbits - full rotor model:
         >>> fig3 = response.plot_3d()
+        >>> # record only the dofs measured by the probe, every 10 time steps:
+        >>> response = rotor.run_time_response(
+        ...     speed, F, t, probes=[probe1], decimation=10
+        ... )
+        >>> response.yout.shape
+        (100, 2)
         """
+        probes = kwargs.pop("probes", None)
+        if probes is not None:
+            kwargs["dofs"] = self._response_dofs(probes)
+
         t_, yout, xout = self.time_response(speed, F, t, method=method, **kwargs)
 
-        results = TimeResponseResults(self, t, yout, xout)
+        results = TimeResponseResults(self, t_, yout, xout, dofs=kwargs.get("dofs"))
 
         return results
 
@@ -2929,6 +4579,11 @@ class Rotor(object):
                     Array with the unbalance phase. The unit is rad.
                 mis_type: string
                     String containing the misalignment type choosed. The avaible types are: parallel, by default; angular; combined.
+                num_modes : int, optional
+                    Number of modes kept in the modal reduction, by default 12.
+                adaptive : bool, dict, optional
+                    Set it True to integrate with adaptive time step (see Integrator.rkck()),
+                    or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
                 print_progress : bool
                     Set it True, to print the time iterations and the total time spent.
                     False by default.
@@ -2954,6 +4609,11 @@ class Rotor(object):
                     Array with the unbalance magnitude. The unit is kg.m.
                 unbalance_phase : array
                     Array with the unbalance phase. The unit is rad.
+                num_modes : int, optional
+                    Number of modes kept in the modal reduction, by default 12.
+                adaptive : bool, dict, optional
+                    Set it True to integrate with adaptive time step (see Integrator.rkck()),
+                    or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
                 print_progress : bool
                     Set it True, to print the time iterations and the total time spent.
                     False by default.
@@ -3014,8 +4674,16 @@ class Rotor(object):
                     Array with the unbalance phase. The unit is rad.
                 torque : bool
                     Set it as True to consider the torque provided by the rubbing, by default False.
+                num_modes : int, optional
+                    Number of modes kept in the modal reduction, by default 12.
+                adaptive : bool, dict, optional
+                    Set it True to integrate with adaptive time step (see Integrator.rkck()),
+                    or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
                 print_progress : bool
                     Set it True, to print the time iterations and the total time spent, by default False.
+                contact_width : float, optional
+                    Penetration, relative to deltaRUB, over which the contact is regularized in
+                    the harmonic balance, by default 1e-3.
 
         Examples
         --------
@@ -3058,6 +4726,11 @@ class Rotor(object):
             Array with the unbalance phase. The unit is rad.
         crack_type : string
             String containing type of crack model chosed. The avaible types are: Mayes and Gasch.
+        num_modes : int, optional
+            Number of modes kept in the modal reduction, by default 12.
+        adaptive : bool, dict, optional
+            Set it True to integrate with adaptive time step (see Integrator.rkck()),
+            or give a dict with its options, e.g. {"rtol": 1e-8}. By default False.
         print_progress : bool
             Set it True, to print the time iterations and the total time spent, by default False.
 
@@ -3281,9 +4954,9 @@ class Rotor(object):
         aux_rotor = Rotor(self.shaft_elements, self.disk_elements, aux_brg)
         aux_rotor_1 = Rotor(self.shaft_elements, self.disk_elements, aux_brg_1)
 
-        aux_M = aux_rotor.M(0)
-        aux_K = aux_rotor.K(0)
-        aux1_K = aux_rotor_1.K(0)
+        aux_M = aux_rotor.M(0, sparse=True)
+        aux_K = aux_rotor.K(0, sparse=True)
+        aux1_K = aux_rotor_1.K(0, sparse=True)
         num_dof = 4
 
         if self.number_dof == 6:
@@ -3293,12 +4966,12 @@ class Rotor(object):
 
         # gravity aceleration vector
         g = -9.8065
-        gravity = np.zeros(len(aux_M))
+        gravity = np.zeros(aux_M.shape[0])
         gravity[1::num_dof] = g
         weight = aux_M @ gravity
 
         # calculates u, for [K]*(u) = (F)
-        displacement = (la.solve(aux_K, weight)).flatten()
+        displacement = (las.spsolve(aux_K.tocsc(), weight)).flatten()
         displacement_y = displacement[1::num_dof]
 
         # calculate forces
@@ -4016,8 +5689,6 @@ class CoAxialRotor(Rotor):
         Ip_dsk = np.sum([disk.Ip for disk in self.disk_elements])
         self.Ip = Ip_sh + Ip_dsk
 
-        self._v0 = None  # used to call eigs
-
         # number of dofs
         self.ndof = int(
             4 * max([el.n for el in shaft_elements])
@@ -4112,6 +5783,8 @@ class CoAxialRotor(Rotor):
                 elm.dof_global_index
             )
 
+        self._build_assembly_index()
+
         # define positions for disks
         for disk in disk_elements:
             z_pos = nodes_pos[disk.n]
@@ -4244,6 +5917,756 @@ class CoAxialRotor(Rotor):
         self.df = df
 
 
+class ReducedRotor(Rotor):
+    """Reduced order model of a rotor.
+
+    The displacements of the rotor are approximated by q = T @ q_r, where T is
+    a reduction basis calculated once, and the rotor matrices are projected as
+    T.T @ X @ T. The reduced model shares the elements of the rotor and
+    overrides the matrices and the methods based on them, so that the modal,
+    Campbell, critical speed, frequency, forced, unbalance and time responses
+    of Rotor are calculated with the reduced model, with results given in the
+    rotor degrees of freedom. The analyses that modify the bearings (undamped
+    critical speed map and level 1 stability) are run with the full rotor.
+
+    The available methods to build the basis are:
+        - "guyan": static condensation on the master dofs.
+        - "irs": improved reduced system, which adds the inertia of the slave
+          dofs to the Guyan basis.
+        - "craig-bampton": Guyan basis plus num_modes fixed interface modes
+          (master dofs fixed).
+        - "modal": num_modes undamped modes without the cross-coupled bearing
+          coefficients (see Rotor._pseudo_modal()).
+
+    Parameters
+    ----------
+    rotor : ross.Rotor
+        Rotor to be reduced.
+    dofs : list, optional
+        Master degrees of freedom. Items can be global dof indexes or
+        ross.Probe objects (see Rotor.run_freq_response()).
+        Default is all the dofs of the bearing, disk and point mass elements.
+    method : str, optional
+        Reduction method: "guyan", "irs", "craig-bampton" or "modal".
+        Default is "guyan".
+    num_modes : int, optional
+        Number of modes used by the "craig-bampton" and "modal" methods.
+        Default is 12.
+    speed : float, optional
+        Speed at which the bearing coefficients are evaluated to calculate the
+        basis. Default is 0.
+
+    Attributes
+    ----------
+    basis : array
+        Reduction basis with shape (rotor.ndof, reduced_ndof).
+    master_dofs : array
+        Master degrees of freedom.
+    reduced_ndof : int
+        Number of degrees of freedom of the reduced model.
+
+    Examples
+    --------
+    >>> rotor = rotor_example()
+    >>> reduced = ReducedRotor(rotor, method="irs")
+    >>> reduced.reduced_ndof
+    12
+    >>> modal = reduced.run_modal(speed=0)
+    >>> np.round(modal.wn[:4], 1)
+    array([ 91.8,  96.3, 274.6, 296.5])
+    >>> response = reduced.run_unbalance_response(
+    ...     node=3, unbalance_magnitude=0.001, unbalance_phase=0.0,
+    ...     frequency=[0, 100, 200]
+    ... )
+    >>> response.forced_resp.shape
+    (28, 3)
+    """
+
+    def __init__(self, rotor, dofs=None, method="guyan", num_modes=12, speed=0):
+        # the elements, the dofs and the assembly data are the ones of the rotor
+        self.__dict__.update(rotor.__dict__)
+        self.rotor = rotor
+        self.method = method.lower()
+        self.speed = speed
+        self._matrices = {}
+
+        if dofs is None:
+            elements = (
+                rotor.bearing_elements + rotor.disk_elements + rotor.point_mass_elements
+            )
+            dofs = [dof for elm in elements for dof in elm.dof_global_index.values()]
+        self.master_dofs = rotor._response_dofs(dofs)
+
+        if self.method == "modal":
+            basis = rotor._modal_basis(speed, num_modes)
+        elif self.method in ["guyan", "irs", "craig-bampton"]:
+            basis = self._condensation(num_modes)
+        else:
+            raise ValueError(
+                f"method can be 'guyan', 'irs', 'craig-bampton' or 'modal'. "
+                f"{method} is not valid"
+            )
+
+        self.basis = basis
+        self.reduced_ndof = basis.shape[1]
+
+        # dofs of the bearings with frequency dependent coefficients, which are
+        # the only part of the matrices projected for each frequency
+        index = rotor._variable_index
+        self._variable_dofs = np.unique(
+            np.concatenate([rotor._elements_dofs[i] for i in index] + [[]])
+        ).astype(int)
+
+    def _condensation(self, num_modes):
+        """Condensation basis on the master dofs.
+
+        Parameters
+        ----------
+        num_modes : int
+            Number of fixed interface modes ("craig-bampton" method).
+
+        Returns
+        -------
+        basis : array
+            Reduction basis.
+        """
+        rotor = self.rotor
+        m = self.master_dofs
+        s = np.setdiff1d(np.arange(rotor.ndof), m)
+
+        K = rotor.K(self.speed, sparse=True).tocsr()
+        Kss = K[s][:, s].tocsc()
+        lu = las.splu(Kss)
+
+        basis = np.zeros((rotor.ndof, len(m)))
+        basis[m, np.arange(len(m))] = 1
+        basis[s] = -lu.solve(K[s][:, m].toarray())
+
+        if self.method == "irs":
+            M = rotor.M(self.speed, sparse=True)
+            MT = M @ basis
+            correction = MT @ la.solve(basis.T @ MT, basis.T @ (K @ basis))
+            basis[s] += lu.solve(correction[s])
+
+        elif self.method == "craig-bampton":
+            M = rotor.M(self.speed, sparse=True).tocsr()
+            Kss = Kss.toarray()
+            _, modes = la.eigh(
+                (Kss + Kss.T) / 2,
+                M[s][:, s].toarray(),
+                subset_by_index=[0, num_modes - 1],
+            )
+            fixed_interface = np.zeros((rotor.ndof, num_modes))
+            fixed_interface[s] = modes
+            basis = np.hstack([basis, fixed_interface])
+
+        return basis
+
+    def _reduced(self, name, frequency=None, synchronous=False):
+        """Project a rotor matrix on the basis.
+
+        The part of the matrix that does not depend on the frequency is
+        projected once, and only the bearings with frequency dependent
+        coefficients (see Rotor._bearing_matrices()) are projected for each
+        frequency, with the rows of the basis of their dofs.
+
+        Parameters
+        ----------
+        name : str
+            Matrix name: "M", "K", "C", "G" or "Ksdt".
+        frequency : float, optional
+            Frequency used to evaluate the matrix.
+        synchronous : bool, optional
+            If True, the mass matrix of the synchronous analysis is projected.
+
+        Returns
+        -------
+        matrix : array
+            Reduced matrix.
+        """
+        rotor = self.rotor
+        index = [] if name in ["G", "Ksdt"] else rotor._variable_index
+        frequency = 0 if frequency is None else frequency
+        key = (name, synchronous)
+
+        if key not in self._matrices:
+            if name in ["G", "Ksdt"]:
+                matrix = getattr(rotor, name)(sparse=True)
+            elif name == "M":
+                matrix = rotor.M(0, synchronous=synchronous, sparse=True)
+            else:
+                matrix = getattr(rotor, name)(0, sparse=True)
+            if index:
+                matrix = matrix - rotor._assemble(
+                    rotor._bearing_matrices(name, 0, index), index, sparse=True
+                )
+            self._matrices[key] = self.basis.T @ (matrix @ self.basis)
+
+        if not index:
+            return self._matrices[key]
+
+        dofs = self._variable_dofs
+        bearings = rotor._assemble(
+            rotor._bearing_matrices(name, frequency, index), index, sparse=True
+        )
+        T = self.basis[dofs]
+
+        return self._matrices[key] + T.T @ (bearings[dofs][:, dofs] @ T)
+
+    def _ignoring(self, name, frequency, ignore):
+        """Project a rotor matrix without the ignored elements."""
+        if not ignore:
+            return self._reduced(name, frequency)
+
+        matrix = getattr(self.rotor, name)(frequency, ignore=ignore, sparse=True)
+
+        return self.basis.T @ (matrix @ self.basis)
+
+    @staticmethod
+    def _format(matrix, sparse):
+        """Return the reduced matrix as a scipy.sparse.csr_matrix if sparse."""
+        return csr_matrix(matrix) if sparse else matrix
+
+    def M(self, frequency=None, synchronous=False, sparse=False):
+        """Reduced mass matrix (see Rotor.M())."""
+        return self._format(self._reduced("M", frequency, synchronous), sparse)
+
+    def K(self, frequency, ignore=[], sparse=False):
+        """Reduced stiffness matrix (see Rotor.K())."""
+        return self._format(self._ignoring("K", frequency, ignore), sparse)
+
+    def C(self, frequency, ignore=[], sparse=False):
+        """Reduced damping matrix (see Rotor.C())."""
+        return self._format(self._ignoring("C", frequency, ignore), sparse)
+
+    def G(self, sparse=False):
+        """Reduced gyroscopic matrix (see Rotor.G())."""
+        return self._format(self._reduced("G"), sparse)
+
+    def Ksdt(self, sparse=False):
+        """Reduced stiffness matrix of the accelerated system (see Rotor.Ksdt())."""
+        return self._format(self._reduced("Ksdt"), sparse)
+
+    def A(self, speed=0, frequency=None, synchronous=False):
+        """Reduced state space matrix (see Rotor.A()).
+
+        Parameters
+        ----------
+        speed : float, optional
+            Rotor speed. Default is 0.
+        frequency : float, optional
+            Excitation frequency. Default is rotor speed.
+        synchronous : bool, optional
+            If True a synchronous analysis is carried out.
+            Default is False.
+
+        Returns
+        -------
+        A : array
+            State space matrix of the reduced model.
+        """
+        if frequency is None:
+            frequency = speed
+
+        n = self.reduced_ndof
+        M_lu = la.lu_factor(-self.M(frequency, synchronous=synchronous))
+        C = self.C(frequency) + self.G() * speed
+
+        # fmt: off
+        A = np.vstack(
+            [np.hstack([np.zeros((n, n)), np.eye(n)]),
+             np.hstack([la.lu_solve(M_lu, self.K(frequency)), la.lu_solve(M_lu, C)])])
+        # fmt: on
+
+        return A
+
+    def _eigen(
+        self,
+        speed,
+        num_modes=12,
+        frequency=None,
+        sorted_=True,
+        A=None,
+        sparse=True,
+        synchronous=False,
+        v0=None,
+    ):
+        """Eigenvalues and eigenvectors of the reduced model (see Rotor._eigen()).
+
+        The reduced state space matrix is small, so all its eigenvalues are
+        calculated with a dense solver, and num_modes and v0 are not used. As
+        with ARPACK, the rigid body modes are disregarded if sparse is True.
+
+        Returns
+        -------
+        evalues : array
+            Eigenvalues, sorted by Rotor._index() if sorted_ is True.
+        evectors : array
+            Eigenvectors expanded to the rotor state space, or eigenvectors of
+            A if it is given.
+        """
+        given = A is not None
+        if not given:
+            A = self.A(speed=speed, frequency=frequency, synchronous=synchronous)
+
+        evalues, evectors = super()._eigen(
+            speed, sorted_=sorted_, A=A, sparse=False, synchronous=synchronous
+        )
+
+        if sparse and not synchronous:
+            idx = np.abs(evalues) > 0.1
+            evalues, evectors = evalues[idx], evectors[:, idx]
+
+        if given:
+            return evalues, evectors
+
+        return evalues, self._expand(evectors)
+
+    def _reduced_eigen(self, speed, frequency=None):
+        """Eigenvalues and eigenvectors in the reduced state space."""
+        return self._eigen(
+            speed, frequency=frequency, A=self.A(speed, frequency), sparse=False
+        )
+
+    def _expand(self, x):
+        """Expand reduced state vectors to the rotor state space."""
+        n = self.reduced_ndof
+        return np.vstack([self.basis @ x[:n], self.basis @ x[n:]])
+
+    def transfer_matrix(
+        self,
+        speed=None,
+        frequency=None,
+        modes=None,
+        method="modal",
+        inputs=None,
+        outputs=None,
+    ):
+        """Transfer matrix of the reduced model (see Rotor.transfer_matrix()).
+
+        Parameters
+        ----------
+        speed : float, optional
+            Rotating speed. Default is rotor speed (frequency).
+        frequency : float, optional
+            Excitation frequency. Default is rotor speed.
+        modes : list, optional
+            List with modes used to calculate the matrix (method="modal").
+        method : str, optional
+            "modal" or "direct". Default is "modal".
+        inputs : array, optional
+            Rotor dofs kept in the rows of the matrix. Default is all dofs.
+        outputs : array, optional
+            Rotor dofs kept in the columns of the matrix. Default is all dofs.
+
+        Returns
+        -------
+        H : array
+            Transfer matrix with shape (len(inputs), len(outputs)).
+        """
+        if frequency is None:
+            frequency = speed
+
+        if inputs is None:
+            inputs = np.arange(self.ndof)
+        if outputs is None:
+            outputs = np.arange(self.ndof)
+
+        T_in = self.basis[inputs]
+        T_out = self.basis[outputs]
+
+        if method == "direct":
+            if modes is not None:
+                raise ValueError("modes can only be selected with method='modal'.")
+
+            Z = (
+                self.K(frequency)
+                + 1j * speed * (self.C(frequency) + self.G() * speed)
+                - speed**2 * self.M(frequency)
+            )
+            return T_in @ la.solve(Z, T_out.T)
+
+        if method != "modal":
+            raise ValueError(
+                f"method can be 'modal' or 'direct'. {method} is not valid"
+            )
+
+        n = self.reduced_ndof
+        evals, psi = self._reduced_eigen(speed, frequency)
+        psi_inv = la.inv(psi)
+
+        if modes is not None:
+            m = len(modes)
+            idx = np.zeros((2 * m), int)
+            idx[0:m] = modes
+            idx[m:] = range(2 * n)[-m:]
+            evals = evals[idx]
+            psi = psi[:, idx]
+            psi_inv = psi_inv[idx]
+
+        diag = 1 / (1j * speed - evals)
+
+        M_inv = la.solve(self.M(frequency), T_out.T)
+        psi_inv_B = psi_inv[:, n:] @ M_inv
+
+        return ((T_in @ psi[:n]) * diag) @ psi_inv_B
+
+    def time_response(self, speed, F, t, ic=None, method="default", **kwargs):
+        """Time response of the reduced model (see Rotor.time_response()).
+
+        Parameters
+        ----------
+        speed : float or array_like
+            Rotor speed. The Newmark method is used if `speed` is an array.
+        F : array
+            Force array with shape (len(t), rotor.ndof).
+        t : array
+            Time array.
+        ic : array, optional
+            Initial conditions on the rotor state vector (zero by default).
+            They are projected on the basis by least squares.
+        method : str, optional
+            The Newmark method can be chosen by setting `method='newmark'`
+            and the exact modal propagation with `method='modal'`.
+        **kwargs : optional
+            Keyword arguments passed to Rotor.integrate_system() or, for
+            the modal propagation, the number of eigenvalues kept (num_modes).
+            The recorded rotor dofs (dofs) and the output decimation
+            (decimation) can be chosen with all the methods.
+
+        Returns
+        -------
+        t : array
+            Time values for the output.
+        yout : array
+            Displacements in the rotor dofs.
+        xout : array
+            Time evolution of the rotor state vector.
+        """
+        speed_is_array = isinstance(speed, (list, tuple, np.ndarray))
+
+        if speed_is_array or method.lower() == "newmark":
+            t_, yout = self.integrate_system(speed, F, t, **kwargs)
+            return t_, yout, []
+
+        n = self.reduced_ndof
+        if ic is not None:
+            ic = np.concatenate(
+                [
+                    la.lstsq(self.basis, ic[: self.ndof])[0],
+                    la.lstsq(self.basis, ic[self.ndof :])[0],
+                ]
+            )
+
+        B = np.vstack([np.zeros((n, self.ndof)), la.solve(self.M(speed), self.basis.T)])
+
+        dofs = kwargs.get("dofs")
+        decimation = kwargs.get("decimation", 1)
+        basis = self.basis if dofs is None else self.basis[dofs]
+
+        if method.lower() == "modal":
+            yout = modal_propagation(
+                self.A(speed),
+                B,
+                F,
+                t,
+                X0=ic,
+                outputs=np.arange(n),
+                num_modes=kwargs.get("num_modes"),
+            )
+            return t[::decimation], yout[::decimation] @ basis.T, []
+        C = np.hstack([basis, np.zeros((basis.shape[0], n))])
+        D = np.zeros((basis.shape[0], self.ndof))
+
+        t_, yout, xout = signal.lsim((self.A(speed), B, C, D), F, t, X0=ic)
+        yout = yout.reshape(len(t_), -1)
+
+        return (
+            t_[::decimation],
+            yout[::decimation],
+            self._expand(xout[::decimation].T).T,
+        )
+
+    def integrate_system(self, speed, F, t, **kwargs):
+        """Time integration of the reduced model (see Rotor.integrate_system()).
+
+        The rotor equations are projected on the basis of the reduced model,
+        unless another basis is given.
+        """
+        return self.rotor.integrate_system(
+            speed, F, t, **{"basis": self.basis, **kwargs}
+        )
+
+    def run_ucs(self, *args, **kwargs):
+        """Undamped critical speed map of the full rotor (see Rotor.run_ucs()).
+
+        The bearings are replaced along the map, so the basis calculated for the
+        rotor bearings is not used.
+        """
+        return self.rotor.run_ucs(*args, **kwargs)
+
+    def run_level1(self, *args, **kwargs):
+        """Level 1 stability analysis of the full rotor (see Rotor.run_level1()).
+
+        The cross-coupling is added to the bearings, so the basis calculated for
+        the rotor bearings is not used.
+        """
+        return self.rotor.run_level1(*args, **kwargs)
+
+    def clear_cache(self):
+        """Clear the cached matrices of the rotor and of the reduced model.
+
+        The basis is not calculated again (see Rotor.clear_cache()).
+        """
+        self.rotor.clear_cache()
+        self._matrices = {}
+
+    def _tabulated_bearings(self, frequency):
+        """Tabulate the bearings of the rotor (see Rotor._tabulated_bearings())."""
+        return self.rotor._tabulated_bearings(frequency)
+
+    def _clustering_points(self, *args, **kwargs):
+        """Frequencies around the critical speeds of the rotor.
+
+        See Rotor._clustering_points() for the parameters.
+        """
+        return self.rotor._clustering_points(*args, **kwargs)
+
+    def _worker_copy(self):
+        """Copy of the reduced model used by a worker (see Rotor._worker_copy())."""
+        reduced = copy(self)
+        reduced.rotor = self.rotor._worker_copy()
+        reduced._matrices = dict(self._matrices)
+
+        return reduced
+
+
+class _ParametricModal:
+    """Modal analysis of a rotor with a parameterized stiffness.
+
+    The stiffness matrix is written as K(p) = K + p * dK, where dK is the
+    contribution of the parameterized elements (e.g. bearing stiffness or
+    cross-coupling) for p = 1. Since dK only acts on a few dofs, it is a low
+    rank update of the linearized pencil (see Rotor._pencil()):
+
+        A(p) = A + p * L @ R.T
+
+    The shift-invert operator (A(p) - sigma * B)^-1 is applied with the
+    Woodbury identity and iterative refinement, so the sparse LU factorization
+    of (A - sigma * B) is calculated only once. The eigenvectors of each call
+    are used to start ARPACK in the next one.
+
+    Other speeds add the gyroscopic term to the pencil, which is small close to
+    the shift, so the same factorization is used with iterative refinement (the
+    bearing coefficients are the ones at the reference speed).
+
+    Parameters
+    ----------
+    rotor : ross.Rotor
+        Rotor with p = 0.
+    rotor_unit : ross.Rotor
+        Rotor with p = 1. It must have the same dofs as rotor.
+    speed : float, optional
+        Reference rotor speed. Default is 0.
+    sigma : float, optional
+        Shift used in the shift-invert mode. Default is 1.
+
+    Examples
+    --------
+    >>> rotor = rotor_example()
+    >>> bearings = [BearingElement(b.n, kxx=0, cxx=0) for b in rotor.bearing_elements]
+    >>> rotor0 = Rotor(rotor.shaft_elements, rotor.disk_elements, bearings)
+    >>> bearings = [BearingElement(b.n, kxx=1, cxx=0) for b in rotor.bearing_elements]
+    >>> rotor1 = Rotor(rotor.shaft_elements, rotor.disk_elements, bearings)
+    >>> parametric = _ParametricModal(rotor0, rotor1)
+    >>> modal = parametric.run_modal(1e6)
+    >>> np.round(modal.wn[:2])
+    array([96., 96.])
+    >>> modal = parametric.run_modal(1e6, speed=500)
+    >>> np.round(modal.wn[:2])
+    array([95., 97.])
+    """
+
+    def __init__(self, rotor, rotor_unit, speed=0, sigma=1):
+        self.rotor = rotor
+        self.speed = speed
+        self.sigma = sigma
+        self.v0 = None
+
+        self.A, self.B = rotor._pencil(speed)
+        n = rotor.ndof
+
+        dK = (rotor_unit.K(speed, sparse=True) - rotor.K(speed, sparse=True)).tocsr()
+        dK.eliminate_zeros()
+        rows, cols = dK.nonzero()
+        dofs = np.union1d(rows, cols)
+        r = len(dofs)
+
+        # A(p) - A = [[0, 0], [-p * dK, 0]] = p * L @ R.T
+        self.L = np.zeros((2 * n, r))
+        self.L[n + dofs, np.arange(r)] = -1
+        self.R = np.zeros((2 * n, r))
+        self.R[dofs, :] = dK[dofs][:, dofs].toarray().T
+        self.dA = bmat([[None, coo_matrix((n, n))], [-dK, None]], format="csc")
+
+        # A(speed) - A = [[0, 0], [0, -(speed - self.speed) * G]]
+        G = rotor.G(sparse=True)
+        self.dG = bmat([[coo_matrix((n, n)), None], [None, -G]], format="csc")
+
+        self.lu = las.splu(self.A - sigma * self.B)
+        self.Z = self.lu.solve(self.L)
+        self.RtZ = self.R.T @ self.Z
+
+    def eigen(self, p, num_modes=12, speed=None):
+        """Calculate eigenvalues and eigenvectors for a parameter value.
+
+        Parameters
+        ----------
+        p : float
+            Parameter value.
+        num_modes : int, optional
+            Number of modes to be calculated. Default is 12.
+        speed : float, optional
+            Rotor speed. Default is the reference speed.
+
+        Returns
+        -------
+        evalues : array
+            Array with the eigenvalues sorted by Rotor._index().
+        evectors : array
+            Array with the eigenvectors of the state space matrix.
+        """
+        A = self.A + p * self.dA
+        if speed is not None and speed != self.speed:
+            A = A + (speed - self.speed) * self.dG
+        n = A.shape[0]
+        k = 2 * num_modes
+
+        if k >= n - 1:
+            evalues, evectors = la.eig(A.toarray(), self.B.toarray())
+        else:
+            S = la.lu_factor(np.eye(self.L.shape[1]) + p * self.RtZ)
+
+            OP = (A - self.sigma * self.B).tocsc()
+            # factorization of OP, only calculated if the refinement fails
+            OP_lu = None
+
+            def woodbury(x):
+                y = self.lu.solve(x)
+                return y - self.Z @ la.lu_solve(S, p * (self.R.T @ y))
+
+            def solve(x):
+                nonlocal OP_lu
+                if OP_lu is not None:
+                    return OP_lu.solve(x)
+
+                # iterative refinement recovers the accuracy lost in the update
+                # when p is large and accounts for the change of speed
+                y = woodbury(x)
+                for _ in range(10):
+                    residual = x - OP @ y
+                    if la.norm(residual) <= 1e-12 * la.norm(x):
+                        return y
+                    y = y + woodbury(residual)
+
+                OP_lu = las.splu(OP)
+                return OP_lu.solve(x)
+
+            OPinv = las.LinearOperator((n, n), matvec=solve, dtype=A.dtype)
+            evalues, evectors = las.eigs(
+                A,
+                k=k,
+                M=self.B,
+                sigma=self.sigma,
+                OPinv=OPinv,
+                ncv=min(2 * k, n),
+                which="LM",
+                v0=self.v0,
+            )
+            self.v0 = np.real(sum(evectors.T))
+
+        # Disregard rigid body modes:
+        idx = np.where(np.abs(evalues) > 0.1)[0]
+        evalues = evalues[idx]
+        evectors = evectors[:, idx]
+
+        idx = self.rotor._index(evalues)
+
+        return evalues[idx], evectors[:, idx]
+
+    def run_modal(self, p, num_modes=12, speed=None):
+        """Run modal analysis for a parameter value (see Rotor.run_modal()).
+
+        Parameters
+        ----------
+        p : float
+            Parameter value.
+        num_modes : int, optional
+            Number of modes to be calculated. Default is 12.
+        speed : float, optional
+            Rotor speed. Default is the reference speed.
+
+        Returns
+        -------
+        results : ross.ModalResults
+        """
+        speed = self.speed if speed is None else speed
+        evalues, evectors = self.eigen(p, num_modes, speed)
+
+        return self.rotor._modal_results(speed, evalues, evectors, num_modes)
+
+
+@lru_cache(maxsize=None)
+def _takes_frequency(element_class, name):
+    """Check if a matrix method of an element class takes the frequency."""
+    return len(inspect.signature(getattr(element_class, name)).parameters) > 1
+
+
+def _element_matrix(elm, name, frequency):
+    """Matrix of an element, evaluated at the frequency if its method takes it.
+
+    Parameters
+    ----------
+    elm : ross.Element
+        Element of the rotor.
+    name : str
+        Matrix name: "M", "K" or "C".
+    frequency : float
+        Excitation frequency.
+
+    Returns
+    -------
+    matrix : np.ndarray
+        Element matrix.
+    """
+    method = getattr(elm, name)
+    if _takes_frequency(type(elm), name):
+        return method(frequency)
+
+    return method()
+
+
+# Rotor shipped to each worker process by Rotor._map()
+_worker_rotor = None
+
+
+def _init_worker(rotor):
+    """Store the rotor in a worker process."""
+    global _worker_rotor
+    _worker_rotor = rotor
+
+
+def _call_worker(task):
+    """Call a method of the rotor stored in a worker process."""
+    method, args = task
+    return getattr(_worker_rotor, method)(*args)
+
+
+def _call_method(rotor, method, args):
+    """Call a method with a tuple of positional arguments on a copy of the rotor."""
+    return getattr(rotor._worker_copy(), method)(*args)
+
+
 def rotor_example():
     """Create a rotor as example.
 
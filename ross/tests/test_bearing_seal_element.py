@@ -528,3 +528,27 @@ def test_cylindrical_hydrodynamic():
     assert_allclose(cylindrical.attitude_angle, expected_attitude_angle, rtol=1e-5)
     assert_allclose(cylindrical.K(Q_(1500, "RPM")) / 1e6, expected_k, rtol=1e-6)
     assert_allclose(cylindrical.C(Q_(1500, "RPM")) / 1e3, expected_c, rtol=1e-6)
+
+
+def test_coefficients_at():
+    frequency = np.linspace(0, 500, 11)
+    bearing = BearingElement(
+        n=0,
+        n_link=3,
+        kxx=np.linspace(1e6, 2e6, 11),
+        kxy=np.linspace(1e5, 2e5, 11),
+        cxx=np.linspace(1e2, 2e2, 11),
+        mxx=np.linspace(1, 2, 11),
+        frequency=frequency,
+    )
+    bearing_6dof = BearingElement6DoF(
+        n=0, kxx=1e6, kyy=0.8e6, kzz=1e5, cxx=2e2, cyy=1.5e2, czz=50
+    )
+
+    freqs = np.linspace(0, 500, 7)
+    for brg in (bearing, bearing_6dof):
+        K, C, M = brg.coefficients_at(freqs)
+        for i, f in enumerate(freqs):
+            assert_allclose(K[i], brg.K(f))
+            assert_allclose(C[i], brg.C(f))
+            assert_allclose(M[i], brg.M(f))
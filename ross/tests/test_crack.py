@@ -189,3 +189,35 @@ def test_crack_mayes_kc_units(crack_mayes_units):
          1.19148647e+05]])
         # fmt: on
     )
+
+
+def test_crack_harmonic_balance():
+    crack = Crack(
+        dt=1e-4,
+        tI=0,
+        tF=1,
+        depth_ratio=0.2,
+        n_crack=18,
+        speed=Q_(1200, "RPM"),
+        unbalance_magnitude=np.array([5e-4, 0]),
+        unbalance_phase=np.array([-np.pi / 2, 0]),
+        crack_type="Gasch",
+        print_progress=False,
+    )
+    speed_range = Q_([1100, 1300], "RPM")
+    results = crack.run_harmonic_balance(rotor, speed_range, harmonics=3)
+
+    assert_allclose(results.speed_range[[0, -1]], speed_range.to("rad/s").m, rtol=1e-12)
+    assert (np.diff(results.speed_range) > 0).all()
+
+    # breathing of the crack excites the second harmonic
+    dof = 6 * 12
+    assert (results.amplitude(dof, 2) > 1e-3 * results.amplitude(dof, 1)).all()
+
+    # points along the branch are solutions at fixed speed
+    i = len(results.speed_range) // 2
+    crack.speed = results.speed_range[i]
+    single = crack.run_harmonic_balance(rotor, harmonics=3)
+    assert_allclose(
+        single.coefficients[0], results.coefficients[i], rtol=1e-4, atol=1e-10
+    )
@@ -416,3 +416,119 @@ def test_mis_rigid_forces(mis_rigid):
 
     assert_allclose(mis_rigid.forces[mis_rigid.n2 * 6 + 0, :], Fx_n2_rig, rtol=3e-2)
     assert_allclose(mis_rigid.forces[mis_rigid.n2 * 6 + 1, :], Fy_n2_rig, rtol=3e-2)
+
+
+def test_mis_flex_harmonic_balance(rotor):
+    misalignment = rs.MisalignmentFlex(
+        dt=1e-4,
+        tI=0,
+        tF=1,
+        kd=40e3,
+        ks=38e3,
+        eCOUPx=2e-4,
+        eCOUPy=2e-4,
+        misalignment_angle=5 * np.pi / 180,
+        TD=0,
+        TL=0,
+        n1=0,
+        speed=Q_(1200, "RPM"),
+        unbalance_magnitude=np.array([5e-4, 0]),
+        unbalance_phase=np.array([-np.pi / 2, 0]),
+        mis_type="parallel",
+        print_progress=False,
+    )
+    results = misalignment.run_harmonic_balance(rotor, harmonics=3)
+
+    # the misalignment forces do not depend on the response, so the steady state
+    # of the full model under the same forces is a reference for the solution
+    speed = misalignment.speed
+    t = np.arange(0, 5, 1e-3)
+    angle = speed * t
+    F = misalignment._unbalance_force(angle, speed) + misalignment._force(angle)
+    dofs = [6 * 12, 6 * 12 + 1]
+    response = rotor.run_time_response(speed, F.T, t, method="modal", dofs=dofs)
+
+    period = t >= t[-1] - 2 * np.pi / speed
+    t_hb, yout = results.time_response(num_points=200)
+    for i, dof in enumerate(dofs):
+        assert_allclose(yout[:, dof].max(), response.yout[period, i].max(), rtol=1e-2)
+        assert_allclose(yout[:, dof].min(), response.yout[period, i].min(), rtol=1e-2)
+
+
+def test_mis_rigid_harmonic_balance(rotor, mis_rigid):
+    results = mis_rigid.run_harmonic_balance(rotor, harmonics=3)
+
+    # the coupling forces depend on the response, so the steady state of the time
+    # integration is the reference
+    reference = rotor.run_misalignment(
+        coupling="rigid",
+        dt=5e-4,
+        tI=0,
+        tF=6,
+        eCOUP=mis_rigid.eCOUP,
+        TD=mis_rigid.TD,
+        TL=mis_rigid.TL,
+        n1=mis_rigid.n1,
+        speed=mis_rigid.speed,
+        unbalance_magnitude=mis_rigid.unbalance_magnitude,
+        unbalance_phase=mis_rigid.unbalance_phase,
+    )
+    t = reference.time_vector
+    period = t >= t[-1] - 2 * np.pi / reference.speed
+    _, yout = results.time_response(num_points=200)
+    for dof in [6 * 12, 6 * 12 + 1]:
+        response = reference.response[dof, period]
+        assert_allclose(yout[:, dof].max(), response.max(), rtol=1e-2)
+        assert_allclose(yout[:, dof].min(), response.min(), rtol=1e-2)
+
+
+def test_rkck_interpolate():
+    from ross.faults.integrate_solver import Integrator
+
+    # forcing tabulated on the grid, y' = cos(t) - y
+    h = 1e-3
+    table = np.cos(np.arange(0, 2 + h / 2, h))
+    func = lambda x, y, i: np.array([table[i] - y[0]])
+    integrator = Integrator(0, np.array([0.0]), 2, h, func)
+    result = integrator.rkck(rtol=1e-8, interpolate=True)
+
+    t = np.arange(0, 2 + h / 2, h)
+    exact = (np.cos(t) + np.sin(t) - np.exp(-t)) / 2
+    assert_allclose(result[0], exact, atol=1e-6)
+    # the steps span several grid intervals
+    assert integrator.accepted < len(t) / 5
+
+
+def test_mis_flex_adaptive(rotor):
+    parameters = dict(
+        tI=0,
+        tF=0.5,
+        kd=40e3,
+        ks=38e3,
+        eCOUPx=2e-4,
+        eCOUPy=2e-4,
+        misalignment_angle=5 * np.pi / 180,
+        TD=0,
+        TL=0,
+        n1=0,
+        speed=Q_(1200, "RPM"),
+        unbalance_magnitude=np.array([5e-4, 0]),
+        unbalance_phase=np.array([-np.pi / 2, 0]),
+        mis_type="parallel",
+    )
+    reference = rs.MisalignmentFlex(dt=1e-4, **parameters)
+    reference.run(rotor)
+
+    misalignment = rs.MisalignmentFlex(dt=5e-4, adaptive=True, **parameters)
+    misalignment.run(rotor)
+
+    response = reference.response[:, ::5]
+    assert misalignment.response.shape == response.shape
+    assert_allclose(misalignment.response, response, atol=5e-2 * np.abs(response).max())
+
+    misalignment = rs.MisalignmentFlex(
+        dt=5e-4, num_modes=16, adaptive={"rtol": 1e-8}, **parameters
+    )
+    misalignment.run(rotor)
+    assert misalignment.displacement.shape == (16, response.shape[1])
+    assert_allclose(misalignment.response, response, atol=5e-2 * np.abs(response).max())
@@ -179,6 +179,54 @@ def test_orbit():
     assert orb.whirl == "Backward"
 
 
+def test_lazy_mode_shapes(rotor1):
+    modal = rotor1.run_modal(0)
+
+    # shapes are only built when accessed
+    assert modal.__dict__["shapes"] is None
+    shape = modal.shapes[0]
+    assert shape.__dict__["orbits"] is None
+    assert shape.__dict__["xn"] is None
+
+    assert shape.whirl in ("Forward", "Backward", "Mixed")
+    assert len(shape.orbits) == len(rotor1.nodes)
+    assert shape.__dict__["xn"] is None
+    assert len(shape.major_axis) == len(shape.zn)
+
+    # values are cached
+    assert modal.shapes[0] is shape
+    assert shape.orbits is shape.orbits
+    assert modal.kappa_modes is modal.kappa_modes
+    assert modal.kappa_modes[0] == [
+        "blue" if k > 0 else "red" for k in modal.kappa_mode(0)
+    ]
+
+
+def test_vectorized_orbit_axes(rotor1):
+    modal = rotor1.run_modal(Q_(900, "RPM"))
+    minor, major, kappa = modal._orbit_axes
+    for mode in range(len(modal.wn)):
+        shape = modal.shapes[mode]
+        for i, orbit in enumerate(shape.orbits):
+            assert_allclose(orbit.minor_axis, minor[i, mode], atol=1e-12)
+            assert_allclose(orbit.major_axis, major[i, mode], atol=1e-12)
+            assert_allclose(orbit.kappa, kappa[i, mode], atol=1e-12)
+
+    expected = [
+        ModalResults.whirl([orbit.kappa for orbit in shape.orbits])
+        for shape in modal.shapes[: len(modal.wd)]
+    ]
+    assert list(modal.whirl_direction()) == expected
+
+    # only the first, well separated, pair of modes is checked since the
+    # whirl of nearly repeated modes depends on the eigenvector basis
+    speed_range = np.linspace(100, 300, 3)
+    campbell = rotor1.run_campbell(speed_range, frequencies=4)
+    for i, speed in enumerate(speed_range):
+        expected = rotor1.run_modal(speed).whirl_values()[:2]
+        assert_allclose(campbell.whirl_values[i, :2], expected)
+
+
 def test_orbit_calculate_amplitude():
     # create orbit with major axis at 45deg
     orb = Orbit(node=0, node_pos=0, ru_e=(2 + 1j), rv_e=(2 - 1j))
@@ -11,6 +11,7 @@ from ross.disk_element import *
 from ross.materials import Material, steel
 from ross.point_mass import *
 from ross.probe import Probe
+from ross.results import TimeResponseResults
 from ross.rotor_assembly import *
 from ross.shaft_element import *
 from ross.units import Q_
@@ -1208,6 +1209,53 @@ def test_run_critical_speed(rotor5, rotor6):
     assert_almost_equal(results6.damping_ratio, damping_ratio6, decimal=4)
 
 
+def test_run_critical_speed_campbell(rotor5, rotor6):
+    for rotor in [rotor5, rotor6]:
+        newton = rotor.run_critical_speed(num_modes=12, rtol=1e-4)
+        campbell = rotor.run_critical_speed(num_modes=12, rtol=1e-4, method="campbell")
+
+        assert_allclose(campbell._wn, newton._wn, rtol=1e-3)
+        assert_allclose(campbell._wd, newton._wd, rtol=1e-3)
+        assert_almost_equal(campbell.log_dec, newton.log_dec, decimal=4)
+        assert_almost_equal(campbell.damping_ratio, newton.damping_ratio, decimal=4)
+
+    results = rotor5.run_critical_speed(speed_range=(150, 230), method="campbell")
+    assert_allclose(results._wd, [198.93259256, 207.97165539], rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        rotor5.run_critical_speed(method="bisect")
+
+
+def test_critical_speed_sweep_missing_bracket():
+    rotor = rotor_example()
+    bearings = [
+        BearingElement(b.n, kxx=1e6, kyy=0.8e6, cxx=2e3) for b in rotor.bearing_elements
+    ]
+    rotor = Rotor(rotor.shaft_elements, rotor.disk_elements, bearings)
+    newton = rotor.run_critical_speed(num_modes=8, rtol=1e-5)
+
+    # the wd crossing of the third mode is below speed_max and the wn crossing is
+    # above it, the fourth mode has no crossing and is dropped
+    wn, wd, log_dec, damping_ratio, whirl = rotor._critical_speed_sweep(
+        8, 1e-5, 20, speed_max=282
+    )
+    assert len(wn) == len(wd) == len(log_dec) == len(damping_ratio) == 3
+    assert_allclose(wn[:2], newton._wn[:2], rtol=1e-4)
+    assert np.isnan(wn[2])
+    assert_allclose(wd, newton._wd[:3], rtol=1e-4)
+    assert_allclose(log_dec, newton.log_dec[:3], rtol=1e-3)
+    assert_allclose(damping_ratio, newton.damping_ratio[:3], rtol=1e-3)
+    assert_equal(whirl[:2], newton.whirl_direction[:2])
+
+    # in a speed range with no crossing of some modes only the crossings are kept
+    results = rotor.run_critical_speed(
+        speed_range=(0, 200), rtol=1e-5, method="campbell"
+    )
+    assert len(results._wd) == 2
+    assert_allclose(results._wd, newton._wd[:2], rtol=1e-4)
+    assert_equal(results.whirl_direction, newton.whirl_direction[:2])
+
+
 @pytest.fixture
 def coaxrotor():
     #  Co-axial rotor system with 2 shafts, 4 disks and
@@ -2453,6 +2501,180 @@ def test_ucs_rotor9(rotor9):
     assert_allclose(ucs_results.wn, exp_rotor_wn, rtol=1e-6)
 
 
+def test_parametric_modal(rotor9, monkeypatch):
+    from scipy.sparse import issparse
+    from scipy.sparse import linalg as las
+
+    from ross.rotor_assembly import _ParametricModal
+
+    bearings = rotor9.bearing_elements
+    parametric = _ParametricModal(
+        rotor9._ucs_rotor(0, bearings), rotor9._ucs_rotor(1, bearings)
+    )
+    assert issparse(parametric.dA)
+    assert_allclose(parametric.dA.toarray(), parametric.L @ parametric.R.T)
+    for k in np.logspace(6, 11, 4):
+        modal = parametric.run_modal(k, num_modes=16)
+        expected = rotor9._ucs_rotor(k, bearings).run_modal(speed=0, num_modes=16)
+        assert_allclose(modal.wn, expected.wn, rtol=1e-8)
+
+    # other speeds reuse the factorization, as for the UCS intersection points
+    for k, speed in [(1e7, 300), (1e9, 600)]:
+        modal = parametric.run_modal(k, num_modes=16, speed=speed)
+        expected = rotor9._ucs_rotor(k, bearings).run_modal(speed, num_modes=16)
+        assert_allclose(modal.wn, expected.wn, rtol=1e-8)
+        assert modal.speed == speed
+
+    # when the refinement does not converge, the operator is factorized once
+    # for the whole eigenvalue solution
+    expected = rotor9._ucs_rotor(1e11, bearings).run_modal(5000, num_modes=16)
+    factorizations = []
+    splu = las.splu
+    monkeypatch.setattr(
+        las, "splu", lambda A: factorizations.append(A.shape) or splu(A)
+    )
+    modal = parametric.run_modal(1e11, num_modes=16, speed=5000)
+    assert_allclose(modal.wn, expected.wn, rtol=1e-8)
+    assert len(factorizations) == 1
+
+    # cross-coupling at rated speed as used in run_level1
+    rotor = rotor_example()
+    rotors = [
+        Rotor(
+            rotor.shaft_elements,
+            rotor.disk_elements,
+            rotor.bearing_elements + [BearingElement(3, kxx=0, cxx=0, kxy=Q, kyx=-Q)],
+        )
+        for Q in [0, 1, 5e5]
+    ]
+    modal = _ParametricModal(rotors[0], rotors[1], speed=500).run_modal(5e5)
+    expected = rotors[2].run_modal(speed=500)
+    assert_allclose(modal.wd, expected.wd, rtol=1e-8)
+    assert_allclose(modal.log_dec, expected.log_dec, rtol=1e-6, atol=1e-8)
+
+
+def test_reduced_rotor():
+    rotor = rotor_example()
+    modal = rotor.run_modal(speed=100)
+
+    for method, rtol in [("guyan", 2e-2), ("irs", 1e-4), ("craig-bampton", 1e-4)]:
+        reduced = ReducedRotor(rotor, method=method, num_modes=8)
+        reduced_modal = reduced.run_modal(speed=100)
+        assert_allclose(reduced_modal.wn, modal.wn, rtol=rtol)
+        assert reduced_modal.evectors.shape[0] == 2 * rotor.ndof
+
+    reduced = ReducedRotor(rotor, method="modal", num_modes=8)
+    assert reduced.reduced_ndof == 8
+    assert_allclose(reduced.run_modal(speed=100).wn[:4], modal.wn[:4], rtol=1e-3)
+
+    # master dofs from probes
+    reduced = ReducedRotor(rotor, dofs=[Probe(3, 0), 0, 1], method="irs")
+    assert_equal(reduced.master_dofs, [0, 1, 12, 13])
+
+    reduced = ReducedRotor(rotor, method="craig-bampton", num_modes=8)
+    speed_range = np.linspace(0, 1000, 21)
+    response = rotor.run_freq_response(speed_range, inputs=[13], outputs=[13])
+    for method in ["modal", "direct"]:
+        reduced_response = reduced.run_freq_response(
+            speed_range, inputs=[13], outputs=[13], method=method
+        )
+        assert_allclose(
+            reduced_response.freq_resp,
+            response.freq_resp,
+            rtol=1e-2,
+            atol=1e-3 * np.abs(response.freq_resp).max(),
+        )
+
+    unbalance = rotor.run_unbalance_response(3, 0.001, 0, speed_range)
+    reduced_unbalance = reduced.run_unbalance_response(3, 0.001, 0, speed_range)
+    assert reduced_unbalance.forced_resp.shape == unbalance.forced_resp.shape
+    assert_allclose(
+        reduced_unbalance.forced_resp,
+        unbalance.forced_resp,
+        atol=0.05 * np.abs(unbalance.forced_resp).max(),
+    )
+
+    t = np.linspace(0, 1, 1000)
+    F = np.zeros((len(t), rotor.ndof))
+    F[:, 12] = 10 * np.cos(50 * t)
+    _, yout, xout = rotor.time_response(100, F, t)
+    _, reduced_yout, reduced_xout = reduced.time_response(100, F, t)
+    assert reduced_xout.shape == xout.shape
+    assert_allclose(reduced_yout, yout, atol=0.05 * np.abs(yout).max())
+
+    results = reduced.run_time_response(100, F, t)
+    assert isinstance(results, TimeResponseResults)
+    assert isinstance(reduced, Rotor)
+
+    # with frequency dependent bearings, only the constant part is cached
+    bearing = BearingElement(
+        0, kxx=[1e6, 2e6], cxx=[0, 1e3], frequency=[0, 1000], tag="variable"
+    )
+    rotor = Rotor(
+        rotor.shaft_elements,
+        rotor.disk_elements,
+        [bearing, rotor.bearing_elements[1]],
+    )
+    reduced = ReducedRotor(rotor, method="craig-bampton", num_modes=8)
+    T = reduced.basis
+    for frequency in [0, 300, 500]:
+        K = T.T @ rotor.K(frequency) @ T
+        assert_allclose(reduced.K(frequency), K, atol=1e-9 * np.abs(K).max())
+        assert_allclose(reduced.C(frequency), T.T @ rotor.C(frequency) @ T, atol=1e-9)
+    M = T.T @ rotor.M() @ T
+    assert_allclose(reduced.M(), M, atol=1e-9 * np.abs(M).max())
+    assert set(reduced._matrices) == {("K", False), ("C", False), ("M", False)}
+
+    with pytest.raises(ValueError):
+        ReducedRotor(rotor, method="qr")
+
+
+def test_reduced_rotor_inherited_analyses():
+    rotor = rotor_example()
+    rotor.rated_w = 0
+    reduced = ReducedRotor(rotor, method="craig-bampton", num_modes=8)
+
+    speed_range = np.linspace(0, 400, 5)
+    for mode_tracking in [False, True]:
+        campbell = rotor.run_campbell(speed_range, mode_tracking=mode_tracking)
+        reduced_campbell = reduced.run_campbell(
+            speed_range, mode_tracking=mode_tracking
+        )
+        assert_allclose(reduced_campbell.wd[:, :4], campbell.wd[:, :4], rtol=1e-5)
+
+    critical = rotor.run_critical_speed()
+    assert_allclose(reduced.run_critical_speed()._wn[:4], critical._wn[:4], rtol=1e-5)
+
+    for kwargs in [dict(sparse=False), dict(synchronous=True)]:
+        modal = rotor.run_modal(100, **kwargs)
+        assert_allclose(
+            reduced.run_modal(100, **kwargs).wn[:2], modal.wn[:2], rtol=1e-5
+        )
+
+    # the bearings are replaced, so these analyses use the full rotor
+    ucs = rotor.run_ucs(num=5)
+    assert_allclose(reduced.run_ucs(num=5).wn, ucs.wn)
+    level1 = rotor.run_level1(n=0, stiffness_range=(1e6, 1e11))
+    assert_allclose(
+        reduced.run_level1(n=0, stiffness_range=(1e6, 1e11)).log_dec,
+        level1.log_dec,
+        atol=1e-10,
+    )
+
+    t = np.linspace(0, 1, 1000)
+    F = np.zeros((len(t), rotor.ndof))
+    F[:, 12] = 10 * np.cos(50 * t)
+    _, yout = rotor.integrate_system(100, F, t)
+    _, reduced_yout = reduced.integrate_system(100, F, t)
+    assert_allclose(reduced_yout, yout, atol=0.05 * np.abs(yout).max())
+
+    for name in ["M", "G", "Ksdt"]:
+        assert getattr(reduced, name)(sparse=True).shape == (reduced.reduced_ndof,) * 2
+    K = reduced.K(0, ignore=rotor.bearing_elements)
+    T = reduced.basis
+    assert_allclose(K, T.T @ rotor.K(0, ignore=rotor.bearing_elements) @ T, atol=1e-6)
+
+
 def test_pickle(rotor8):
     rotor8_pickled = pickle.loads(pickle.dumps(rotor8))
     assert rotor8 == rotor8_pickled
@@ -2624,3 +2846,447 @@ def test_rotor_conical_frequencies(rotor_conical):
         ]
     )
     assert_allclose(modal.wn, expected_wn, rtol=1e-5)
+
+
+def test_sparse_matrices(rotor3, rotor_6dof, coaxrotor):
+    for rotor in (rotor3, rotor_6dof, coaxrotor):
+        assert_allclose(rotor.M(0, sparse=True).toarray(), rotor.M(0))
+        assert_allclose(rotor.K(100, sparse=True).toarray(), rotor.K(100))
+        assert_allclose(rotor.C(100, sparse=True).toarray(), rotor.C(100))
+        assert_allclose(rotor.G(sparse=True).toarray(), rotor.G())
+        assert_allclose(rotor.Ksdt(sparse=True).toarray(), rotor.Ksdt())
+
+    ignore = rotor3.bearing_elements
+    assert_allclose(
+        rotor3.K(0, ignore=ignore, sparse=True).toarray(),
+        rotor3.K(0, ignore=ignore),
+    )
+
+
+def test_integrate_system_sparse(rotor3):
+    size = 500
+    speed = 500.0
+    t = np.linspace(0, 1, size)
+    F = np.zeros((size, rotor3.ndof))
+    F[:, 4 * 3] = 10 * np.cos(2 * t)
+    F[:, 4 * 3 + 1] = 10 * np.sin(2 * t)
+
+    _, yout = rotor3.integrate_system(speed, F, t)
+    _, yout_sparse = rotor3.integrate_system(speed, F, t, sparse=True)
+
+    assert_allclose(yout_sparse, yout, rtol=1e-6, atol=1e-12)
+
+
+def test_matrix_cache(rotor3):
+    M = rotor3.M(0)
+    M[:] = 0
+    assert_allclose(rotor3.M(0), rotor3.M(0, sparse=True).toarray())
+    assert np.any(rotor3.M(0))
+
+    # bearing contributions are evaluated at each call
+    brg = rotor3.bearing_elements[0]
+    dof = rotor3._elements_dofs[rotor3.elements.index(brg)][0]
+    K_brg = rotor3.K(0)[dof, dof] - rotor3.K(0, ignore=[brg])[dof, dof]
+    assert_almost_equal(K_brg, brg.kxx[0])
+
+    # bearings with constant coefficients are part of the cached matrices
+    assert rotor3._variable_index == []
+    K = rotor3.K(0)
+    assert ("K", False) in rotor3._matrix_cache
+    assert_allclose(rotor3.K(1000), K)
+
+    # the elements changed after the rotor is built are taken into account
+    # once the cache is cleared
+    disk = rotor3.disk_elements[0]
+    dof = rotor3._elements_dofs[rotor3.elements.index(disk)][0]
+    m0 = rotor3.M(0)[dof, dof]
+    disk.m += 1
+    rotor3.clear_cache()
+    assert_almost_equal(rotor3.M(0)[dof, dof], m0 + 1)
+
+    # frequency dependent bearings are evaluated at each call, also when the
+    # constant bearings are ignored
+    bearing = BearingElement(
+        0, kxx=[1e6, 2e6], cxx=[0, 0], frequency=[0, 1000], tag="variable"
+    )
+    rotor = Rotor(
+        rotor3.shaft_elements,
+        rotor3.disk_elements,
+        [bearing, rotor3.bearing_elements[1]],
+    )
+    assert rotor._variable_index == [rotor.elements.index(bearing)]
+    dof = rotor._elements_dofs[rotor._variable_index[0]][0]
+    assert_allclose(rotor.K(500)[dof, dof] - rotor.K(0)[dof, dof], 0.5e6)
+    K = rotor.K(500, ignore=[rotor.bearing_elements[1]])
+    assert_allclose(
+        K,
+        rotor.K(500)
+        - rotor.K(500, ignore=[bearing])
+        + rotor.K(500, ignore=rotor.bearing_elements),
+    )
+
+
+def test_element_matrix_errors(rotor3):
+    # errors raised by the element matrices are not taken as a missing frequency
+    class BrokenBearing(BearingElement):
+        def C(self, frequency):
+            raise TypeError("broken bearing")
+
+    bearings = [BrokenBearing(0, kxx=1e6, cxx=0), rotor3.bearing_elements[1]]
+    rotor = Rotor(rotor3.shaft_elements, rotor3.disk_elements, bearings)
+    with pytest.raises(TypeError, match="broken bearing"):
+        rotor.C(0)
+    with pytest.raises(TypeError, match="broken bearing"):
+        rotor.C(0, ignore=bearings[1:])
+
+    bearings[0] = BrokenBearing(0, kxx=[1e6, 2e6], cxx=[0, 0], frequency=[0, 100])
+    rotor = Rotor(rotor3.shaft_elements, rotor3.disk_elements, bearings)
+    with pytest.raises(TypeError, match="broken bearing"):
+        rotor.C(50)
+
+
+def test_tabulated_bearings(rotor3):
+    frequency = np.linspace(0, 1000, 5)
+    bearing0 = BearingElement(
+        0,
+        kxx=np.linspace(1e6, 2e6, 5),
+        kxy=np.linspace(0, 1e5, 5),
+        cxx=np.linspace(1e2, 3e2, 5),
+        frequency=frequency,
+    )
+    bearing1 = BearingElement(6, n_link=7, kxx=1e6, cxx=0)
+    support = BearingElement(7, kxx=1e7, cxx=1e3)
+    rotor3 = Rotor(
+        rotor3.shaft_elements,
+        rotor3.disk_elements,
+        [bearing0, bearing1, support],
+        point_mass_elements=[PointMass(7, m=1.0)],
+    )
+
+    speed_range = np.linspace(0, 500, 11)
+    K = [rotor3.K(speed) for speed in speed_range]
+    C = [rotor3.C(speed) for speed in speed_range]
+
+    with rotor3._tabulated_bearings(speed_range):
+        for i, speed in enumerate(speed_range):
+            assert_allclose(rotor3.K(speed), K[i])
+            assert_allclose(rotor3.C(speed), C[i])
+
+        # frequencies outside the table are evaluated directly
+        assert_allclose(rotor3.K(123.0), rotor3.K(np.array(123.0)))
+
+    # the table only lives during the sweep, so later changes of the bearings
+    # are taken into account
+    rotor3.run_freq_response(speed_range=speed_range)
+    assert rotor3._bearing_table == {}
+    bearing0.kxx_interpolated = lambda f: 5e6 + 0 * f
+    K_brg = rotor3.K(speed_range[1]) - rotor3.K(speed_range[1], ignore=[bearing0])
+    assert_allclose(K_brg[0, 0], 5e6)
+
+
+def test_eigen_pencil(rotor3, rotor_6dof):
+    for rotor in (rotor3, rotor_6dof):
+        speed = 500.0
+        evalues, _ = rotor._eigen(speed)
+        evalues_dense, _ = rotor._eigen(speed, A=rotor.A(speed))
+        assert_allclose(evalues, evalues_dense, rtol=1e-6)
+
+        # eigenvectors of the pencil are eigenvectors of the state space matrix
+        evalues, evectors = rotor._eigs_pencil(speed, num_modes=6)
+        A = rotor.A(speed)
+        assert_allclose(A @ evectors, evectors * evalues, atol=1e-6 * np.linalg.norm(A))
+
+
+def test_campbell_mode_tracking():
+    rotor = rotor_example()
+    speed_range = np.linspace(0, 800, 11)
+
+    camp = rotor.run_campbell(speed_range)
+    camp_tracked = rotor.run_campbell(speed_range, mode_tracking=True)
+
+    assert camp.mac is None
+    assert camp_tracked.mac.shape == camp_tracked.wd.shape
+    assert_allclose(camp_tracked.wd[0], camp.wd[0], rtol=1e-6)
+    assert np.all(camp_tracked.mac > 0.9)
+
+    # each column is a tracked mode taken from the modal results
+    for j, w in enumerate(speed_range):
+        modal = camp_tracked.modal_results[w]
+        assert_allclose(
+            camp_tracked.wd[j], modal.wd[camp_tracked.mode_index[j]], rtol=1e-8
+        )
+
+    fig = camp_tracked.plot()
+
+    # modes swap positions when a mode crossing is tracked
+    modes = np.eye(4)
+    idx, mac = Rotor._track_modes(
+        modes[:, :2],
+        np.array([10.0, 11.0]),
+        modes[:, [1, 0, 2]],
+        np.array([10.5, 10.6, 20]),
+    )
+    assert_equal(idx, [1, 0])
+    assert_allclose(mac, [1.0, 1.0])
+
+
+def test_campbell_adaptive():
+    rotor = rotor_example()
+    speed_range = np.linspace(0, 400, 11)
+
+    camp = rotor.run_campbell(speed_range, adaptive=True, mode_tracking=True)
+    speeds = camp.speed_range
+
+    assert set(speed_range) <= set(speeds)
+    assert len(speeds) < 50
+    assert list(camp.modal_results) == list(speeds)
+    # the intervals around the 1X intersections are refined to tol * 400
+    for critical_speed in [91.8, 96.3, 271.2, 300.4]:
+        i = np.searchsorted(speeds, critical_speed)
+        assert speeds[i] - speeds[i - 1] <= 4.0
+
+    # results at the original speeds are the same as the fixed grid
+    camp_fixed = rotor.run_campbell(speed_range, mode_tracking=True)
+    idx = np.searchsorted(speeds, speed_range)
+    assert_allclose(camp.wd[idx], camp_fixed.wd, rtol=1e-6)
+
+    camp = rotor.run_campbell(speed_range, adaptive=True, max_points=15)
+    assert len(camp.speed_range) == 15
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_sweeps(executor):
+    rotor = rotor_example()
+    speed_range = np.linspace(0, 500, 7)
+
+    camp = rotor.run_campbell(speed_range)
+    camp_parallel = rotor.run_campbell(speed_range, executor=executor, n_jobs=2)
+    assert_allclose(camp_parallel.wd, camp.wd, rtol=1e-6)
+    assert_allclose(camp_parallel.log_dec, camp.log_dec, rtol=1e-4, atol=1e-8)
+
+    resp = rotor.run_freq_response(speed_range=speed_range)
+    resp_parallel = rotor.run_freq_response(
+        speed_range=speed_range, executor=executor, n_jobs=2
+    )
+    assert_allclose(resp_parallel.freq_resp, resp.freq_resp, rtol=1e-6, atol=1e-14)
+
+    ucs = rotor.run_ucs(num=5)
+    ucs_parallel = rotor.run_ucs(num=5, executor=executor, n_jobs=2)
+    assert_allclose(ucs_parallel.wn, ucs.wn, rtol=1e-6)
+
+
+def test_parallel_sweeps_spawn(monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+    from multiprocessing import get_context
+
+    import ross.rotor_assembly
+
+    # the worker processes import ross and receive the rotor by pickling
+    monkeypatch.setattr(
+        ross.rotor_assembly,
+        "ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=get_context("spawn")),
+    )
+    rotor = rotor_example()
+    speed_range = np.linspace(0, 500, 4)
+
+    camp = rotor.run_campbell(speed_range)
+    camp_parallel = rotor.run_campbell(speed_range, executor="process", n_jobs=2)
+    assert_allclose(camp_parallel.wd, camp.wd, rtol=1e-6)
+
+
+def test_thread_workers_copy_rotor():
+    rotor = rotor_example()
+    rotor.M(0)
+    cache = dict(rotor._matrix_cache)
+
+    modal = rotor._map("run_modal", [(w,) for w in [0, 100, 200]], executor="thread")
+    assert rotor._matrix_cache.keys() == cache.keys()
+    assert_allclose(modal[1].wn, rotor.run_modal(100).wn, rtol=1e-6)
+
+
+def test_custom_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    rotor = rotor_example()
+    speed_range = np.linspace(0, 500, 4)
+    camp = rotor.run_campbell(speed_range)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        camp_parallel = rotor.run_campbell(speed_range, executor=pool)
+    assert_allclose(camp_parallel.wd, camp.wd, rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        rotor.run_campbell(speed_range, executor="mpi")
+
+
+def test_freq_response_direct(rotor3, rotor_6dof):
+    # the 6 dof model has free axial and torsional motion, singular at 0 rad/s
+    speed_range = np.linspace(10, 1000, 11)
+    for rotor in (rotor3, rotor_6dof):
+        resp = rotor.run_freq_response(speed_range=speed_range)
+        resp_direct = rotor.run_freq_response(speed_range=speed_range, method="direct")
+        scale = np.abs(resp.freq_resp).max()
+        assert_allclose(
+            resp_direct.freq_resp, resp.freq_resp, rtol=1e-5, atol=1e-8 * scale
+        )
+
+    with pytest.raises(ValueError):
+        rotor3.transfer_matrix(speed=100.0, modes=[0, 1], method="direct")
+
+
+def test_freq_response_selected_dofs(rotor3):
+    speed_range = np.linspace(0, 1000, 11)
+    resp = rotor3.run_freq_response(speed_range=speed_range)
+
+    inputs = [Probe(3, 0), 20]
+    outputs = [13, 12]
+    for method in ("modal", "direct"):
+        resp_dofs = rotor3.run_freq_response(
+            speed_range=speed_range, method=method, inputs=inputs, outputs=outputs
+        )
+        assert resp_dofs.freq_resp.shape == (3, 2, 11)
+        assert_allclose(resp_dofs.inputs, [12, 13, 20])
+        assert_allclose(resp_dofs.outputs, [12, 13])
+        assert_allclose(
+            resp_dofs.freq_resp,
+            resp.freq_resp[np.ix_([12, 13, 20], [12, 13])],
+            rtol=1e-6,
+            atol=1e-14,
+        )
+
+    # velocity and acceleration are derived from the displacement response
+    assert_allclose(resp_dofs.velc_resp, 1j * speed_range * resp_dofs.freq_resp)
+    assert_allclose(resp_dofs.accl_resp, -(speed_range**2) * resp_dofs.freq_resp)
+
+    fig_dofs = resp_dofs.plot_magnitude(inp=20, out=13)
+    fig = resp.plot_magnitude(inp=20, out=13)
+    assert_allclose(fig_dofs.data[0].y, fig.data[0].y, rtol=1e-6, atol=1e-14)
+
+    with pytest.raises(ValueError):
+        resp_dofs.plot_phase(inp=0, out=13)
+
+    # link nodes only have the lateral dofs, after the shaft nodes
+    rotor_link = Rotor(
+        rotor3.shaft_elements,
+        rotor3.disk_elements,
+        [
+            BearingElement(0, n_link=7, kxx=1e6, cxx=0),
+            BearingElement(6, n_link=8, kxx=1e6, cxx=0),
+            BearingElement(7, kxx=1e7, cxx=1e3),
+            BearingElement(8, kxx=1e7, cxx=1e3),
+        ],
+        point_mass_elements=[PointMass(7, m=1.0), PointMass(8, m=1.0)],
+    )
+    support = rotor_link.bearing_elements[-1]
+    link_dofs = [support.dof_global_index["x_8"], support.dof_global_index["y_8"]]
+    assert_allclose(rotor_link._response_dofs([Probe(8, 0)]), link_dofs)
+
+    resp = rotor_link.run_freq_response(speed_range=speed_range)
+    resp_dofs = rotor_link.run_freq_response(
+        speed_range=speed_range, inputs=[Probe(8, 0)], outputs=[Probe(8, 0)]
+    )
+    assert_allclose(
+        resp_dofs.freq_resp,
+        resp.freq_resp[np.ix_(link_dofs, link_dofs)],
+        rtol=1e-6,
+        atol=1e-14,
+    )
+
+
+def test_unbalance_batch(rotor3):
+    speed_range = np.linspace(0, 1000, 21)
+    node = [[3, 4], [3, 3], [2, 4]]
+    magnitude = [[0.01, 0.02], [0.01, 0.01], [0.03, 0.01]]
+    phase = [[0.0, np.pi / 2], [0.0, np.pi], [np.pi / 4, 0.0]]
+
+    response = rotor3.run_unbalance_batch(node, magnitude, phase, speed_range)
+    assert response.shape == (3, rotor3.ndof, 21)
+
+    for i in range(3):
+        unb = rotor3.run_unbalance_response(
+            node[i], magnitude[i], phase[i], speed_range
+        )
+        scale = np.abs(unb.forced_resp).max()
+        assert_allclose(response[i], unb.forced_resp, rtol=1e-6, atol=1e-10 * scale)
+
+    probe_response = rotor3.run_unbalance_batch(
+        node, magnitude, phase, speed_range, dofs=[Probe(3, 0)]
+    )
+    assert_allclose(probe_response, response[:, 12:14])
+
+
+def test_lazy_dataframes(rotor3):
+    shaft_elm = rotor3.shaft_elements
+    bearings = [
+        BearingElement(0, kxx=1e6, cxx=0, n_link=7),
+        BearingElement(7, kxx=1e7, cxx=0),
+        BearingElement(6, kxx=1e6, cxx=0),
+    ]
+    rotor = Rotor(shaft_elm, rotor3.disk_elements, bearings, [PointMass(7, m=1.0)])
+
+    # summary DataFrames are only built when accessed
+    assert rotor._dataframes == {}
+    assert rotor.link_nodes == [7]
+    assert rotor.df_bearings["tag"].tolist() == ["Bearing 0", "Bearing 2", "Bearing 1"]
+    assert set(rotor._dataframes) == {
+        "df",
+        "df_shaft",
+        "df_disks",
+        "df_bearings",
+        "df_seals",
+        "df_point_mass",
+    }
+    assert_allclose(rotor.df_shaft["nodes_pos_l"], rotor.nodes_pos[:-1])
+    assert_allclose(
+        rotor.df.loc[rotor.df.tag == "Bearing 1", "nodes_pos_l"], rotor.nodes_pos[0]
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        Rotor(
+            shaft_elm,
+            bearing_elements=[BearingElement(7, kxx=1e7, cxx=0)],
+            point_mass_elements=[PointMass(7, m=1.0)],
+        )
+    assert "not connected to the rotor" in str(excinfo.value)
+
+
+def test_banded_solvers():
+    from ross.utils import _band_ordering, _factorize
+
+    n = 120
+    shaft = [ShaftElement(0.05, 0.0, 0.05, material=steel) for _ in range(n)]
+    disk = DiskElement.from_geometry(n // 2, steel, 0.07, 0.05, 0.28)
+    bearings = [
+        BearingElement(n=0, kxx=1e7, kxy=1e5, cxx=100, n_link=n + 1),
+        BearingElement(n=n, kxx=1e7, cxx=100, n_link=n + 2),
+        BearingElement(n=n + 1, kxx=1e8, cxx=0),
+        BearingElement(n=n + 2, kxx=1e8, cxx=0),
+    ]
+    point_masses = [PointMass(n=n + 1, m=2), PointMass(n=n + 2, m=2)]
+    rotor = Rotor(shaft, [disk], bearings, point_masses)
+
+    # the link nodes are brought back to the band by the reordering
+    M, K = rotor.M(), rotor.K(100)
+    perm, kl, ku = _band_ordering(K)
+    assert perm is not None
+    assert kl + ku + 1 < 0.1 * rotor.ndof
+
+    A = M + K * 1e-8 + rotor.C(100) * 1e-4
+    b = np.random.default_rng(0).random((rotor.ndof, 3))
+    assert_allclose(A @ _factorize(A)(b), b, atol=1e-10)
+    assert_allclose(M @ _factorize(M, symmetric=True)(K), K, atol=1e-6)
+
+    A_ref = np.vstack(
+        [
+            np.hstack([np.zeros_like(M), np.eye(rotor.ndof)]),
+            np.hstack(
+                [
+                    -np.linalg.solve(M, K),
+                    -np.linalg.solve(M, rotor.C(100) + rotor.G() * 100),
+                ]
+            ),
+        ]
+    )
+    assert_allclose(rotor.A(100), A_ref, rtol=1e-8, atol=1e-8 * np.abs(A_ref).max())
@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
@@ -276,3 +278,38 @@ def test_rub_forces(rub):
 
     assert_allclose(rub.forces_rub[rub.posRUB * 6 + 0, :], Fx_rub, rtol=3e-2)
     assert_allclose(rub.forces_rub[rub.posRUB * 6 + 1, :], Fy_rub, rtol=3e-2)
+
+
+def test_rub_harmonic_balance(rotor, rub):
+    speed_range = Q_([1000, 1400], "RPM")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        results = rub.run_harmonic_balance(rotor, speed_range, harmonics=3)
+
+    # the branch is followed across the contact onset up to the final speed
+    assert_allclose(results.speed_range[-1], speed_range.to("rad/s").m[-1])
+    dofs = [rub.posRUB * 6, rub.posRUB * 6 + 1]
+    _, yout = results.time_response(index=0, num_points=200)
+    assert np.hypot(*yout[:, dofs].T).max() < rub.deltaRUB
+    _, yout = results.time_response(num_points=200)
+    assert np.hypot(*yout[:, dofs].T).max() > rub.deltaRUB
+
+    reference = rotor.run_rubbing(
+        dt=2e-4,
+        tI=0,
+        tF=2,
+        deltaRUB=rub.deltaRUB,
+        kRUB=rub.kRUB,
+        cRUB=rub.cRUB,
+        miRUB=rub.miRUB,
+        posRUB=rub.posRUB,
+        speed=speed_range[-1],
+        unbalance_magnitude=rub.unbalance_magnitude,
+        unbalance_phase=rub.unbalance_phase,
+    )
+    t = reference.time_vector
+    period = t >= t[-1] - 2 * np.pi / reference.speed
+    for dof in dofs:
+        response = reference.response[dof, period]
+        assert_allclose(yout[:, dof].max(), response.max(), rtol=3e-2)
+        assert_allclose(yout[:, dof].min(), response.min(), rtol=3e-2)
@@ -8,6 +8,7 @@ from ross.disk_element import DiskElement6DoF
 from ross.materials import steel
 from ross.rotor_assembly import Rotor
 from ross.shaft_element import ShaftElement6DoF
+from ross.utils import newmark
 
 
 @pytest.fixture
@@ -274,3 +275,187 @@ def test_for_var_speed_2(rotor2):
 
     assert_allclose(freq, freq1, rtol=1e-3)
     assert_allclose(abs_max, abs_max1, rtol=1e-3)
+
+
+def test_factorization_reuse(rotor1, monkeypatch):
+    import ross.utils as utils
+
+    t = np.arange(0, 0.2 + 5e-4, 5e-4)
+    speed = 50.0
+    F = unbalance_force(rotor1, speed, t)
+
+    calls = []
+    factorize = utils._factorize
+
+    def counted_factorize(A):
+        calls.append(A)
+        return factorize(A)
+
+    monkeypatch.setattr(utils, "_factorize", counted_factorize)
+
+    _, yout = rotor1.integrate_system(speed, F, t)
+    assert len(calls) == 1
+
+    calls.clear()
+    _, yout_ref = rotor1.integrate_system(speed, F, t, reuse_factorization=False)
+    assert len(calls) >= len(t) - 1
+
+    assert_allclose(yout, yout_ref, rtol=1e-8, atol=1e-14)
+
+
+def test_newmark_matrices_modified_in_place():
+    # the factorization is only reused when it is requested, since the
+    # matrices are compared by identity
+    t = np.linspace(0, 1, 101)
+    M = np.eye(2)
+    C = 0.1 * np.eye(2)
+    K = np.eye(2)
+
+    def in_place(step, **state):
+        K[:] = (1 + t[step]) * np.eye(2)
+        return M, C, K, np.ones(2)
+
+    def new_objects(step, **state):
+        return M, C, (1 + t[step]) * np.eye(2), np.ones(2)
+
+    yout = newmark(in_place, t, 2)
+    yout_ref = newmark(new_objects, t, 2)
+    assert_allclose(yout, yout_ref)
+
+
+def test_modal_propagation(rotor1):
+    t = np.arange(0, 0.2 + 5e-4, 5e-4)
+    speed = 50.0
+    F = unbalance_force(rotor1, speed, t)
+
+    _, yout_ref, _ = rotor1.time_response(speed, F, t)
+    _, yout, _ = rotor1.time_response(speed, F, t, method="modal")
+
+    atol = 1e-8 * np.max(np.abs(yout_ref))
+    assert_allclose(yout, yout_ref, atol=atol)
+
+    # all the 2 * ndof eigenvalues of A reproduce the reference, while half of
+    # them only misses the static contribution of the higher modes
+    for num_modes, rtol in [(2 * rotor1.ndof, 1e-8), (rotor1.ndof, 1e-3)]:
+        _, yout_trunc, _ = rotor1.time_response(
+            speed, F, t, method="modal", num_modes=num_modes
+        )
+        assert yout_trunc.shape == yout_ref.shape
+        assert_allclose(yout_trunc, yout_ref, atol=rtol * np.max(np.abs(yout_ref)))
+
+    t_irregular = np.concatenate([t[:10], t[11:]])
+    with pytest.raises(ValueError):
+        rotor1.time_response(speed, F[: len(t_irregular)], t_irregular, method="modal")
+
+
+def test_output_selection(rotor1):
+    from ross.probe import Probe
+
+    t = np.arange(0, 0.2 + 5e-4, 5e-4)
+    speed = 50.0
+    F = unbalance_force(rotor1, speed, t)
+    dofs = [12, 13, 25]
+    decimation = 7
+
+    for kwargs in [{}, {"num_modes": 12}]:
+        _, yout_ref = rotor1.integrate_system(speed, F, t, **kwargs)
+        t_, yout = rotor1.integrate_system(
+            speed, F, t, dofs=dofs, decimation=decimation, **kwargs
+        )
+        assert_allclose(t_, t[::decimation])
+        assert_allclose(yout, yout_ref[::decimation, dofs], rtol=1e-10, atol=1e-20)
+
+    for method in ["default", "modal"]:
+        _, yout_ref, _ = rotor1.time_response(speed, F, t, method=method)
+        t_, yout, _ = rotor1.time_response(
+            speed, F, t, method=method, dofs=dofs, decimation=decimation
+        )
+        assert_allclose(t_, t[::decimation])
+        assert_allclose(yout, yout_ref[::decimation, dofs], rtol=1e-8, atol=1e-20)
+
+    probe = Probe(2, 0.5)
+    response_ref = rotor1.run_time_response(speed, F, t, method="newmark")
+    response = rotor1.run_time_response(
+        speed, F, t, method="newmark", probes=[probe], decimation=decimation
+    )
+    assert response.yout.shape == (len(t[::decimation]), 2)
+
+    df_ref = response_ref.data_time_response(probe=[probe])
+    df = response.data_time_response(probe=[probe])
+    assert_allclose(df["probe_resp[0]"], df_ref["probe_resp[0]"][::decimation])
+
+    with pytest.raises(ValueError):
+        response.plot_2d(node=4)
+
+
+def test_adaptive_step(rotor1):
+    speed = 50.0
+    dof = 18
+    clearance = 9.5e-5
+
+    def contact(step, disp_resp=None, **kwargs):
+        F = np.zeros(rotor1.ndof)
+        x, y = disp_resp[dof], disp_resp[dof + 1]
+        radius = np.hypot(x, y)
+        if radius > clearance:
+            Fn = 1e8 * (radius - clearance)
+            F[dof] -= Fn * x / radius
+            F[dof + 1] -= Fn * y / radius
+        return F
+
+    dt_ref = 1e-5
+    t_ref = np.arange(0, 0.2 + dt_ref / 2, dt_ref)
+    F_ref = unbalance_force(rotor1, speed, t_ref)
+    _, yout_ref = rotor1.integrate_system(speed, F_ref, t_ref, add_to_RHS=contact)
+
+    t = t_ref[::50]
+    F = unbalance_force(rotor1, speed, t)
+    _, yout = rotor1.integrate_system(
+        speed, F, t, add_to_RHS=contact, adaptive=True, rtol=1e-4
+    )
+
+    assert yout.shape == (len(t), rotor1.ndof)
+    assert np.max(np.abs(yout_ref[:, dof])) > clearance
+    assert_allclose(
+        yout[:, dof],
+        yout_ref[::50, dof],
+        atol=1e-2 * np.max(np.abs(yout_ref[:, dof])),
+    )
+
+    with pytest.raises(ValueError):
+        rotor1.integrate_system(speed, F, t, adaptive=True, alpha=0.5)
+
+    # steps limited to powers of 2 of the grid step, all the output times are
+    # reached at the end of the integration
+    _, yout_limits = rotor1.integrate_system(
+        speed,
+        F,
+        t,
+        add_to_RHS=contact,
+        adaptive=True,
+        rtol=1e-4,
+        min_step=4e-7,
+        max_step=1.7e-3,
+    )
+    assert np.all(yout_limits[1:, dof] != 1e-38)
+    assert_allclose(
+        yout_limits[:, dof], yout[:, dof], atol=1e-2 * np.max(np.abs(yout[:, dof]))
+    )
+
+
+def test_bearing_profile(rotor2):
+    bearings = [brg for brg in rotor2.bearing_elements if brg.frequency is not None]
+    speed = np.linspace(50, 500, 101)
+
+    coefficients = rotor2._bearing_profile(bearings, speed)
+    K, C = coefficients(30)
+    for brg, Kb, Cb in zip(bearings, K, C):
+        assert_allclose(Kb, brg.K(speed[30]))
+        assert_allclose(Cb, brg.C(speed[30]))
+
+    # interpolated on a coarser grid
+    coefficients = rotor2._bearing_profile(bearings, speed, max_points=51)
+    K, C = coefficients(31)
+    for brg, Kb, Cb in zip(bearings, K, C):
+        assert_allclose(Kb, brg.K(speed[31]), rtol=1e-3)
+        assert_allclose(Cb, brg.C(speed[31]), rtol=1e-3)
@@ -4,7 +4,19 @@ import numpy as np
 import pandas as pd
 from numpy import linalg as la
 from plotly import graph_objects as go
+from scipy.linalg import (
+    cho_solve_banded,
+    cholesky_banded,
+    get_lapack_funcs,
+    lu_factor,
+    lu_solve,
+)
+from scipy.signal import lfilter
+from scipy.sparse import csr_matrix, issparse
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from scipy.sparse import linalg as las
 from copy import deepcopy as copy
+from warnings import warn
 
 
 class DataNotFoundError(Exception):
@@ -640,8 +652,9 @@ def newmark(func, t, y_size, **options):
         time step. It should take at least one argument `(step, dt=None, y=None, ydot=None, y2dot=None)`
         and return a tuple `(M, C, K, RHS)`, where `step` is a scalar int related to the current time
         step, `dt` is the current time step in seconds, `y` is a ndarray of current state of the system,
-        `ydot` and `y2dot` are its first and second time derivatives. `M`, `C`, `K` are ndarrays with
-        `np.shape(M) = (y_size, y_size)` and `RHS` is a ndarray with `len(RHS) = y_size`.
+        `ydot` and `y2dot` are its first and second time derivatives. `M`, `C`, `K` are ndarrays (or
+        scipy.sparse matrices) with `np.shape(M) = (y_size, y_size)` and `RHS` is a ndarray with
+        `len(RHS) = y_size`.
     t : array_like
         Time array.
     y_size : int
@@ -659,12 +672,49 @@ def newmark(func, t, y_size, **options):
         Convergence tolerance for the Newton-Raphson iterations. Default is 1e-6.
     progress_interval : float, optional
         Time interval at which progress is printed. Default is to not show progress.
+    reuse_factorization : bool, optional
+        If True, the effective matrix `M + C * gamma * dt + K * beta * dt**2` is
+        factorized (LU) only when `func` returns different matrix objects or when
+        `dt` changes, and the factorization is reused otherwise. The matrices are
+        compared by identity, so it must only be used when `func` does not modify
+        the returned matrices in place (e.g. constant matrices). Default is False.
+    output : array_like, optional
+        Values of the state recorded in `yout`. It can be an array of indices of `y` or an
+        output matrix with shape `(n_out, y_size)` applied to `y`. Default is to record the
+        whole state vector.
+    decimation : int, optional
+        Only every `decimation`-th time step (i.e. `t[::decimation]`) is recorded, while the
+        integration is carried out with the time step of `t`. Default is 1.
+    adaptive : bool, optional
+        If True, the integration is carried out with an adaptive time step, which starts
+        at `t[1] - t[0]` and is halved or doubled according to the local error estimate
+        `dt**2 * |beta - 1/6| * |y2dot[n+1] - y2dot[n]|`. The response is interpolated onto
+        the time steps of `t` and `func` is evaluated at intermediate times by linear
+        interpolation of its outputs at the neighbouring steps. Note that `func` is then
+        called more than once per time step (with the predicted and the corrected state,
+        and at both neighbouring steps) and also for rejected steps, so that `step` is
+        not monotonic. The state dependent forces must only depend on the arguments of
+        `func`, and not on its previous calls. Default is False.
+    alpha : float, optional
+        Parameter of the HHT-alpha method (-1/3 <= alpha <= 0), used with
+        `adaptive=True`. The defaults of `gamma` and `beta` become `0.5 - alpha` and
+        `(1 - alpha)**2 / 4`. Negative values add numerical damping to the high
+        frequencies. Default is 0 (Newmark average acceleration).
+    rtol, atol : float, optional
+        Relative and absolute tolerances of the local error, used with `adaptive=True`.
+        The relative tolerance is applied to the largest displacement found so far.
+        Defaults are 1e-3 and 1e-12.
+    min_step, max_step : float, optional
+        Minimum and maximum time steps, used with `adaptive=True`. The time steps are
+        `t[1] - t[0]` times a power of 2, so `min_step` is rounded up and `max_step`
+        down to these values. Defaults are `(t[1] - t[0]) / 2**10` and `t[-1] - t[0]`.
 
     Returns
     -------
     yout : ndarray
-        System response. It is an array containing the state variables at each time step of `t` with
-        `np.shape(yout) = (len(t), y_size)`
+        System response. It is an array containing the state variables at each recorded time
+        step with `np.shape(yout) = (len(t[::decimation]), n_out)`, where `n_out = y_size` if
+        `output` is not given.
 
     References
     ----------
@@ -700,16 +750,39 @@ def newmark(func, t, y_size, **options):
     beta = options.get("beta", 0.25)
     tol = options.get("tol", 1e-6)
     progress_interval = options.get("progress_interval", t[-1] + 1)
+    reuse_factorization = options.get("reuse_factorization", False)
+    output = options.get("output")
+    decimation = int(options.get("decimation", 1))
+
+    if options.get("adaptive", False):
+        return _adaptive_newmark(func, t, y_size, **options)
+
+    if decimation < 1:
+        raise ValueError("decimation must be a positive integer.")
 
     n_steps = len(t)
     ny = y_size
 
+    if output is None:
+        record = lambda y: y
+        n_out = ny
+    else:
+        output = np.asarray(output)
+        if output.ndim == 2:
+            record = lambda y: output @ y
+        else:
+            record = lambda y: y[output]
+        n_out = output.shape[0]
+
     y0 = np.zeros(ny)
     ydot0 = np.zeros(ny)
     y2dot0 = np.zeros(ny)
 
-    yout = np.full((n_steps, ny), 1e-38, dtype=t.dtype)
-    yout[0, :] = y0
+    yout = np.full((len(range(0, n_steps, decimation)), n_out), 1e-38, dtype=t.dtype)
+    yout[0, :] = record(y0)
+
+    solve = None
+    factorized = (None, None, None, None)
 
     for step in range(1, n_steps):
         aux = round(t[step] / progress_interval, 9)
@@ -734,7 +807,12 @@ def newmark(func, t, y_size, **options):
                     "The Newton-Raphson algorithm is taking a long time to converge."
                 )
 
-            dy2dot = la.solve(M + C * gamma * dt + K * beta * (dt**2), res)
+            if not (reuse_factorization and _same_matrices((M, C, K, dt), factorized)):
+                A = M + C * gamma * dt + K * beta * (dt**2)
+                solve = _factorize(A)
+                factorized = (M, C, K, dt)
+
+            dy2dot = solve(res)
 
             y2dot += dy2dot
             ydot += dy2dot * gamma * dt
@@ -746,11 +824,468 @@ def newmark(func, t, y_size, **options):
         ydot0 = ydot
         y2dot0 = y2dot
 
-        yout[step, :] = y
+        if step % decimation == 0:
+            yout[step // decimation, :] = record(y)
+
+    return yout
+
+
+def _adaptive_newmark(func, t, y_size, **options):
+    """Newmark / HHT-alpha integration with adaptive time step.
+
+    See `newmark` for the parameters. The time step is halved when the local
+    error estimate is larger than the tolerance and doubled when it is much
+    smaller, and the response is interpolated (cubic Hermite) onto the time
+    steps of `t` that are recorded. The time is counted in multiples of the
+    minimum time step, so that it does not accumulate round-off.
+    """
+    alpha = options.get("alpha", 0.0)
+    gamma = options.get("gamma", 0.5 - alpha)
+    beta = options.get("beta", (1 - alpha) ** 2 / 4)
+    rtol = options.get("rtol", 1e-3)
+    atol = options.get("atol", 1e-12)
+    reuse_factorization = options.get("reuse_factorization", False)
+    output = options.get("output")
+    decimation = int(options.get("decimation", 1))
+
+    if not -1 / 3 <= alpha <= 0:
+        raise ValueError("alpha must be between -1/3 and 0.")
+    if decimation < 1:
+        raise ValueError("decimation must be a positive integer.")
+
+    t = np.asarray(t)
+    t_out = t[::decimation]
+    dt = t[1] - t[0]
+    min_step = options.get("min_step", dt / 2**10)
+    max_step = options.get("max_step", t[-1] - t[0])
+
+    # time steps dt * 2**level, with the time counted in ticks of the minimum
+    # time step dt * 2**level_min
+    level_min = int(np.ceil(np.log2(min_step / dt) - 1e-9))
+    level_max = max(int(np.floor(np.log2(max_step / dt) + 1e-9)), level_min)
+    tick = dt * 2.0**level_min
+    n_ticks = int(round((t[-1] - t[0]) / tick))
+
+    if output is None:
+        record = lambda y: y
+        n_out = y_size
+    else:
+        output = np.asarray(output)
+        if output.ndim == 2:
+            record = lambda y: output @ y
+        else:
+            record = lambda y: y[output]
+        n_out = output.shape[0]
+
+    def system(time, dt, state):
+        # the matrices and the RHS are linearly interpolated between the
+        # time steps of t, where func is defined
+        k = min(max(np.searchsorted(t, time, side="right") - 1, 0), len(t) - 2)
+        theta = (time - t[k]) / (t[k + 1] - t[k])
+        if theta <= 1e-9:
+            return func(k, dt=dt, **state)
+        if theta >= 1 - 1e-9:
+            return func(k + 1, dt=dt, **state)
+
+        args_0 = func(k, dt=dt, **state)
+        args_1 = func(k + 1, dt=dt, **state)
+
+        return tuple(
+            a if a is b else (1 - theta) * a + theta * b for a, b in zip(args_0, args_1)
+        )
+
+    y0 = np.zeros(y_size)
+    ydot0 = np.zeros(y_size)
+    state = dict(y=y0, ydot=ydot0, y2dot=np.zeros(y_size))
+    M, C, K, RHS0 = system(t[0], dt, state)
+    y2dot0 = _factorize(M)(RHS0 - C @ ydot0 - K @ y0)
+
+    yout = np.full((len(t_out), n_out), 1e-38, dtype=t.dtype)
+    yout[0, :] = record(y0)
+    i_out = 1
+
+    y_scale = 0.0
+    factorized = []
+    ticks = 0
+    level = min(max(0, level_min), level_max)
+    warned = False
+
+    while i_out < len(t_out):
+        while level > level_min and 2 ** (level - level_min) > n_ticks - ticks:
+            level -= 1
+        step_ticks = 2 ** (level - level_min)
+        time = t[0] + ticks * tick
+        dt = step_ticks * tick
+
+        # func is evaluated at the explicit prediction of the state at the
+        # end of the step, and the state dependent forces (e.g. add_to_RHS)
+        # are corrected once with the implicit solution
+        state = dict(
+            y=y0 + ydot0 * dt + y2dot0 * dt**2 / 2,
+            ydot=ydot0 + y2dot0 * dt,
+            y2dot=y2dot0,
+        )
+        M, C, K, RHS = system(time + dt, dt, state)
+
+        solve = None
+        if reuse_factorization:
+            for entry in factorized:
+                if _same_matrices((M, C, K, dt), entry[:4]):
+                    solve = entry[4]
+                    break
+        if solve is None:
+            solve = _factorize(M + (1 + alpha) * (C * gamma * dt + K * beta * dt**2))
+            # a few factorizations are kept, since the time step only
+            # changes by factors of 2
+            factorized = [(M, C, K, dt, solve)] + factorized[:3]
+
+        # predictors
+        ydot_p = ydot0 + y2dot0 * (1 - gamma) * dt
+        y_p = y0 + ydot0 * dt + y2dot0 * (0.5 - beta) * dt**2
+        res_0 = -alpha * (RHS0 - C @ ydot0 - K @ y0)
+
+        y2dot = solve((1 + alpha) * (RHS - C @ ydot_p - K @ y_p) + res_0)
+        ydot = ydot_p + y2dot * gamma * dt
+        y = y_p + y2dot * beta * dt**2
+
+        # local error estimate of the displacements (truncation error of the
+        # method and correction of the state dependent forces)
+        scale = atol + rtol * max(y_scale, np.max(np.abs(y)))
+        error = dt**2 * abs(beta - 1 / 6) * np.max(np.abs(y2dot - y2dot0)) / scale
+
+        # the step is rejected before the state dependent forces are evaluated
+        # with the corrected state
+        if error > 1 and level > level_min:
+            level -= 1
+            continue
+
+        RHS_c = system(time + dt, dt, dict(y=y, ydot=ydot, y2dot=y2dot))[3]
+        if not np.array_equal(RHS_c, RHS):
+            RHS = RHS_c
+            y_1 = y
+            y2dot = solve((1 + alpha) * (RHS - C @ ydot_p - K @ y_p) + res_0)
+            ydot = ydot_p + y2dot * gamma * dt
+            y = y_p + y2dot * beta * dt**2
+            scale = atol + rtol * max(y_scale, np.max(np.abs(y)))
+            error = error + np.max(np.abs(y - y_1)) / scale
+
+        if error > 1 and level > level_min:
+            level -= 1
+            continue
+
+        y_scale = max(y_scale, np.max(np.abs(y)))
+
+        if error > 1 and not warned:
+            warn(
+                "The local error tolerance could not be met with the minimum time "
+                "step (min_step)."
+            )
+            warned = True
+
+        # cubic Hermite interpolation onto the output times of the step
+        ticks += step_ticks
+        time_1 = t[0] + ticks * tick
+        while i_out < len(t_out) and (
+            t_out[i_out] <= time_1 + 1e-9 * dt or ticks == n_ticks
+        ):
+            s = (t_out[i_out] - time) / dt
+            h00 = 2 * s**3 - 3 * s**2 + 1
+            h10 = s**3 - 2 * s**2 + s
+            h01 = -2 * s**3 + 3 * s**2
+            h11 = s**3 - s**2
+            y_out = h00 * y0 + h10 * dt * ydot0 + h01 * y + h11 * dt * ydot
+            yout[i_out, :] = record(y_out)
+            i_out += 1
+
+        y0, ydot0, y2dot0, RHS0 = y, ydot, y2dot, RHS
+
+        if error < 1 / 16 and level < level_max:
+            level += 1
 
     return yout
 
 
+def modal_propagation(A, B, U, t, X0=None, outputs=None, num_modes=None):
+    """Exact discrete-time response of a linear time invariant system.
+
+    Response of the system x' = A @ x + B @ u, with the input u varying
+    linearly between the time samples (first order hold, as in
+    scipy.signal.lsim). The matrix A is diagonalized once and each mode is
+    propagated exactly over the time step:
+
+        z[k + 1] = exp(lambda * dt) * z[k] + c0 * u_m[k] + c1 * u_m[k + 1]
+
+    which is evaluated with a first order recursive filter, so that there is
+    no loop over the time steps in Python.
+
+    Parameters
+    ----------
+    A : ndarray
+        State matrix with shape (n, n).
+    B : ndarray, callable
+        Input matrix with shape (n, m), or a function that returns B @ u for an
+        array u with shape (m, len(t)). The function avoids forming B when it
+        is given by a solve (e.g. with the mass matrix).
+    U : ndarray
+        Input array with shape (len(t), m).
+    t : array_like
+        Time array with uniform time step.
+    X0 : array_like, optional
+        Initial state vector. Default is zero.
+    outputs : array_like, optional
+        Indexes of the state vector returned. Default is the whole state.
+    num_modes : int, optional
+        Number of eigenvalues of A with the smallest magnitudes kept in the
+        modal basis. Complex conjugate pairs are kept together. Default is
+        None (all eigenvalues).
+
+    Returns
+    -------
+    yout : ndarray
+        Array with the selected states, shape (len(t), len(outputs)).
+
+    Examples
+    --------
+    >>> A = np.array([[0.0, 1.0], [-100.0, -2.0]])
+    >>> B = np.array([[0.0], [1.0]])
+    >>> t = np.linspace(0, 10, 1001)
+    >>> U = np.ones((len(t), 1))
+    >>> yout = modal_propagation(A, B, U, t, outputs=[0])
+    >>> np.round(yout[-1], 5)
+    array([0.01])
+    """
+    t = np.asarray(t)
+    dt = t[1] - t[0]
+    if not np.allclose(np.diff(t), dt, rtol=1e-6, atol=0):
+        raise ValueError("The modal propagation requires a uniform time step.")
+
+    evalues, V = la.eig(A)
+    W = la.inv(V)
+
+    if num_modes is not None:
+        magnitude = np.abs(evalues)
+        cut = np.sort(magnitude)[min(num_modes, len(evalues)) - 1]
+        keep = magnitude <= cut * (1 + 1e-9)
+        evalues, V, W = evalues[keep], V[:, keep], W[keep]
+
+    if outputs is None:
+        outputs = np.arange(A.shape[0])
+
+    # modal inputs and initial conditions
+    if callable(B):
+        Um = W @ B(np.asarray(U).T)
+    else:
+        Um = (W @ B) @ np.asarray(U).T
+    z0 = np.zeros(len(evalues), dtype=complex) if X0 is None else W @ X0
+
+    # first order hold integrals of exp(lambda * (dt - tau)) over the time step
+    lh = evalues * dt
+    a = np.exp(lh)
+    small = np.abs(lh) < 1e-8
+    with np.errstate(divide="ignore", invalid="ignore"):
+        I0 = np.where(small, dt, (a - 1) / evalues)
+        I1 = np.where(small, dt / 2, (a - 1 - lh) / (evalues**2 * dt))
+    c1 = I1
+    c0 = I0 - I1
+
+    Z = np.empty(Um.shape, dtype=complex)
+    for i in range(len(evalues)):
+        Z[i] = lfilter(
+            [c1[i], c0[i]], [1, -a[i]], Um[i], zi=[z0[i] - c1[i] * Um[i, 0]]
+        )[0]
+
+    return np.real(V[outputs] @ Z).T
+
+
+def _bandwidth(A):
+    """Lower and upper bandwidths of a dense or sparse matrix.
+
+    Parameters
+    ----------
+    A : ndarray, scipy.sparse matrix
+        Square matrix.
+
+    Returns
+    -------
+    kl, ku : int
+        Number of nonzero diagonals below and above the main diagonal.
+
+    Examples
+    --------
+    >>> _bandwidth(np.array([[1, 2, 0], [0, 1, 2], [3, 0, 1]]))
+    (2, 1)
+    """
+    if issparse(A):
+        A = A.tocoo()
+        rows, cols = A.row[A.data != 0], A.col[A.data != 0]
+    else:
+        rows, cols = np.nonzero(A)
+
+    if len(rows) == 0:
+        return 0, 0
+
+    offset = rows - cols
+    return int(max(offset.max(), 0)), int(max(-offset.min(), 0))
+
+
+def _band_ordering(A):
+    """Ordering of the dofs that minimizes the bandwidth of a matrix.
+
+    Rotor matrices are banded in the natural node ordering, except for the
+    dofs appended at the end (e.g. link nodes of bearings and point masses),
+    which couple with nodes along the shaft. The natural ordering is compared
+    with the reverse Cuthill-McKee ordering, which brings those dofs back to
+    the band.
+
+    Parameters
+    ----------
+    A : ndarray, scipy.sparse matrix
+        Square matrix.
+
+    Returns
+    -------
+    perm : ndarray or None
+        Permutation of the dofs, or None if the natural ordering is kept.
+    kl, ku : int
+        Lower and upper bandwidths of the (permuted) matrix.
+    """
+    pattern = csr_matrix(A)
+    pattern.eliminate_zeros()
+    kl, ku = _bandwidth(pattern)
+
+    pattern = abs(pattern) + abs(pattern.T)
+    perm = reverse_cuthill_mckee(pattern.tocsr(), symmetric_mode=True)
+    kl_perm, ku_perm = _bandwidth(pattern[perm][:, perm])
+
+    if kl_perm + ku_perm < kl + ku:
+        return perm, kl_perm, ku_perm
+
+    return None, kl, ku
+
+
+def _banded_factorize(A, kl, ku, symmetric=False):
+    """Banded LU (or Cholesky) factorization of a matrix.
+
+    Parameters
+    ----------
+    A : ndarray, scipy.sparse matrix
+        Square matrix with lower and upper bandwidths kl and ku.
+    kl, ku : int
+        Lower and upper bandwidths.
+    symmetric : bool, optional
+        If True, the Cholesky factorization is tried first, falling back to LU
+        if A is not symmetric positive definite. Default is False.
+
+    Returns
+    -------
+    solve : callable
+        Function that takes the right-hand side `b` and returns the solution
+        of `A @ x = b`.
+    """
+    A = csr_matrix(A)
+    n = A.shape[0]
+
+    if symmetric and kl == ku and abs(A - A.T).max() <= 1e-12 * abs(A).max():
+        # upper form: ab[ku + i - j, j] = A[i, j] for i <= j
+        ab = np.zeros((ku + 1, n), dtype=A.dtype)
+        for k in range(ku + 1):
+            ab[ku - k, k:] = A.diagonal(k)
+        try:
+            cb = cholesky_banded(ab, lower=False)
+        except la.LinAlgError:
+            pass
+        else:
+            return lambda b: cho_solve_banded((cb, False), b)
+
+    # LAPACK storage with kl extra rows for the fill-in of the pivoting
+    ab = np.zeros((2 * kl + ku + 1, n), dtype=A.dtype)
+    for k in range(-kl, ku + 1):
+        ab[kl + ku - k, max(k, 0) : n + min(k, 0)] = A.diagonal(k)
+
+    gbtrf, gbtrs = get_lapack_funcs(("gbtrf", "gbtrs"), (ab,))
+    lu, piv, info = gbtrf(ab, kl, ku)
+    if info > 0:
+        raise la.LinAlgError("Singular matrix.")
+
+    def solve(b):
+        b = np.asarray(b)
+        x, info = gbtrs(lu, kl, ku, b.reshape(n, -1).astype(lu.dtype), piv)
+        return x.reshape(b.shape)
+
+    return solve
+
+
+def _factorize(A, symmetric=False, min_size=400, max_band=0.1):
+    """LU factorization of a dense or sparse matrix.
+
+    Dense matrices with a narrow band (after reordering the dofs, see
+    `_band_ordering`) are factorized with the LAPACK banded routines, so the
+    cost grows linearly with the matrix size.
+
+    Parameters
+    ----------
+    A : ndarray, scipy.sparse matrix
+        Square matrix.
+    symmetric : bool, optional
+        If True, the banded path uses the Cholesky factorization when A is
+        symmetric positive definite. Default is False.
+    min_size : int, optional
+        Dense matrices smaller than this are always factorized as full
+        matrices. Default is 400.
+    max_band : float, optional
+        The banded factorization is used when the number of diagonals in the
+        band is at most `max_band` times the matrix size. Default is 0.1.
+
+    Returns
+    -------
+    solve : callable
+        Function that takes the right-hand side `b` and returns the solution
+        of `A @ x = b`.
+
+    Examples
+    --------
+    >>> A = np.diag(np.full(300, 4.0)) + np.diag(np.ones(299), 1)
+    >>> b = np.ones(300)
+    >>> np.allclose(A @ _factorize(A)(b), b)
+    True
+    """
+    if issparse(A):
+        return las.splu(A.tocsc()).solve
+
+    n = A.shape[0]
+    if n >= min_size:
+        S = csr_matrix(A)
+        perm, kl, ku = _band_ordering(S)
+
+        if kl + ku + 1 <= max_band * n:
+            if perm is None:
+                return _banded_factorize(S, kl, ku, symmetric)
+
+            solve_perm = _banded_factorize(S[perm][:, perm], kl, ku, symmetric)
+            inverse = np.argsort(perm)
+            return lambda b: solve_perm(np.asarray(b)[perm])[inverse]
+
+    lu_piv = lu_factor(A)
+    return lambda b: lu_solve(lu_piv, b)
+
+
+def _same_matrices(current, factorized):
+    """Check if (M, C, K, dt) match the ones of a previous factorization.
+
+    Matrices are compared by identity, so that the check is inexpensive, and
+    the time step is compared with a relative tolerance to allow for round-off
+    in the time array.
+    """
+    *matrices, dt = current
+    *matrices_0, dt_0 = factorized
+
+    return (
+        dt_0 is not None
+        and all(a is b for a, b in zip(matrices, matrices_0))
+        and abs(dt - dt_0) <= 1e-9 * abs(dt_0)
+    )
+
+
 def assemble_C_K_matrices(elements, C0, K0, *args):
     """Assemble damping and stiffness matrices considering
     specified elements a rotor.
@@ -802,11 +1337,11 @@ def assemble_C_K_matrices(elements, C0, K0, *args):
         dofs = list(elm.dof_global_index.values())
         try:
             C0[np.ix_(dofs, dofs)] += elm.C(*args)
-        except:
+        except TypeError:
             C0[np.ix_(dofs, dofs)] += elm.C()
         try:
             K0[np.ix_(dofs, dofs)] += elm.K(*args)
-        except:
+        except TypeError:
             K0[np.ix_(dofs, dofs)] += elm.K()
 
     return C0, K0
@@ -820,7 +1355,7 @@ def remove_dofs(matrix, dofs=None):
 
     Parameters
     ----------
-    matrix: ndarray
+    matrix: ndarray, scipy.sparse matrix
         The original matrix to process.
     dofs: list
         List of indices representing dofs to be removed. Default is None, but internally it considers
@@ -828,7 +1363,7 @@ def remove_dofs(matrix, dofs=None):
 
     Returns
     -------
-    new_matrix: ndarray
+    new_matrix: ndarray, scipy.sparse.csr_matrix
         The modified matrix with the removed dofs.
 
     Examples
@@ -847,8 +1382,14 @@ def remove_dofs(matrix, dofs=None):
     >>> len(M_4dof) == n_nodes * 4
     True
     """
+    size = matrix.shape[0]
+
     if dofs is None:
-        dofs = np.arange(2, len(matrix), 3)
+        dofs = np.arange(2, size, 3)
+
+    if issparse(matrix):
+        keep = np.delete(np.arange(size), dofs)
+        return matrix.tocsr()[keep][:, keep]
 
     new_matrix = np.delete(np.delete(matrix, dofs, axis=0), dofs, axis=1)
 
@@ -892,13 +1433,13 @@ def convert_6dof_to_4dof(rotor):
     new_rotor = copy(rotor)
 
     # Modify matrix methods to get 4 dof matrices
-    new_rotor.M = lambda frequency=None, synchronous=False: remove_dofs(
-        rotor.M(frequency=frequency, synchronous=synchronous)
+    new_rotor.M = lambda frequency=None, synchronous=False, **kwargs: remove_dofs(
+        rotor.M(frequency=frequency, synchronous=synchronous, **kwargs)
     )
-    new_rotor.K = lambda frequency: remove_dofs(rotor.K(frequency))
-    new_rotor.Ksdt = lambda: remove_dofs(rotor.Ksdt())
-    new_rotor.C = lambda frequency: remove_dofs(rotor.C(frequency))
-    new_rotor.G = lambda: remove_dofs(rotor.G())
+    new_rotor.K = lambda frequency, **kwargs: remove_dofs(rotor.K(frequency, **kwargs))
+    new_rotor.Ksdt = lambda **kwargs: remove_dofs(rotor.Ksdt(**kwargs))
+    new_rotor.C = lambda frequency, **kwargs: remove_dofs(rotor.C(frequency, **kwargs))
+    new_rotor.G = lambda **kwargs: remove_dofs(rotor.G(**kwargs))
 
     # Update number of dofs
     new_rotor.number_dof = 4